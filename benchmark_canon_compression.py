@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark Canon content compression
+
+Stores a synthetic archive of repetitive artifacts (ideation / outreach
+logs, daily digests) in temporary Canons and compares, from get_stats():
+- plain text (compression=None)
+- zlib per row
+- zlib per row with a dictionary trained on the existing artifacts
+  (CanonIndex.compress_artifacts)
+plus get_artifact() latency (content decoded transparently).
+
+Usage:
+    python benchmark_canon_compression.py [num_artifacts]
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_index import CanonIndex
+
+RUNS = 200
+
+CREATORS = ["Ana Ruiz", "Ben Okafor", "Chloe Park", "Dev Patel", "Emma Stone", "Finn Walsh"]
+TOPICS = ["pricing", "retention", "newsletter growth", "creator partnerships", "onboarding"]
+
+
+def synthetic_archive(num_artifacts: int):
+    """Log-like artifacts: shared template, small varying details"""
+    rng = random.Random(7)
+    for i in range(num_artifacts):
+        kind = ("outreach_log", "ideation_log", "daily_digest")[i % 3]
+        lines = [f"# {kind.replace('_', ' ').title()} {i}", "", "## Summary",
+                 "Status: completed | Owner: wos | Workflow: n8n", ""]
+        for j in range(rng.randint(8, 20)):
+            creator = rng.choice(CREATORS)
+            topic = rng.choice(TOPICS)
+            lines += [f"### Item {j}: {creator}",
+                      f"- Topic: {topic}",
+                      f"- Next step: follow up on {topic} with {creator} next week",
+                      "- Approval: pending founder review",
+                      f"- Score: {rng.randint(1, 10)}/10", ""]
+        yield {
+            "artifact_id": f"{kind}_{i:05d}",
+            "title": f"{kind} {i}",
+            "content": "\n".join(lines),
+            "artifact_type": "log",
+            "category": "growth"
+        }
+
+
+def get_latency_ms(canon: CanonIndex, num_artifacts: int) -> float:
+    ids = [f"{('outreach_log', 'ideation_log', 'daily_digest')[i % 3]}_{i:05d}"
+           for i in range(0, num_artifacts, max(1, num_artifacts // RUNS))]
+    start = time.perf_counter()
+    for artifact_id in ids:
+        canon.get_artifact(artifact_id, log_retrieval=False)
+    return (time.perf_counter() - start) * 1000 / len(ids)
+
+
+def main():
+    num_artifacts = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+
+    print(f"🧪 Canon compression benchmark ({num_artifacts} log-like artifacts)")
+    print()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, compression, train in (("plain", None, False),
+                                          ("zlib", "zlib", False),
+                                          ("zlib + dictionary", "zlib", True)):
+            canon = CanonIndex(os.path.join(tmp, f"{label}.db"), async_retrieval_log=False,
+                               compression=compression)
+            canon.store_many(synthetic_archive(num_artifacts))
+            if train:
+                canon.compress_artifacts(train_dictionary=True)
+
+            latency = get_latency_ms(canon, num_artifacts)
+            stats = canon.get_stats()
+            results.append((label, stats["storage"], stats["content_codec"], latency))
+            canon.close()
+
+    print(f"{'storage':<20} {'content KB':>11} {'stored KB':>10} {'ratio':>6} "
+          f"{'get ms':>7} {'decode ms':>10}")
+    for label, storage, codec, latency in results:
+        print(f"{label:<20} {storage['content_bytes'] / 1024:>11.0f} "
+              f"{storage['stored_bytes'] / 1024:>10.0f} "
+              f"{storage['compression_ratio'] or 1:>5.1f}x {latency:>7.3f} "
+              f"{codec['avg_decode_ms'] or 0:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark Canon embedding storage and search
+
+Builds a synthetic Canon in a temporary directory (no OpenAI calls) and reports:
+- per-query decode time and on-disk size (legacy JSON text vs float32 BLOB)
+- top-k latency (per-row Python cosine loop vs resident VectorCache)
+
+Usage:
+    python benchmark_canon_embeddings.py [num_artifacts]
+"""
+import os
+import sys
+import json
+import time
+import sqlite3
+import tempfile
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_embeddings import CanonEmbeddings, decode_vector
+from wos.vector_cache import VectorCache
+
+DIMENSION = 1536
+
+
+def build_db(path: str, vectors: np.ndarray, as_json: bool):
+    """Populate an artifact_embeddings table in the requested format"""
+    embeddings = CanonEmbeddings(db_path=path, api_key="benchmark")
+    if as_json:
+        with embeddings.db.transaction() as conn:
+            conn.executemany("""
+                INSERT INTO artifact_embeddings
+                (embedding_id, artifact_id, embedding_vector, embedding_model, embedding_dimension)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (f"emb_art_{i}", f"art_{i}", json.dumps(vec.tolist()),
+                 embeddings.embedding_model, DIMENSION)
+                for i, vec in enumerate(vectors)
+            ])
+    else:
+        for i, vec in enumerate(vectors):
+            embeddings.store_embedding(f"art_{i}", vec.tolist())
+    with embeddings.db.exclusive() as conn:
+        conn.execute("VACUUM")
+    embeddings.close()
+
+
+def time_decode(path: str, runs: int = 3) -> float:
+    """Best-of-N time (ms) to read and decode every stored vector"""
+    conn = sqlite3.connect(path)
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        rows = conn.execute("SELECT embedding_vector FROM artifact_embeddings").fetchall()
+        for row in rows:
+            decode_vector(row[0])
+        best = min(best, (time.perf_counter() - start) * 1000)
+    conn.close()
+    return best
+
+
+def time_search(vectors: np.ndarray, limit: int = 10, runs: int = 5):
+    """Best-of-N top-k latency (ms): Python loop vs matrix-vector product"""
+    query = vectors[0] + 0.1
+
+    def cosine(vec1, vec2):
+        # Same per-row math as the pre-cache semantic_search loop
+        return np.dot(vec1 / np.linalg.norm(vec1), vec2 / np.linalg.norm(vec2))
+
+    loop_ms = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        scores = [(i, cosine(query, vec)) for i, vec in enumerate(vectors)]
+        sorted(scores, key=lambda x: x[1], reverse=True)[:limit]
+        loop_ms = min(loop_ms, (time.perf_counter() - start) * 1000)
+
+    cache = VectorCache(vectors.shape[1])
+    cache.load((f"art_{i}", vec) for i, vec in enumerate(vectors))
+    matrix_ms = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        cache.top_k(query, limit, min_similarity=0.0)
+        matrix_ms = min(matrix_ms, (time.perf_counter() - start) * 1000)
+
+    return loop_ms, matrix_ms
+
+
+def main():
+    num_artifacts = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"🧪 Canon embedding storage benchmark ({num_artifacts} x {DIMENSION}d)")
+    print()
+
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((num_artifacts, DIMENSION)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_db = os.path.join(tmp, "canon_json.db")
+        blob_db = os.path.join(tmp, "canon_blob.db")
+
+        build_db(json_db, vectors, as_json=True)
+        build_db(blob_db, vectors, as_json=False)
+
+        json_size = os.path.getsize(json_db)
+        blob_size = os.path.getsize(blob_db)
+        json_ms = time_decode(json_db)
+        blob_ms = time_decode(blob_db)
+
+        print(f"{'format':<10} {'db size':>12} {'decode all':>12} {'per vector':>12}")
+        print(f"{'json':<10} {json_size / 1024 / 1024:>9.1f} MB {json_ms:>9.1f} ms "
+              f"{json_ms * 1000 / num_artifacts:>9.1f} us")
+        print(f"{'float32':<10} {blob_size / 1024 / 1024:>9.1f} MB {blob_ms:>9.1f} ms "
+              f"{blob_ms * 1000 / num_artifacts:>9.1f} us")
+        print()
+        print(f"Size reduction:   {json_size / blob_size:.1f}x")
+        print(f"Decode speedup:   {json_ms / blob_ms:.1f}x")
+
+        # Exercise the one-shot migration on the JSON database
+        start = time.perf_counter()
+        embeddings = CanonEmbeddings(db_path=json_db, api_key="benchmark")
+        embeddings.migrate_json_vectors(vacuum=True)
+        embeddings.close()
+        migrate_ms = (time.perf_counter() - start) * 1000
+        print(f"Migration:        {migrate_ms:.0f} ms, "
+              f"{json_size / 1024 / 1024:.1f} MB → {os.path.getsize(json_db) / 1024 / 1024:.1f} MB")
+
+    loop_ms, matrix_ms = time_search(vectors)
+    print()
+    print(f"Top-10 search:    loop {loop_ms:.1f} ms, VectorCache {matrix_ms:.2f} ms "
+          f"({loop_ms / matrix_ms:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
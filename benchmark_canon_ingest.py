@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark Canon bulk ingest
+
+Imports a synthetic archive into temporary Canons (no OpenAI calls: local
+hashed embeddings) and reports rows/second for:
+- CanonTools.store() once per artifact (transaction + embedding request per row)
+- CanonTools.store_many() (one transaction, batched embeddings)
+each with and without embeddings. With a hosted provider the embedding
+side is dominated by request count, also reported.
+
+Usage:
+    python benchmark_canon_ingest.py [num_artifacts]
+"""
+import os
+import sys
+import time
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_tools import CanonTools
+
+WORDS = ("brand voice pricing growth newsletter creator launch retention roadmap "
+         "founder hiring churn onboarding playbook campaign").split()
+
+
+def synthetic_archive(num_artifacts: int):
+    """Newsletter-archive-like artifacts (a few KB each)"""
+    for i in range(num_artifacts):
+        body = " ".join(WORDS[(i * 7 + j) % len(WORDS)] for j in range(600))
+        yield {
+            "artifact_id": f"import_{i:06d}",
+            "title": f"Newsletter issue {i}",
+            "content": body,
+            "artifact_type": "newsletter",
+            "category": ("growth", "product", "operations")[i % 3],
+            "summary": body[:160],
+            "source": "benchmark",
+            "tags": ["newsletter", WORDS[i % len(WORDS)]]
+        }
+
+
+def make_tools(path: str) -> CanonTools:
+    return CanonTools(canon_db_path=path, embedding_provider="local")
+
+
+def main():
+    num_artifacts = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"🧪 Canon bulk ingest benchmark ({num_artifacts} artifacts, local embeddings)")
+    print()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for auto_embed in (False, True):
+            label = "rows + embeddings" if auto_embed else "rows only"
+
+            tools = make_tools(os.path.join(tmp, f"per_row_{auto_embed}.db"))
+            start = time.perf_counter()
+            for artifact in synthetic_archive(num_artifacts):
+                tools.store(auto_embed=auto_embed, **artifact)
+            per_row_s = time.perf_counter() - start
+            tools.embeddings.close()
+            tools.canon.close()
+
+            tools = make_tools(os.path.join(tmp, f"bulk_{auto_embed}.db"))
+            stats = tools.store_many(synthetic_archive(num_artifacts), auto_embed=auto_embed)
+            tools.embeddings.close()
+            tools.canon.close()
+
+            requests = stats["embeddings"]["requests"] if stats["embeddings"] else 0
+            results.append((label, per_row_s, stats, requests if auto_embed else 0))
+
+    print(f"{'workload':<20} {'store() rows/s':>15} {'store_many() rows/s':>20} {'speedup':>8}")
+    for label, per_row_s, stats, _ in results:
+        print(f"{label:<20} {num_artifacts / per_row_s:>15.0f} "
+              f"{stats['total_rows_per_second']:>20.0f} "
+              f"{per_row_s / stats['total_seconds']:>7.1f}x")
+    print()
+    _, _, stats, requests = results[-1]
+    print(f"store_many: {stats['stored']} stored, {stats['unchanged']} unchanged, "
+          f"{stats['failed']} failed; "
+          f"embedding requests {num_artifacts} → {requests}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark Canon read paths: bytes fetched into Python per call
+
+Builds an in-memory Canon of large artifacts and compares the previous
+SELECT * query shapes with the column-projected list/search paths and the
+LazyArtifact get. Bytes = total size of the column values SQLite hands to
+Python (counted by a row factory), which is what gets copied and allocated.
+
+Usage:
+    python benchmark_canon_reads.py [num_artifacts] [content_kb]
+"""
+import os
+import sys
+import time
+import sqlite3
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_index import CanonIndex
+
+RUNS = 20
+
+
+class FetchCounter:
+    """Row factory that tallies bytes of every fetched value"""
+
+    def __init__(self):
+        self.bytes = 0
+
+    def __call__(self, cursor, row):
+        self.bytes += sum(len(value) if isinstance(value, (str, bytes)) else 8
+                          for value in row if value is not None)
+        return sqlite3.Row(cursor, row)
+
+
+def measure(counter: FetchCounter, fn):
+    """(bytes fetched per call, best latency ms)"""
+    counter.bytes = 0
+    fn()
+    fetched = counter.bytes
+
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return fetched, best
+
+
+def main():
+    num_artifacts = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    content_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(f"🧪 Canon read benchmark ({num_artifacts} artifacts x {content_kb} KB content)")
+    print()
+
+    canon = CanonIndex(":memory:", async_retrieval_log=False)
+    filler = ("Quarterly planning notes on pricing, positioning and creator growth. " * 16)[:1024]
+    canon.store_many({
+        "artifact_id": f"art_{i:05d}",
+        "title": f"Pricing memo {i}" if i % 10 == 0 else f"Planning memo {i}",
+        "content": filler * content_kb,
+        "artifact_type": "decision",
+        "category": "growth",
+        "tags": ["pricing", "memo"],
+        "metadata": {"quarter": i % 4}
+    } for i in range(num_artifacts))
+
+    counter = FetchCounter()
+    conn = canon.conn
+    conn.row_factory = counter
+
+    # Previous query shapes (SELECT * then discard most columns)
+    def list_before():
+        return [dict(row) for row in conn.execute(
+            "SELECT * FROM artifacts ORDER BY created_at DESC LIMIT 50").fetchall()]
+
+    def like_before():
+        rows = conn.execute("""
+            SELECT * FROM artifacts
+            WHERE (LOWER(title) LIKE ? OR LOWER(summary) LIKE ?)
+            ORDER BY created_at DESC LIMIT 10
+        """, ("%pricing%", "%pricing%")).fetchall()
+        # Relevance was counted in Python over the fetched content
+        return [(dict(row)["title"] + " " + (row["summary"] or "") + " " +
+                 row["content"]).lower().count("pricing") for row in rows]
+
+    def like_after():
+        canon.fts_enabled = False
+        try:
+            return canon.search_artifacts("pricing", limit=10)
+        finally:
+            canon.fts_enabled = True
+
+    cases = [
+        ("list_artifacts(50)", list_before, lambda: canon.list_artifacts(limit=50)),
+        ("LIKE search(10)", like_before, like_after),
+        ("get_artifact", lambda: canon.get_artifact("art_00042", log_retrieval=False),
+         lambda: canon.get_artifact("art_00042", log_retrieval=False, lazy=True)),
+    ]
+
+    print(f"{'read path':<20} {'before':>12} {'after':>12} {'reduction':>10} "
+          f"{'before ms':>10} {'after ms':>9}")
+    for label, before, after in cases:
+        before_bytes, before_ms = measure(counter, before)
+        after_bytes, after_ms = measure(counter, after)
+        print(f"{label:<20} {before_bytes / 1024:>9.1f} KB {after_bytes / 1024:>9.1f} KB "
+              f"{before_bytes / max(after_bytes, 1):>9.0f}x {before_ms:>10.2f} {after_ms:>9.2f}")
+
+    # Lazy proxy: content still available on demand
+    artifact = canon.get_artifact("art_00042", log_retrieval=False, lazy=True)
+    counter.bytes = 0
+    size = len(artifact["content"])
+    print()
+    print(f"LazyArtifact: content ({size / 1024:.0f} KB) fetched on first access "
+          f"({counter.bytes / 1024:.1f} KB read), metadata={artifact['metadata']}")
+    canon.close()
+
+
+if __name__ == "__main__":
+    main()
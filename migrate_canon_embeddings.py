@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+One-shot migration: convert Canon embeddings from JSON text to float32 BLOBs
+
+Usage:
+    python migrate_canon_embeddings.py [path/to/canon.db]
+"""
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_embeddings import CanonEmbeddings
+
+db_path = sys.argv[1] if len(sys.argv) > 1 else os.getenv("WOS_CANON_DB_PATH", "canon.db")
+
+if not os.path.exists(db_path):
+    print(f"❌ Canon database not found: {db_path}")
+    exit(1)
+
+size_before = os.path.getsize(db_path)
+print(f"Migrating embeddings in {db_path} ({size_before / 1024:.1f} KB)...")
+
+# CanonEmbeddings migrates pending rows on open; VACUUM reclaims the freed pages
+embeddings = CanonEmbeddings(db_path=db_path)
+stats = embeddings.migrate_json_vectors(vacuum=True)
+embeddings.close()
+
+size_after = os.path.getsize(db_path)
+
+if stats["failed"]:
+    print(f"⚠️  {stats['failed']} embeddings could not be parsed and were left untouched")
+
+print(f"✅ Migration complete")
+print(f"   Database size: {size_before / 1024:.1f} KB → {size_after / 1024:.1f} KB")
@@ -0,0 +1,306 @@
+"""
+WOS ANN Index v0
+Approximate nearest neighbour search over the Canon VectorCache
+Pure NumPy inverted-file (IVF) index, persisted next to canon.db
+"""
+
+import os
+import logging
+import numpy as np
+from typing import List, Tuple, Optional
+
+from wos.vector_cache import VectorCache
+
+logger = logging.getLogger("wos.ann_index")
+
+class VectorIndex:
+    """
+    Base interface for pluggable vector indexes
+
+    Indexes never own vectors: they hold row references into a VectorCache,
+    so the cache stays the single source of truth for embeddings.
+    """
+
+    def __init__(self, cache: VectorCache):
+        self.cache = cache
+
+    def add(self, artifact_id: str):
+        """Index (or re-index) a row already present in the cache"""
+        raise NotImplementedError
+
+    def search(self, query_vector, limit: int, min_similarity: float = None,
+               rows: np.ndarray = None, **params) -> List[Tuple[str, float]]:
+        """Same contract as VectorCache.top_k"""
+        raise NotImplementedError
+
+    def save(self):
+        """Persist index state (no-op for in-memory indexes)"""
+        pass
+
+
+class ExactIndex(VectorIndex):
+    """Brute-force index: delegates to the cache's matrix-vector product"""
+
+    def add(self, artifact_id: str):
+        pass
+
+    def search(self, query_vector, limit: int, min_similarity: float = None,
+               rows: np.ndarray = None, **params) -> List[Tuple[str, float]]:
+        return self.cache.top_k(query_vector, limit, min_similarity, rows=rows)
+
+
+class IVFIndex(VectorIndex):
+    """
+    Inverted-file index (spherical k-means coarse quantizer)
+
+    Vectors are bucketed by nearest centroid; a query scores only the rows in
+    its `nprobe` closest buckets. Recall/latency knob: nprobe (higher = more
+    rows scanned, better recall). Below `min_train_size` vectors the index
+    stays untrained and searches fall through to exact scoring.
+
+    New vectors are assigned to existing centroids incrementally; the
+    quantizer is retrained once the cache outgrows the training set
+    `retrain_factor` times. A cache that is already large enough when the
+    index is built (no saved index, or a stale one) is trained right away.
+    """
+
+    def __init__(self, cache: VectorCache, path: str = None, nlist: int = None,
+                 nprobe: int = 8, min_train_size: int = 1024,
+                 retrain_factor: float = 4.0, save_every: int = 100):
+        super().__init__(cache)
+        self.path = path
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self.retrain_factor = retrain_factor
+        self.save_every = save_every
+
+        self.centroids: Optional[np.ndarray] = None
+        self.trained_size = 0
+        self._assignments = np.full(max(len(cache), 1), -1, dtype=np.int32)
+        self._lists: List[List[int]] = []
+        self._list_arrays: dict = {}
+        self._dirty = 0
+
+        if path and os.path.exists(path):
+            self._load()
+        if self._needs_training():
+            self.train()
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def _needs_training(self) -> bool:
+        """Untrained or outgrown quantizer, and enough vectors to train on"""
+        if len(self.cache) < self.min_train_size:
+            return False
+        return not self.is_trained or len(self.cache) > self.trained_size * self.retrain_factor
+
+    def train(self, iterations: int = 10, seed: int = 0):
+        """Fit centroids on (a sample of) the cache and rebuild all lists"""
+        n = len(self.cache)
+        if n < self.min_train_size:
+            logger.info(f"IVF training skipped: {n} < {self.min_train_size} vectors")
+            return
+
+        nlist = self.nlist or max(8, int(np.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        sample_size = min(n, nlist * 64)
+        sample = self.cache.matrix[rng.choice(n, sample_size, replace=False)]
+
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assign = self._nearest(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            norms = np.linalg.norm(sums, axis=1)
+            empty = norms == 0
+            # Reseed empty buckets from random sample rows
+            sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+            norms[empty] = 1.0
+            centroids = (sums / norms[:, None]).astype(np.float32)
+
+        self.centroids = centroids
+        self.trained_size = n
+        self._rebuild_lists()
+        logger.info(f"IVF index trained: {n} vectors, nlist={nlist}")
+        self.save()
+
+    def add(self, artifact_id: str):
+        row = self.cache.row_of(artifact_id)
+        if row is None:
+            return
+
+        if self._needs_training():
+            self.train()
+            return
+        if not self.is_trained:
+            return
+
+        self._grow_assignments()
+        old = self._assignments[row]
+        if old >= 0:
+            self._lists[old].remove(row)
+            self._list_arrays.pop(old, None)
+
+        bucket = int(self._nearest(self.cache.matrix[row:row + 1], self.centroids)[0])
+        self._assignments[row] = bucket
+        self._lists[bucket].append(row)
+        self._list_arrays.pop(bucket, None)
+
+        self._dirty += 1
+        if self._dirty >= self.save_every:
+            self.save()
+
+    def search(self, query_vector, limit: int, min_similarity: float = None,
+               rows: np.ndarray = None, nprobe: int = None,
+               **params) -> List[Tuple[str, float]]:
+        if not self.is_trained:
+            return self.cache.top_k(query_vector, limit, min_similarity, rows=rows)
+
+        query = VectorCache.normalize(query_vector)
+        if query is None or limit <= 0:
+            return []
+
+        nprobe = min(nprobe or self.nprobe, len(self._lists))
+        centroid_scores = self.centroids @ query
+        probes = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+
+        candidates = np.concatenate([self._list_array(int(p)) for p in probes])
+        if rows is not None:
+            allowed = np.zeros(len(self.cache), dtype=bool)
+            allowed[rows] = True
+            candidates = candidates[allowed[candidates]]
+        if candidates.size == 0:
+            return []
+
+        scores = self.cache.matrix[candidates] @ query
+        if min_similarity is not None:
+            keep = scores >= min_similarity
+            candidates, scores = candidates[keep], scores[keep]
+
+        if candidates.size > limit:
+            part = np.argpartition(-scores, limit - 1)[:limit]
+            candidates, scores = candidates[part], scores[part]
+        order = np.argsort(-scores, kind="stable")
+
+        ids = self.cache.ids
+        return [(ids[candidates[i]], float(scores[i])) for i in order]
+
+    def save(self):
+        """Write centroids + per-artifact bucket assignments to disk"""
+        self._dirty = 0
+        if not self.path or not self.is_trained:
+            return
+
+        ids = self.cache.ids
+        assigned = [(ids[row], self._assignments[row])
+                    for row in range(min(len(ids), len(self._assignments)))
+                    if self._assignments[row] >= 0]
+
+        tmp_path = self.path + ".tmp.npz"
+        np.savez(
+            tmp_path,
+            centroids=self.centroids,
+            trained_size=np.array(self.trained_size),
+            ids=np.array([artifact_id for artifact_id, _ in assigned], dtype=str),
+            buckets=np.array([bucket for _, bucket in assigned], dtype=np.int32)
+        )
+        os.replace(tmp_path, self.path)
+        logger.info(f"IVF index saved: {self.path}")
+
+    def _load(self):
+        """Restore centroids and assignments; rows unknown to the file are re-assigned"""
+        try:
+            with np.load(self.path) as data:
+                centroids = data["centroids"]
+                if centroids.shape[1] != self.cache.dimension:
+                    logger.warning(f"IVF index dimension mismatch, ignoring {self.path}")
+                    return
+                self.centroids = centroids.astype(np.float32)
+                self.trained_size = int(data["trained_size"])
+                saved = dict(zip(data["ids"].tolist(), data["buckets"].tolist()))
+        except Exception as e:
+            logger.warning(f"Failed to load IVF index {self.path}: {e}")
+            return
+
+        self._grow_assignments()
+        self._assignments[:] = -1
+        missing = []
+        for row, artifact_id in enumerate(self.cache.ids):
+            bucket = saved.get(artifact_id)
+            if bucket is None:
+                missing.append(row)
+            else:
+                self._assignments[row] = bucket
+        if missing:
+            self._assignments[missing] = self._nearest(self.cache.matrix[missing], self.centroids)
+        self._rebuild_lists(reassign=False)
+        logger.info(f"IVF index loaded: {self.path} ({len(missing)} rows re-assigned)")
+
+    def _rebuild_lists(self, reassign: bool = True):
+        """Recompute (optionally) every row's bucket and the inverted lists"""
+        n = len(self.cache)
+        self._grow_assignments()
+        if reassign:
+            self._assignments[:n] = self._nearest(self.cache.matrix, self.centroids)
+        self._lists = [[] for _ in range(len(self.centroids))]
+        for row, bucket in enumerate(self._assignments[:n].tolist()):
+            if bucket >= 0:
+                self._lists[bucket].append(row)
+        self._list_arrays = {}
+
+    def _list_array(self, bucket: int) -> np.ndarray:
+        array = self._list_arrays.get(bucket)
+        if array is None:
+            array = np.array(self._lists[bucket], dtype=np.int64)
+            self._list_arrays[bucket] = array
+        return array
+
+    def _grow_assignments(self):
+        n = len(self.cache)
+        if n > len(self._assignments):
+            grown = np.full(max(n, len(self._assignments) * 2), -1, dtype=np.int32)
+            grown[:len(self._assignments)] = self._assignments
+            self._assignments = grown
+
+    @staticmethod
+    def _nearest(vectors: np.ndarray, centroids: np.ndarray,
+                 batch_size: int = 4096) -> np.ndarray:
+        """Index of the most similar centroid for each row (batched)"""
+        out = np.empty(vectors.shape[0], dtype=np.int32)
+        for start in range(0, vectors.shape[0], batch_size):
+            block = vectors[start:start + batch_size] @ centroids.T
+            out[start:start + batch_size] = np.argmax(block, axis=1)
+        return out
+
+
+# Index registry - maps CanonEmbeddings(ann_index=...) names to classes
+ANN_INDEXES = {
+    "exact": ExactIndex,
+    "ivf": IVFIndex,
+}
+
+
+def create_ann_index(kind: str, cache: VectorCache, db_path: str = None,
+                     **options) -> VectorIndex:
+    """
+    Build an ANN index over a VectorCache
+
+    Args:
+        kind: Registered index name ("ivf", "exact")
+        cache: VectorCache to index
+        db_path: Canon database path; persistent indexes store
+                 "<db_path>.<kind>.npz" next to it
+        **options: Index-specific knobs (nprobe, nlist, min_train_size, ...)
+    """
+    if kind not in ANN_INDEXES:
+        raise ValueError(f"Unknown ANN index: {kind}")
+
+    index_class = ANN_INDEXES[kind]
+    if index_class is ExactIndex:
+        return index_class(cache)
+
+    path = f"{db_path}.{kind}.npz" if db_path and db_path != ":memory:" else None
+    return index_class(cache, path=path, **options)
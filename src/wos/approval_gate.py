@@ -4,6 +4,7 @@ Human-in-the-loop approval enforcement via Notion
 Implements Phase 3.2 HITL policy + Sprint 1 Notion integration
 """
 
+import asyncio
 import logging
 import uuid
 import os
@@ -12,6 +13,9 @@ import requests
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+from wos import cancellation
+from wos.async_http import AsyncHTTP
+
 logger = logging.getLogger("wos.approval_gate")
 
 class ApprovalGate:
@@ -25,6 +29,8 @@ class ApprovalGate:
     2. Human reviews in Notion → Changes status to Approved/Rejected
     3. Agent calls wait_for_approval() → Polls Notion until status changes
     4. Agent proceeds (approved) or stops (rejected)
+
+    Every Notion call has an *_async twin for the async Brain pipeline.
     """
 
     def __init__(self, notion_api_key=None, notion_db_id=None):
@@ -44,14 +50,20 @@ class ApprovalGate:
         self.notion_version = "2022-06-28"  # Notion API version
         self.base_url = "https://api.notion.com/v1"
 
-    def _notion_request(self, method: str, endpoint: str, data: Dict = None) -> Dict:
-        """Make a request to Notion API"""
-        headers = {
+        # Pooled client for the *_async methods (created on first use)
+        self.http = AsyncHTTP()
+
+    def _headers(self) -> Dict[str, str]:
+        return {
             "Authorization": f"Bearer {self.notion_api_key}",
             "Content-Type": "application/json",
             "Notion-Version": self.notion_version
         }
 
+    def _notion_request(self, method: str, endpoint: str, data: Dict = None) -> Dict:
+        """Make a request to Notion API"""
+        headers = self._headers()
+
         url = f"{self.base_url}/{endpoint}"
 
         if method == "GET":
@@ -66,6 +78,23 @@ class ApprovalGate:
         response.raise_for_status()
         return response.json()
 
+    async def _notion_request_async(self, method: str, endpoint: str, data: Dict = None) -> Dict:
+        """Async _notion_request() over the pooled httpx client"""
+        if method not in ("GET", "POST", "PATCH"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        response = await self.http.request(
+            method, f"{self.base_url}/{endpoint}",
+            headers=self._headers(),
+            json=data if method != "GET" else None
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self):
+        """Close pooled async connections"""
+        await self.http.aclose()
+
     def request_approval(
         self,
         request_id: str,
@@ -93,6 +122,38 @@ class ApprovalGate:
         }
         """
 
+        page_data = self._approval_page(request_id, intent_id, content, title, metadata)
+
+        try:
+            result = self._notion_request("POST", "pages", page_data)
+            return self._approval_created(result)
+
+        except Exception as e:
+            logger.error(f"Failed to create approval request: {e}")
+            raise
+
+    async def request_approval_async(
+        self,
+        request_id: str,
+        intent_id: str,
+        content: str,
+        title: str = None,
+        metadata: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Async request_approval() (same arguments and result)"""
+        page_data = self._approval_page(request_id, intent_id, content, title, metadata)
+
+        try:
+            result = await self._notion_request_async("POST", "pages", page_data)
+            return self._approval_created(result)
+
+        except Exception as e:
+            logger.error(f"Failed to create approval request: {e}")
+            raise
+
+    def _approval_page(self, request_id: str, intent_id: str, content: str,
+                       title: str = None, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Notion page payload for an approval request"""
         if not self.notion_api_key or not self.notion_db_id:
             raise ValueError("Notion API key and database ID required for approval requests")
 
@@ -155,23 +216,20 @@ class ApprovalGate:
                 }
             })
 
-        try:
-            result = self._notion_request("POST", "pages", page_data)
-            approval_id = result["id"]
-            notion_url = result["url"]
+        return page_data
 
-            logger.info(f"Approval request created: {approval_id} ({notion_url})")
+    def _approval_created(self, result: Dict) -> Dict[str, Any]:
+        approval_id = result["id"]
+        notion_url = result["url"]
 
-            return {
-                "approval_id": approval_id,
-                "status": "pending",
-                "notion_url": notion_url,
-                "created_at": datetime.utcnow().isoformat()
-            }
+        logger.info(f"Approval request created: {approval_id} ({notion_url})")
 
-        except Exception as e:
-            logger.error(f"Failed to create approval request: {e}")
-            raise
+        return {
+            "approval_id": approval_id,
+            "status": "pending",
+            "notion_url": notion_url,
+            "created_at": datetime.utcnow().isoformat()
+        }
 
     def get_approval_status(self, approval_id: str) -> Optional[Dict]:
         """
@@ -194,30 +252,46 @@ class ApprovalGate:
 
         try:
             page = self._notion_request("GET", f"pages/{approval_id}")
+            return self._page_status(approval_id, page)
+
+        except Exception as e:
+            logger.error(f"Failed to get approval status: {e}")
+            return None
 
-            # Extract status from properties
-            status_property = page["properties"].get("Status", {})
-            status_value = status_property.get("select", {}).get("name", "pending").lower()
+    async def get_approval_status_async(self, approval_id: str) -> Optional[Dict]:
+        """Async get_approval_status() (same result, None on errors)"""
 
-            # Map Notion status to standard values
-            if status_value in ["approved", "✅ approved", "approve"]:
-                status = "approved"
-            elif status_value in ["rejected", "❌ rejected", "reject"]:
-                status = "rejected"
-            else:
-                status = "pending"
+        if not self.notion_api_key:
+            raise ValueError("Notion API key required")
 
-            return {
-                "approval_id": approval_id,
-                "status": status,
-                "reviewed_at": page.get("last_edited_time"),
-                "notion_url": page["url"]
-            }
+        try:
+            page = await self._notion_request_async("GET", f"pages/{approval_id}")
+            return self._page_status(approval_id, page)
 
         except Exception as e:
             logger.error(f"Failed to get approval status: {e}")
             return None
 
+    def _page_status(self, approval_id: str, page: Dict) -> Dict[str, Any]:
+        # Extract status from properties
+        status_property = page["properties"].get("Status", {})
+        status_value = status_property.get("select", {}).get("name", "pending").lower()
+
+        # Map Notion status to standard values
+        if status_value in ["approved", "✅ approved", "approve"]:
+            status = "approved"
+        elif status_value in ["rejected", "❌ rejected", "reject"]:
+            status = "rejected"
+        else:
+            status = "pending"
+
+        return {
+            "approval_id": approval_id,
+            "status": status,
+            "reviewed_at": page.get("last_edited_time"),
+            "notion_url": page["url"]
+        }
+
     def wait_for_approval(
         self,
         approval_id: str,
@@ -235,9 +309,12 @@ class ApprovalGate:
         Returns:
         {
             "approved": bool,
-            "status": "approved" | "rejected" | "timeout",
+            "status": "approved" | "rejected" | "timeout" | "cancelled",
             "reviewed_at": str
         }
+
+        Returns "cancelled" as soon as the calling tool call is cancelled
+        (see wos.cancellation) instead of polling until the timeout.
         """
 
         logger.info(f"Waiting for approval: {approval_id} (timeout={timeout_seconds}s)")
@@ -248,42 +325,89 @@ class ApprovalGate:
             # Check if timeout exceeded
             elapsed = time.time() - start_time
             if elapsed > timeout_seconds:
-                logger.warning(f"Approval timeout: {approval_id}")
-                return {
-                    "approved": False,
-                    "status": "timeout",
-                    "reviewed_at": None
-                }
+                return self._timed_out(approval_id)
 
             # Check current status
-            status_result = self.get_approval_status(approval_id)
+            outcome = self._poll_outcome(approval_id, self.get_approval_status(approval_id), elapsed)
+            if outcome:
+                return outcome
 
-            if not status_result:
-                logger.error(f"Failed to get status for {approval_id}")
-                time.sleep(poll_interval)
-                continue
+            # Still pending (or status unavailable) - wait and poll again
+            if cancellation.sleep(poll_interval):
+                return self._cancelled(approval_id)
 
-            status = status_result["status"]
+    async def wait_for_approval_async(
+        self,
+        approval_id: str,
+        timeout_seconds: int = 3600,
+        poll_interval: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Async wait_for_approval(): polls without holding a thread
 
-            if status == "approved":
-                logger.info(f"Approval granted: {approval_id}")
-                return {
-                    "approved": True,
-                    "status": "approved",
-                    "reviewed_at": status_result["reviewed_at"]
-                }
+        Same result; cancelling the awaiting task stops polling
+        (asyncio.CancelledError propagates).
+        """
 
-            elif status == "rejected":
-                logger.info(f"Approval rejected: {approval_id}")
-                return {
-                    "approved": False,
-                    "status": "rejected",
-                    "reviewed_at": status_result["reviewed_at"]
-                }
+        logger.info(f"Waiting for approval: {approval_id} (timeout={timeout_seconds}s)")
 
-            # Still pending - wait and poll again
-            logger.debug(f"Approval pending: {approval_id} ({int(elapsed)}s elapsed)")
-            time.sleep(poll_interval)
+        start_time = time.time()
+
+        while True:
+            elapsed = time.time() - start_time
+            if elapsed > timeout_seconds:
+                return self._timed_out(approval_id)
+
+            status_result = await self.get_approval_status_async(approval_id)
+            outcome = self._poll_outcome(approval_id, status_result, elapsed)
+            if outcome:
+                return outcome
+
+            await asyncio.sleep(poll_interval)
+
+    def _poll_outcome(self, approval_id: str, status_result: Optional[Dict],
+                      elapsed: float) -> Optional[Dict[str, Any]]:
+        """Final wait result for a polled status, or None to keep polling"""
+        if not status_result:
+            logger.error(f"Failed to get status for {approval_id}")
+            return None
+
+        status = status_result["status"]
+
+        if status == "approved":
+            logger.info(f"Approval granted: {approval_id}")
+            return {
+                "approved": True,
+                "status": "approved",
+                "reviewed_at": status_result["reviewed_at"]
+            }
+
+        elif status == "rejected":
+            logger.info(f"Approval rejected: {approval_id}")
+            return {
+                "approved": False,
+                "status": "rejected",
+                "reviewed_at": status_result["reviewed_at"]
+            }
+
+        logger.debug(f"Approval pending: {approval_id} ({int(elapsed)}s elapsed)")
+        return None
+
+    def _timed_out(self, approval_id: str) -> Dict[str, Any]:
+        logger.warning(f"Approval timeout: {approval_id}")
+        return {
+            "approved": False,
+            "status": "timeout",
+            "reviewed_at": None
+        }
+
+    def _cancelled(self, approval_id: str) -> Dict[str, Any]:
+        logger.warning(f"Stopped waiting for approval (call cancelled): {approval_id}")
+        return {
+            "approved": False,
+            "status": "cancelled",
+            "reviewed_at": None
+        }
 
     def check_approval(self, request_id: str, intent_id: str,
                       intent_input: Dict[str, Any]) -> Dict[str, Any]:
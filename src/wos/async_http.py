@@ -0,0 +1,56 @@
+"""
+WOS Async HTTP v0
+Shared httpx.AsyncClient for the async Brain pipeline (n8n, Notion)
+One pooled client per event loop, so many in-flight intents reuse connections
+"""
+
+import asyncio
+import logging
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger("wos.async_http")
+
+
+class AsyncHTTP:
+    """
+    Lazily created httpx.AsyncClient bound to the running event loop
+
+    An AsyncClient must not be shared across event loops, so a component
+    used from a different loop (e.g. a sync shim running asyncio.run in a
+    worker thread) gets a fresh client there.
+    """
+
+    def __init__(self, timeout: float = 30.0, max_connections: int = 100):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def client(self) -> Any:
+        """The httpx.AsyncClient for the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections)
+            )
+            self._loop = loop
+        return self._client
+
+    async def request(self, method: str, url: str, timeout: float = None, **kwargs) -> Any:
+        """Send a request (raises httpx errors like requests would)"""
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return await self.client().request(method, url, **kwargs)
+
+    async def aclose(self):
+        """Close the pooled connections of the current client"""
+        if self._client is not None and not self._client.is_closed:
+            try:
+                await self._client.aclose()
+            except RuntimeError as e:
+                logger.debug(f"Async HTTP client closed from another loop: {e}")
+        self._client = None
+        self._loop = None
@@ -4,13 +4,19 @@ Intent router implementing Phase 3.2 specification
 Routes requests to intent handlers, enforces policy, returns Brain_Run_Response_v0
 """
 
+import asyncio
 import logging
+import random
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import requests
 from enum import Enum
 
+from wos import cancellation
+from wos.job_runner import JobRunner
+
 logger = logging.getLogger("wos.brain")
 
 class RequestStatus(str, Enum):
@@ -19,6 +25,16 @@ class RequestStatus(str, Enum):
     FAILED = "Failed"
     PAUSED = "Paused"
     PENDING_APPROVAL = "PendingApproval"
+    RUNNING = "Running"
+
+# Intents allowed to run longer than this go to a background job by default
+BACKGROUND_AFTER_SECONDS = 60
+
+# Handler error codes retried (up to the intent's max_retries) unless the
+# handler result says "retryable": False; other codes are retried only
+# when the result says "retryable": True. A TIMEOUT (intent deadline) is
+# retried only for handlers declaring retry_on_timeout = True.
+RETRYABLE_ERROR_CODES = {"UPSTREAM_UNAVAILABLE"}
 
 class Brain:
     """
@@ -27,11 +43,15 @@ class Brain:
     Accepts normalized requests, enforces policy, routes to intent handlers,
     returns standardized Brain_Run_Response_v0
     
+    process_request() runs handlers synchronously; process_request_async()
+    is the asyncio variant for handlers implementing execute_async().
+    
     Following AOS Constitution: Reliability First, Determinism Over Creativity, Operator Supremacy
     """
     
     def __init__(self, intent_registry, approval_gate, canon_tools, n8n_executor, 
-                 handler_factory=None):
+                 handler_factory=None, handler_release=None, max_background_jobs: int = 32,
+                 retry_base_delay: float = 1.0, max_retry_delay: float = 30.0):
         """
         Initialize Brain with required components
         
@@ -41,12 +61,21 @@ class Brain:
             canon_tools: Canon retrieval tools
             n8n_executor: n8n workflow executor
             handler_factory: Function to create handlers (from intent_handlers package)
+            handler_release: Called with (intent_id, handler) once a request is
+                done with its handler (intent_handlers.release_handler)
+            max_background_jobs: Background jobs running at once (async path)
+            retry_base_delay: Initial retry backoff in seconds (jittered, doubling)
+            max_retry_delay: Cap on a single retry backoff
         """
         self.intent_registry = intent_registry
         self.approval_gate = approval_gate
         self.canon_tools = canon_tools
         self.n8n_executor = n8n_executor
         self.handler_factory = handler_factory
+        self.handler_release = handler_release
+        self.retry_base_delay = retry_base_delay
+        self.max_retry_delay = max_retry_delay
+        self.jobs = JobRunner(self, max_concurrent=max_background_jobs)
     
     def process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -59,6 +88,9 @@ class Brain:
             "input": object (optional, default {})
             "mode": string (optional, e.g. "workflow_builder")
             "wb_stage": string (optional, "propose|test|approve|deploy")
+            "background": bool (optional, async path only: run as a
+                background job; default: intents with timeout_seconds
+                above BACKGROUND_AFTER_SECONDS)
         }
         
         Returns Brain_Run_Response_v0 envelope
@@ -69,99 +101,333 @@ class Brain:
         request_id = normalized["request_id"]
         
         try:
-            # Step 2: Validate request
-            if not self._validate_request(normalized):
-                return self._error_response(
-                    request_id, "INVALID_REQUEST", "Request validation failed"
-                )
+            # Steps 2-6: validate, resolve, policy gates, handler
+            response, run = self._prepare(normalized)
+            if response:
+                return response
             
-            # Step 3: Resolve intent
-            resolved_intent = normalized["intent"].strip().lower()
-            intent_record = self.intent_registry.get_intent(resolved_intent)
-            
-            if not intent_record:
-                logger.warning(f"Intent not found: {resolved_intent}")
-                return self._error_response(
-                    request_id, "INTENT_NOT_FOUND", 
-                    f"No intent registered for '{resolved_intent}'"
-                )
-            
-            intent_id = intent_record["intent_id"]
-            
-            # Step 4: Policy guard - workflow_builder deploy requires approval
-            if (normalized.get("mode") == "workflow_builder" and 
-                normalized.get("wb_stage") == "deploy"):
-                logger.info(f"WB deploy gate triggered for {request_id}")
-                return self._paused_response(
-                    request_id, intent_id, 
-                    "Workflow builder deploy requires founder approval"
-                )
-            
-            # Step 5: Check if intent requires approval
-            if intent_record.get("approval_required"):
-                approval_result = self.approval_gate.check_approval(
-                    request_id, intent_id, normalized.get("input", {})
-                )
-                
-                if not approval_result.get("approved"):
-                    logger.info(f"Approval required for {intent_id}: {request_id}")
-                    return self._pending_approval_response(
-                        request_id, intent_id, approval_result
-                    )
+            # Execute handler (deadline + retries from the intent record)
+            try:
+                handler_result = self._supervise(run)
+            finally:
+                self._release_handler(run["intent_id"], run["handler"])
             
-            # Step 6: Get and execute handler
-            handler = self._get_handler(intent_record)
-            if not handler:
-                return self._error_response(
-                    request_id, "HANDLER_NOT_FOUND",
-                    f"Handler not available for {intent_id}"
-                )
-            
-            execution_id = str(uuid.uuid4())
+            # Steps 7-8: log and respond
+            return self._complete(run, handler_result)
+        
+        except Exception as e:
+            logger.error(f"Brain error processing {request_id}: {e}", exc_info=True)
+            return self._error_response(
+                request_id, "BRAIN_ERROR", str(e)
+            )
+    
+    async def process_request_async(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async process_request(): same steps and Brain_Run_Response_v0
+        
+        Handlers implementing execute_async() run on the event loop (many
+        intents in flight on one thread); other handlers go through a sync
+        shim on the loop's executor. Cancelling the awaiting task cancels
+        the handler (sync handlers are signalled via wos.cancellation).
+        Registry lookups and logging stay synchronous (local SQLite).
+        
+        Background requests return status Running with the execution_id
+        right away; self.jobs reports their status and cancels them.
+        """
+        
+        normalized = self._normalize_request(request)
+        request_id = normalized["request_id"]
+        
+        try:
+            response, run = self._prepare(normalized)
+            if response:
+                return response
             
-            # Validate input if handler supports it
-            if hasattr(handler, 'validate_input'):
-                if not handler.validate_input(normalized.get("input", {})):
+            if self._runs_in_background(normalized, run):
+                # The job releases the handler when it finishes
+                if not self.jobs.submit(run, normalized):
+                    self._release_handler(run["intent_id"], run["handler"])
                     return self._error_response(
-                        request_id, "INVALID_INPUT",
-                        "Input validation failed for intent"
+                        request_id, "JOB_SUBMIT_FAILED",
+                        "Could not record the background execution"
                     )
+                return self._running_response(run)
             
-            # Execute handler
-            handler_result = handler.execute(
-                request_id=request_id,
-                execution_id=execution_id,
-                intent_input=normalized.get("input", {}),
-                intent_record=intent_record
+            try:
+                handler_result = await self._supervise_async(run)
+            finally:
+                self._release_handler(run["intent_id"], run["handler"])
+            return self._complete(run, handler_result)
+        
+        except Exception as e:
+            logger.error(f"Brain error processing {request_id}: {e}", exc_info=True)
+            return self._error_response(
+                request_id, "BRAIN_ERROR", str(e)
+            )
+    
+    async def _execute_async(self, run: Dict, timeout: float = None) -> Dict[str, Any]:
+        """
+        Run the prepared handler (execute_async, or execute via the sync shim)
+        
+        Raises: cancellation.DeadlineExceeded when `timeout` passes first
+        """
+        handler = run["handler"]
+        if hasattr(handler, "execute_async"):
+            return await cancellation.await_with_timeout(
+                timeout, handler.execute_async(**run["execute_args"])
             )
+        return await cancellation.run_with_timeout(
+            timeout, handler.execute, **run["execute_args"]
+        )
+    
+    # Supervised execution: timeout_seconds is the deadline of each attempt,
+    # retryable failures get up to max_retries more attempts
+    
+    def _supervise(self, run: Dict) -> Dict[str, Any]:
+        """Run the handler under the intent's deadline and retry policy (sync)"""
+        timeout, max_retries = self._retry_policy(run)
+        handler = run["handler"]
+        attempts: List[Dict] = []
+        started = time.monotonic()
+        
+        while True:
+            attempt_start = time.monotonic()
+            abandoned = None
+            try:
+                result = cancellation.call_with_timeout(
+                    timeout, handler.execute, **run["execute_args"]
+                )
+            except cancellation.DeadlineExceeded as e:
+                result, abandoned = self._timeout_result(timeout), e.finished
+            except Exception as e:
+                result = self._exception_result(run, e)
             
-            # Step 7: Log execution
-            self.intent_registry.log_execution(
-                execution_id=execution_id,
-                request_id=request_id,
-                intent_id=intent_id,
-                status=handler_result.get("status", "Unknown"),
-                result=handler_result.get("result"),
-                error=handler_result.get("error"),
-                execution_time_ms=handler_result.get("execution_time_ms")
+            delay = self._next_attempt(run, attempts, attempt_start, result, max_retries)
+            if delay is None or cancellation.sleep(delay) or self._still_running(run, abandoned):
+                return self._supervised_result(result, attempts, started)
+    
+    async def _supervise_async(self, run: Dict) -> Dict[str, Any]:
+        """Async _supervise(): the deadline cancels the handler task"""
+        timeout, max_retries = self._retry_policy(run)
+        attempts: List[Dict] = []
+        started = time.monotonic()
+        
+        while True:
+            attempt_start = time.monotonic()
+            abandoned = None
+            try:
+                result = await self._execute_async(run, timeout)
+            except cancellation.DeadlineExceeded as e:
+                result, abandoned = self._timeout_result(timeout), e.finished
+            except Exception as e:
+                result = self._exception_result(run, e)
+            
+            delay = self._next_attempt(run, attempts, attempt_start, result, max_retries)
+            if delay is None:
+                return self._supervised_result(result, attempts, started)
+            await asyncio.sleep(delay)
+            if self._still_running(run, abandoned):
+                return self._supervised_result(result, attempts, started)
+    
+    def _retry_policy(self, run: Dict) -> Tuple[Optional[float], int]:
+        """(deadline per attempt or None, retries) from the intent record"""
+        intent_record = run["execute_args"]["intent_record"]
+        timeout = intent_record.get("timeout_seconds") or None
+        max_retries = max(int(intent_record.get("max_retries") or 0), 0)
+        return timeout, max_retries
+    
+    def _next_attempt(self, run: Dict, attempts: List[Dict], attempt_start: float,
+                      result: Dict, max_retries: int) -> Optional[float]:
+        """
+        Record an attempt; returns the backoff before the next one, or None
+        when the result is final
+        """
+        attempts.append({
+            "attempt": len(attempts) + 1,
+            "status": result.get("status", "Unknown"),
+            "error_code": result.get("error_code"),
+            "error": result.get("error"),
+            "duration_ms": int((time.monotonic() - attempt_start) * 1000)
+        })
+        
+        if result.get("status") == "success" or len(attempts) > max_retries:
+            return None
+        if not self._is_retryable(run["handler"], result):
+            return None
+        
+        # Jittered exponential backoff (same shape as the embedding pipeline)
+        delay = min(self.retry_base_delay * (2 ** (len(attempts) - 1)) * (0.5 + random.random()),
+                    self.max_retry_delay)
+        logger.warning(
+            f"{run['intent_id']} attempt {len(attempts)} failed "
+            f"({result.get('error_code')}: {result.get('error')}), retrying in {delay:.1f}s"
+        )
+        return delay
+    
+    def _is_retryable(self, handler, result: Dict) -> bool:
+        error_code = result.get("error_code")
+        if error_code == "TIMEOUT":
+            # The timed-out attempt may have done part of its work: opt-in only
+            return bool(getattr(handler, "retry_on_timeout", False))
+        retryable = result.get("retryable")
+        if retryable is not None:
+            return bool(retryable)
+        return error_code in RETRYABLE_ERROR_CODES
+    
+    def _still_running(self, run: Dict, abandoned) -> bool:
+        """True (no retry) if a timed-out attempt has not returned after the backoff"""
+        if abandoned is None or abandoned.is_set():
+            return False
+        logger.warning(f"{run['intent_id']}: timed-out attempt still running, not retrying")
+        return True
+    
+    def _timeout_result(self, timeout: float) -> Dict[str, Any]:
+        return {
+            "status": "failed",
+            "result": None,
+            "error": f"Intent exceeded its timeout ({timeout}s)",
+            "error_code": "TIMEOUT"
+        }
+    
+    def _exception_result(self, run: Dict, e: Exception) -> Dict[str, Any]:
+        logger.error(f"Handler for {run['intent_id']} raised: {e}", exc_info=True)
+        return {
+            "status": "failed",
+            "result": None,
+            "error": str(e),
+            "error_code": "HANDLER_EXCEPTION"
+        }
+    
+    def _supervised_result(self, result: Dict, attempts: List[Dict],
+                           started: float) -> Dict[str, Any]:
+        """Final handler result with the attempt log and total duration"""
+        result = dict(result)
+        result["attempts"] = attempts
+        result["execution_time_ms"] = int((time.monotonic() - started) * 1000)
+        if len(attempts) > 1:
+            logger.info(f"Execution finished after {len(attempts)} attempts: {result.get('status')}")
+        return result
+    
+    def _runs_in_background(self, normalized: Dict, run: Dict) -> bool:
+        background = normalized.get("background")
+        if background is None:
+            timeout = run["execute_args"]["intent_record"].get("timeout_seconds") or 0
+            return timeout > BACKGROUND_AFTER_SECONDS
+        return bool(background)
+    
+    def _prepare(self, normalized: Dict,
+                 execution_id: str = None) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Steps 2-6 of a request, shared by the sync and async paths
+        
+        Args:
+            normalized: Normalized request
+            execution_id: Reuse an execution ID (resubmitted background job)
+        
+        Returns: (early response, None) when the request stops here,
+        else (None, run) with the handler and its execute() arguments
+        """
+        request_id = normalized["request_id"]
+        
+        # Step 2: Validate request
+        if not self._validate_request(normalized):
+            return self._error_response(
+                request_id, "INVALID_REQUEST", "Request validation failed"
+            ), None
+        
+        # Step 3: Resolve intent
+        resolved_intent = normalized["intent"].strip().lower()
+        intent_record = self.intent_registry.get_intent(resolved_intent)
+        
+        if not intent_record:
+            logger.warning(f"Intent not found: {resolved_intent}")
+            return self._error_response(
+                request_id, "INTENT_NOT_FOUND", 
+                f"No intent registered for '{resolved_intent}'"
+            ), None
+        
+        intent_id = intent_record["intent_id"]
+        
+        # Step 4: Policy guard - workflow_builder deploy requires approval
+        if (normalized.get("mode") == "workflow_builder" and 
+            normalized.get("wb_stage") == "deploy"):
+            logger.info(f"WB deploy gate triggered for {request_id}")
+            return self._paused_response(
+                request_id, intent_id, 
+                "Workflow builder deploy requires founder approval"
+            ), None
+        
+        # Step 5: Check if intent requires approval
+        if intent_record.get("approval_required"):
+            approval_result = self.approval_gate.check_approval(
+                request_id, intent_id, normalized.get("input", {})
             )
             
-            # Step 8: Return success or error response
-            if handler_result.get("status") == "success":
-                return self._success_response(
-                    request_id, execution_id, intent_id, 
-                    resolved_intent, handler_result
-                )
-            else:
+            if not approval_result.get("approved"):
+                logger.info(f"Approval required for {intent_id}: {request_id}")
+                return self._pending_approval_response(
+                    request_id, intent_id, approval_result
+                ), None
+        
+        # Step 6: Get handler
+        handler = self._get_handler(intent_record)
+        if not handler:
+            return self._error_response(
+                request_id, "HANDLER_NOT_FOUND",
+                f"Handler not available for {intent_id}"
+            ), None
+        
+        execution_id = execution_id or str(uuid.uuid4())
+        
+        # Validate input if handler supports it
+        if hasattr(handler, 'validate_input'):
+            if not handler.validate_input(normalized.get("input", {})):
+                self._release_handler(intent_id, handler)
                 return self._error_response(
-                    request_id, handler_result.get("error_code", "EXECUTION_FAILED"),
-                    handler_result.get("error", "Intent execution failed")
-                )
+                    request_id, "INVALID_INPUT",
+                    "Input validation failed for intent"
+                ), None
         
-        except Exception as e:
-            logger.error(f"Brain error processing {request_id}: {e}", exc_info=True)
+        return None, {
+            "handler": handler,
+            "intent_id": intent_id,
+            "resolved_intent": resolved_intent,
+            "execute_args": {
+                "request_id": request_id,
+                "execution_id": execution_id,
+                "intent_input": normalized.get("input", {}),
+                "intent_record": intent_record
+            }
+        }
+    
+    def _complete(self, run: Dict, handler_result: Dict) -> Dict[str, Any]:
+        """Steps 7-8: log the execution and build the response"""
+        request_id = run["execute_args"]["request_id"]
+        execution_id = run["execute_args"]["execution_id"]
+        intent_id = run["intent_id"]
+        
+        # Step 7: Log execution
+        self.intent_registry.log_execution(
+            execution_id=execution_id,
+            request_id=request_id,
+            intent_id=intent_id,
+            status=handler_result.get("status", "Unknown"),
+            result=handler_result.get("result"),
+            error=handler_result.get("error"),
+            execution_time_ms=handler_result.get("execution_time_ms"),
+            attempt_log=handler_result.get("attempts")
+        )
+        
+        # Step 8: Return success or error response
+        if handler_result.get("status") == "success":
+            return self._success_response(
+                request_id, execution_id, intent_id, 
+                run["resolved_intent"], handler_result
+            )
+        else:
             return self._error_response(
-                request_id, "BRAIN_ERROR", str(e)
+                request_id, handler_result.get("error_code", "EXECUTION_FAILED"),
+                handler_result.get("error", "Intent execution failed")
             )
     
     def _normalize_request(self, request: Dict) -> Dict:
@@ -171,7 +437,8 @@ class Brain:
             "intent": request.get("intent", "").strip(),
             "input": request.get("input", {}),
             "mode": request.get("mode"),
-            "wb_stage": request.get("wb_stage")
+            "wb_stage": request.get("wb_stage"),
+            "background": request.get("background")
         }
     
     def _validate_request(self, request: Dict) -> bool:
@@ -182,6 +449,7 @@ class Brain:
     def _get_handler(self, intent_record: Dict):
         """
         Get handler for intent using factory
+        (intent_handlers reuses one warmed-up instance per intent)
         """
         if not self.handler_factory:
             logger.error("Handler factory not configured")
@@ -201,6 +469,15 @@ class Brain:
             logger.error(f"Failed to get handler for {intent_id}: {e}")
             return None
     
+    def _release_handler(self, intent_id: str, handler):
+        """Hand a handler back once its request is done (see handler_release)"""
+        if not self.handler_release:
+            return
+        try:
+            self.handler_release(intent_id, handler)
+        except Exception as e:
+            logger.warning(f"Failed to release handler for {intent_id}: {e}")
+    
     # Response envelope generators
     
     def _success_response(self, request_id: str, execution_id: str, 
@@ -237,6 +514,20 @@ class Brain:
             }]
         }
     
+    def _running_response(self, run: Dict) -> Dict:
+        """Generate running response (accepted as a background job)"""
+        return {
+            "ok": True,
+            "status": RequestStatus.RUNNING,
+            "request_id": run["execute_args"]["request_id"],
+            "execution_id": run["execute_args"]["execution_id"],
+            "resolved_intent": run["resolved_intent"],
+            "intent_id": run["intent_id"],
+            "result": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "errors": []
+        }
+    
     def _paused_response(self, request_id: str, intent_id: str, 
                         reason: str) -> Dict:
         """Generate paused response (policy gate blocked)"""
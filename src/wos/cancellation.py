@@ -0,0 +1,235 @@
+"""
+WOS Cancellation v0
+Cooperative cancellation for blocking work running on worker threads
+(e.g. an MCP tool call whose client went away)
+"""
+
+import os
+import time
+import asyncio
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar("wos_cancel_event", default=None)
+
+# Sync handlers awaited by the async pipeline (run_in_thread / run_with_timeout)
+# get their own bounded pool: a slow handler holds one of these threads for
+# its whole run and never starves the loop's default executor or the MCP
+# tool pool. Further calls queue.
+HANDLER_THREADS = int(os.getenv("WOS_HANDLER_THREADS", "16"))
+
+_handler_executor: Optional[ThreadPoolExecutor] = None
+_handler_executor_lock = threading.Lock()
+
+
+class DeadlineExceeded(Exception):
+    """
+    A call_with_timeout() / await_with_timeout() deadline passed
+
+    Not a TimeoutError, so timeouts raised by the call itself stay
+    distinguishable. `finished` is set once the abandoned call has
+    actually returned (a blocking call keeps running after the deadline).
+    """
+
+    def __init__(self, timeout: float, finished: threading.Event = None):
+        super().__init__(f"Call exceeded {timeout}s")
+        self.timeout = timeout
+        if finished is None:
+            finished = threading.Event()
+            finished.set()
+        self.finished = finished
+
+
+@contextmanager
+def cancellation_scope(event: threading.Event):
+    """Make `event` the cancel signal for code running in this context"""
+    token = _cancel_event.set(event)
+    try:
+        yield event
+    finally:
+        _cancel_event.reset(token)
+
+
+def is_cancelled() -> bool:
+    """True once the current call has been cancelled (False outside a scope)"""
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+def sleep(seconds: float) -> bool:
+    """
+    time.sleep() that wakes up early on cancellation
+
+    Returns: True if the call was cancelled (stop waiting / polling)
+    """
+    event = _cancel_event.get()
+    if event is None:
+        time.sleep(seconds)
+        return False
+    return event.wait(seconds)
+
+
+def handler_executor() -> ThreadPoolExecutor:
+    """The sync-handler pool (created on first use, HANDLER_THREADS threads)"""
+    global _handler_executor
+    with _handler_executor_lock:
+        if _handler_executor is None:
+            _handler_executor = ThreadPoolExecutor(max_workers=HANDLER_THREADS,
+                                                   thread_name_prefix="wos-handler")
+        return _handler_executor
+
+
+def shutdown_handler_executor():
+    """Stop the sync-handler pool (queued calls are dropped; a later call starts a new pool)"""
+    global _handler_executor
+    with _handler_executor_lock:
+        executor, _handler_executor = _handler_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """
+    Await a blocking call on the sync-handler pool
+
+    Sync shim for the async pipeline: if the awaiting task is cancelled,
+    the call is signalled through is_cancelled() / sleep() (a thread cannot
+    be interrupted) and CancelledError propagates right away.
+    """
+    return await run_with_timeout(None, func, *args, **kwargs)
+
+
+async def run_with_timeout(timeout: Optional[float], func, *args, **kwargs):
+    """
+    run_in_thread() with a deadline (timeout None = no deadline)
+
+    Async counterpart of call_with_timeout(): the deadline is awaited on
+    the loop, so each call holds a single pool thread. The deadline runs
+    from the moment a pool thread picks the call up (time queued behind a
+    full pool does not count). At the deadline the call is signalled and
+    DeadlineExceeded raised right away; its .finished is set once the
+    thread has returned.
+
+    Raises: DeadlineExceeded when the deadline passes first
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.create_future()
+    event = threading.Event()
+    done = threading.Event()
+    context = contextvars.copy_context()
+
+    def mark_started():
+        if not started.done():
+            started.set_result(None)
+
+    def run():
+        try:
+            if event.is_set():
+                return None
+            try:
+                loop.call_soon_threadsafe(mark_started)
+            except RuntimeError:
+                pass  # loop closed: nobody is waiting for the deadline
+            with cancellation_scope(event):
+                return func(*args, **kwargs)
+        finally:
+            done.set()
+
+    future = loop.run_in_executor(handler_executor(), context.run, run)
+    try:
+        if timeout is not None:
+            await asyncio.wait({started, future}, return_when=asyncio.FIRST_COMPLETED)
+        finished, _ = await asyncio.wait({future}, timeout=timeout)
+    except asyncio.CancelledError:
+        event.set()
+        future.cancel()
+        raise
+    finally:
+        started.cancel()
+
+    if not finished:
+        event.set()
+        # Abandoned: its outcome is never awaited
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        raise DeadlineExceeded(timeout, done)
+    return future.result()
+
+
+def call_with_timeout(timeout: Optional[float], func, *args, **kwargs):
+    """
+    Run a blocking call with a deadline (timeout None = no deadline)
+
+    The call runs in a helper thread with its own cancel signal, set at
+    the deadline or when the caller's own scope is cancelled. A thread
+    cannot be interrupted: at the deadline DeadlineExceeded is raised right
+    away and the call stops at its next is_cancelled() / sleep() check
+    (DeadlineExceeded.finished tells when it has).
+
+    Raises: DeadlineExceeded when the deadline passes first
+    """
+    if timeout is None:
+        return func(*args, **kwargs)
+
+    event = threading.Event()
+    done = threading.Event()
+    outcome = {}
+    context = contextvars.copy_context()
+
+    def run():
+        try:
+            with cancellation_scope(event):
+                outcome["result"] = func(*args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    threading.Thread(target=context.run, args=(run,), daemon=True,
+                     name="wos-deadline").start()
+
+    deadline = time.monotonic() + timeout
+    while not done.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            event.set()
+            raise DeadlineExceeded(timeout, done)
+        done.wait(min(remaining, 0.25))
+        if is_cancelled():
+            # Caller cancelled: pass it on and let the call wind down
+            event.set()
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+async def await_with_timeout(timeout: Optional[float], awaitable):
+    """
+    Await with a deadline (timeout None = no deadline)
+
+    Unlike asyncio.wait_for(), the deadline raises DeadlineExceeded (after
+    the awaitable has been cancelled and has finished), so a TimeoutError
+    from the awaitable itself passes through unchanged.
+    """
+    if timeout is None:
+        return await awaitable
+
+    task = asyncio.ensure_future(awaitable)
+    try:
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+
+    if not done:
+        # Wait for the cancelled awaitable to wind down (its outcome is dropped)
+        task.cancel()
+        await asyncio.wait({task})
+        if not task.cancelled():
+            task.exception()  # Mark retrieved
+        raise DeadlineExceeded(timeout)
+    return task.result()
@@ -1,55 +1,225 @@
 """
 WOS Canon Embeddings v0 (Phase 4.1)
-Semantic search using OpenAI embeddings + vector similarity
+Semantic search using pluggable embeddings (OpenAI or local) + vector similarity
 Upgrades Canon Index from text matching to intelligent retrieval
 """
 
 import sqlite3
+import json
+import hashlib
 import logging
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import os
-import openai
+import time
+import threading
+
+from wos.embedding_providers import create_embedding_provider, EmbeddingProvider
+from wos.vector_cache import VectorCache
+from wos.ann_index import create_ann_index, VectorIndex
+from wos.quantization import create_quantized_cache
+from wos.vector_partitions import PartitionIndex, plan_filtered_search, PREFILTER_MAX_SELECTIVITY
+from wos.embedding_cache import QueryEmbeddingCache
+from wos.db import get_connection_manager
 
 logger = logging.getLogger("wos.canon_embeddings")
 
+# On-disk vector format: little-endian float32 BLOB (4 bytes per dimension)
+VECTOR_DTYPE = np.dtype("<f4")
+
+# Embedding inputs are truncated to this many characters (~8k tokens)
+MAX_EMBEDDING_CHARS = 30000
+
+# Passage chunking defaults (~500 tokens per chunk, ~50 tokens overlap)
+CHUNK_CHARS = 2000
+CHUNK_OVERLAP = 200
+
+
+def encode_vector(embedding) -> bytes:
+    """Serialize an embedding to a compact float32 BLOB"""
+    return np.asarray(embedding, dtype=VECTOR_DTYPE).tobytes()
+
+
+def text_checksum(text: str) -> str:
+    """SHA-256 of the exact text sent to the embedding model"""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def split_into_chunks(text: str, chunk_chars: int = CHUNK_CHARS,
+                      overlap: int = CHUNK_OVERLAP) -> List[Tuple[int, int]]:
+    """
+    Split text into overlapping (start, end) character spans
+    
+    Chunk ends prefer a paragraph, line, sentence or word break in the second
+    half of the window, so passages rarely cut mid-sentence. Text that fits
+    in one chunk yields a single span.
+    """
+    length = len(text)
+    if chunk_chars <= 0 or length <= chunk_chars:
+        return [(0, length)]
+    
+    spans = []
+    start = 0
+    while start < length:
+        end = min(start + chunk_chars, length)
+        if end < length:
+            floor = start + chunk_chars // 2
+            for separator in ("\n\n", "\n", ". ", " "):
+                cut = text.rfind(separator, floor, end)
+                if cut >= 0:
+                    end = cut + len(separator)
+                    break
+        spans.append((start, end))
+        if end >= length:
+            break
+        
+        # Step back by the overlap, then forward to the next word start
+        start = max(end - overlap, start + 1)
+        space = text.find(" ", start, end)
+        if space >= 0:
+            start = space + 1
+    
+    return spans
+
+
+def decode_vector(stored) -> np.ndarray:
+    """
+    Deserialize a stored embedding
+
+    Accepts float32 BLOBs and legacy JSON text rows (pre-migration databases).
+    """
+    if isinstance(stored, str):
+        return np.array(json.loads(stored), dtype=VECTOR_DTYPE)
+    return np.frombuffer(stored, dtype=VECTOR_DTYPE)
+
+
 class CanonEmbeddings:
     """
     Canon Embeddings Layer
     
     Adds semantic search to Canon Index using:
-    - OpenAI text-embedding-3-small (cheap, fast, good quality)
+    - Pluggable embedding provider: OpenAI text-embedding-3-small (default
+      with an API key) or deterministic local hashing (offline, zero-cost)
     - Cosine similarity for relevance scoring
-    - SQLite for vector storage (with JSON serialization)
+    - SQLite for vector storage (float32 BLOBs)
+    - Resident normalized matrix (VectorCache) for vectorized top-k
+    - Optional ANN index (IVF) for sub-linear approximate search
+    - Optional int8 / product quantization of the resident matrices, with
+      exact re-rank from the stored float32 vectors
+    - Type/category partitions: selective filters score only matching rows
+    - LRU query-embedding cache (optionally persisted in canon.db)
+    - Overlapping passage chunks with their own vectors (artifact_chunks)
+      for passage-level retrieval of long documents
     """
     
-    def __init__(self, db_path: str = "canon.db", api_key: str = None):
+    def __init__(self, db_path: str = "canon.db", api_key: str = None,
+                 ann_index: str = "ivf", ann_options: Dict[str, Any] = None,
+                 approximate_search: bool = False, query_cache_size: int = 1024,
+                 query_cache_ttl: float = 7 * 24 * 3600,
+                 persist_query_cache: bool = True, provider: str = None,
+                 provider_options: Dict[str, Any] = None,
+                 chunk_chars: int = CHUNK_CHARS, chunk_overlap: int = CHUNK_OVERLAP,
+                 quantization: str = None, quantization_options: Dict[str, Any] = None,
+                 prefilter_max_selectivity: float = PREFILTER_MAX_SELECTIVITY):
+        """
+        Args:
+            db_path: Path to Canon SQLite database
+            api_key: OpenAI API key (or OPENAI_API_KEY env var)
+            ann_index: ANN index kind from ann_index.ANN_INDEXES ("ivf", "exact")
+            ann_options: Index knobs, e.g. {"nprobe": 8, "min_train_size": 1024}
+            approximate_search: Default search mode when callers don't choose
+            query_cache_size: Max query embeddings held in memory (0 disables)
+            query_cache_ttl: Seconds before a cached query embedding expires
+            persist_query_cache: Keep query embeddings in canon.db across restarts
+            provider: Embedding provider from embedding_providers.EMBEDDING_PROVIDERS
+                ("openai", "local"); None = WOS_EMBEDDING_PROVIDER env var, else
+                "openai" when a key is available, else "local"
+            provider_options: Provider knobs, e.g. {"dimension": 512}
+            chunk_chars: Passage chunk size in characters (0 = one chunk per artifact)
+            chunk_overlap: Characters shared by consecutive chunks
+            quantization: Compress resident vectors: None (float32), "int8"
+                (~4x smaller) or "pq" (product quantization, ~16x smaller).
+                Quantized caches are scanned exactly (the IVF index needs
+                float rows) and re-rank their shortlist from SQLite.
+            quantization_options: e.g. {"m": 384, "rerank_factor": 4}
+            prefilter_max_selectivity: Filters matching at most this share of
+                vectors score only their partition; broader ones post-filter
+        """
         self.db_path = db_path
+        self.db = None
         self.conn = None
-        self.openai_api_key = api_key or os.getenv("OPENAI_API_KEY")
         
-        if not self.openai_api_key:
-            logger.warning("OPENAI_API_KEY not set - embeddings will fail")
+        if isinstance(provider, EmbeddingProvider):
+            self.provider = provider
+        else:
+            self.provider = create_embedding_provider(
+                provider, api_key=api_key, **(provider_options or {})
+            )
         
-        openai.api_key = self.openai_api_key
+        # Only vectors from this provider/model are searched and kept current
+        self.embedding_provider = self.provider.name
+        self.embedding_model = self.provider.model
+        self.embedding_dimension = self.provider.dimension
         
-        self.embedding_model = "text-embedding-3-small"
-        self.embedding_dimension = 1536  # Dimension for text-embedding-3-small
+        # Loaded lazily on first search, kept in sync by store_embedding.
+        # Each matrix is built with its ANN index and partitions under
+        # _cache_lock and published together (searches run on worker threads)
+        self._cache_lock = threading.RLock()
+        self.vector_cache = None
+        self.ann = None
+        self.ann_index = ann_index
+        self.ann_options = ann_options or {}
+        self.approximate_search = approximate_search
+        self.quantization = quantization
+        self.quantization_options = quantization_options or {}
+        
+        # Passage vectors: separate matrix + index, also loaded lazily
+        self.chunk_chars = chunk_chars
+        self.chunk_overlap = chunk_overlap
+        self.chunk_cache = None
+        self.chunk_ann = None
+        
+        # type/category -> cache rows, built with each matrix
+        self.partitions = None
+        self.chunk_partitions = None
+        self.prefilter_max_selectivity = prefilter_max_selectivity
+        self.filter_plans = {"unfiltered": 0, "prefilter": 0, "postfilter": 0}
+        
+        self.persist_query_cache = persist_query_cache
+        self.query_cache = None
+        if query_cache_size:
+            self.query_cache = QueryEmbeddingCache(
+                max_entries=query_cache_size,
+                ttl_seconds=query_cache_ttl,
+                loader=self._load_cached_query if persist_query_cache else None,
+                saver=self._save_cached_query if persist_query_cache else None
+            )
         
         self.init_db()
     
     def init_db(self):
         """Initialize embeddings table in Canon database"""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
-        cursor = self.conn.cursor()
+        # Same ConnectionManager as the CanonIndex on this file
+        self.db = get_connection_manager(self.db_path)
+        self.conn = self.db.writer
+        
+        with self.db.transaction() as conn:
+            self._create_schema(conn.cursor())
+        
+        logger.info("Canon embeddings table initialized")
         
-        # Embeddings table - stores vectors as JSON arrays
+        # One-shot upgrade of JSON-encoded vectors (no-op once migrated)
+        self.migrate_json_vectors()
+    
+    def _create_schema(self, cursor):
+        """Create embedding/chunk tables and run column migrations (internal)"""
+        # Embeddings table - stores vectors as float32 BLOBs
+        # (legacy databases declared the column TEXT; SQLite keeps BLOBs as-is)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS artifact_embeddings (
                 embedding_id TEXT PRIMARY KEY,
                 artifact_id TEXT NOT NULL,
-                embedding_vector TEXT NOT NULL,
+                embedding_vector BLOB NOT NULL,
                 embedding_model TEXT NOT NULL,
                 embedding_dimension INTEGER NOT NULL,
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP,
@@ -57,34 +227,125 @@ class CanonEmbeddings:
             )
         """)
         
+        # Checksum of the embedded text (added after v0; NULL on legacy rows)
+        try:
+            cursor.execute("ALTER TABLE artifact_embeddings ADD COLUMN content_checksum TEXT")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
+        # Provider that produced the vector (NULL rows predate providers: OpenAI)
+        try:
+            cursor.execute("ALTER TABLE artifact_embeddings ADD COLUMN embedding_provider TEXT")
+            cursor.execute("""
+                UPDATE artifact_embeddings SET embedding_provider = 'openai'
+                WHERE embedding_provider IS NULL
+            """)
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
         # Index for fast lookups
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_embedding_artifact 
             ON artifact_embeddings(artifact_id)
         """)
         
-        self.conn.commit()
-        logger.info("Canon embeddings table initialized")
+        # Passage chunks - one row per overlapping slice of the artifact text
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS artifact_chunks (
+                chunk_id TEXT PRIMARY KEY,
+                artifact_id TEXT NOT NULL,
+                chunk_index INTEGER NOT NULL,
+                start_char INTEGER NOT NULL,
+                end_char INTEGER NOT NULL,
+                chunk_text TEXT NOT NULL,
+                embedding_vector BLOB NOT NULL,
+                embedding_provider TEXT NOT NULL,
+                embedding_model TEXT NOT NULL,
+                embedding_dimension INTEGER NOT NULL,
+                content_checksum TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (artifact_id) REFERENCES artifacts(artifact_id)
+            )
+        """)
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_chunk_artifact 
+            ON artifact_chunks(artifact_id)
+        """)
+        
+        # Query embedding cache (survives server restarts)
+        if self.query_cache is not None and self.persist_query_cache:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS query_embedding_cache (
+                    embedding_model TEXT NOT NULL,
+                    query_text TEXT NOT NULL,
+                    embedding_vector BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (embedding_model, query_text)
+                )
+            """)
+            if self.query_cache.ttl_seconds:
+                cursor.execute("""
+                    DELETE FROM query_embedding_cache WHERE created_at < ?
+                """, (time.time() - self.query_cache.ttl_seconds,))
+    
+    def migrate_json_vectors(self, vacuum: bool = False) -> Dict[str, int]:
+        """
+        Convert legacy JSON text vectors to float32 BLOBs
+        
+        Args:
+            vacuum: Run VACUUM afterwards to return freed pages to the OS
+        
+        Returns: Stats {migrated, failed}
+        """
+        with self.db.reader() as conn:
+            rows = conn.execute("""
+                SELECT embedding_id, embedding_vector FROM artifact_embeddings
+                WHERE typeof(embedding_vector) = 'text'
+            """).fetchall()
+        
+        stats = {"migrated": 0, "failed": 0}
+        
+        if rows:
+            logger.info(f"Migrating {len(rows)} JSON embeddings to float32 BLOBs")
+            
+            updates = []
+            for row in rows:
+                try:
+                    updates.append((encode_vector(json.loads(row[1])), row[0]))
+                except (ValueError, TypeError) as e:
+                    logger.error(f"Failed to migrate embedding {row[0]}: {e}")
+                    stats["failed"] += 1
+            
+            with self.db.transaction() as conn:
+                conn.executemany("""
+                    UPDATE artifact_embeddings SET embedding_vector = ?
+                    WHERE embedding_id = ?
+                """, updates)
+            stats["migrated"] = len(updates)
+            logger.info(f"Embedding migration complete: {stats}")
+        
+        if vacuum:
+            # VACUUM can't run inside a transaction
+            with self.db.exclusive() as conn:
+                conn.execute("VACUUM")
+        
+        return stats
     
     def generate_embedding(self, text: str) -> Optional[List[float]]:
         """
-        Generate embedding vector for text using OpenAI
+        Generate embedding vector for text with the configured provider
         
         Args:
             text: Text to embed (will be truncated to 8191 tokens)
         
-        Returns: List of floats (1536 dimensions) or None if failed
+        Returns: List of floats (embedding_dimension) or None if failed
         """
         try:
             # Truncate text if too long (OpenAI limit is ~8k tokens)
-            text_truncated = text[:30000]  # ~8k tokens max
-            
-            response = openai.embeddings.create(
-                model=self.embedding_model,
-                input=text_truncated
-            )
+            text_truncated = text[:MAX_EMBEDDING_CHARS]  # ~8k tokens max
             
-            embedding = response.data[0].embedding
+            embedding = self.provider.embed([text_truncated])[0]
             logger.info(f"Generated embedding: {len(embedding)} dimensions")
             return embedding
         
@@ -92,33 +353,95 @@ class CanonEmbeddings:
             logger.error(f"Failed to generate embedding: {e}")
             return None
     
-    def store_embedding(self, artifact_id: str, embedding: List[float]) -> bool:
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for many texts in a single API request
+        
+        Unlike generate_embedding, errors propagate so batch callers can
+        retry with backoff.
+        
+        Returns: One vector per input, in input order
+        """
+        return self.provider.embed([text[:MAX_EMBEDDING_CHARS] for text in texts])
+    
+    def embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embedding for a search query, served from the query cache when possible
+        
+        Returns: List of floats or None if generation failed
+        """
+        cached = self.get_cached_query_embedding(query)
+        if cached is not None:
+            return cached
+        
+        embedding = self.generate_embedding(query)
+        if embedding:
+            self.remember_query_embedding(query, embedding)
+        return embedding
+    
+    def get_cached_query_embedding(self, query: str) -> Optional[List[float]]:
+        """Cached query embedding for the current model, or None"""
+        if self.query_cache is None:
+            return None
+        return self.query_cache.get(self.embedding_model, query)
+    
+    def remember_query_embedding(self, query: str, embedding: List[float]):
+        """Add a freshly generated query embedding to the cache"""
+        if self.query_cache is not None:
+            self.query_cache.put(self.embedding_model, query, embedding)
+    
+    def _load_cached_query(self, model: str, query_text: str):
+        """Query cache backing store: read one entry (internal)"""
+        with self.db.reader() as conn:
+            row = conn.execute("""
+                SELECT embedding_vector, created_at FROM query_embedding_cache
+                WHERE embedding_model = ? AND query_text = ?
+            """, (model, query_text)).fetchone()
+        if not row:
+            return None
+        return decode_vector(row[0]).tolist(), row[1]
+    
+    def _save_cached_query(self, model: str, query_text: str,
+                           embedding: List[float], created_at: float):
+        """Query cache backing store: write one entry (internal)"""
+        with self.db.transaction() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO query_embedding_cache
+                (embedding_model, query_text, embedding_vector, created_at)
+                VALUES (?, ?, ?, ?)
+            """, (model, query_text, encode_vector(embedding), created_at))
+    
+    def store_embedding(self, artifact_id: str, embedding: List[float],
+                        content_checksum: str = None) -> bool:
         """
         Store embedding vector for an artifact
         
         Args:
             artifact_id: Artifact ID
             embedding: Vector (list of floats)
+            content_checksum: text_checksum() of the embedded text
         
         Returns: True if successful
         """
         try:
-            cursor = self.conn.cursor()
             embedding_id = f"emb_{artifact_id}"
             
-            # Serialize vector as JSON
-            import json
-            embedding_json = json.dumps(embedding)
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO artifact_embeddings
-                (embedding_id, artifact_id, embedding_vector, 
-                 embedding_model, embedding_dimension)
-                VALUES (?, ?, ?, ?, ?)
-            """, (embedding_id, artifact_id, embedding_json,
-                  self.embedding_model, len(embedding)))
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO artifact_embeddings
+                    (embedding_id, artifact_id, embedding_vector, embedding_provider,
+                     embedding_model, embedding_dimension, content_checksum)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (embedding_id, artifact_id, encode_vector(embedding),
+                      self.embedding_provider, self.embedding_model, len(embedding),
+                      content_checksum))
             
-            self.conn.commit()
+            with self._cache_lock:
+                if self.vector_cache is not None:
+                    if self.vector_cache.put(artifact_id, embedding):
+                        self.ann.add(artifact_id)
+                    self._update_partitions(self.partitions, self.vector_cache,
+                                            {artifact_id: artifact_id})
             logger.info(f"Stored embedding for {artifact_id}")
             return True
         
@@ -126,6 +449,105 @@ class CanonEmbeddings:
             logger.error(f"Failed to store embedding: {e}")
             return False
     
+    def store_embeddings(self, rows: List[tuple]) -> int:
+        """
+        Bulk-store embeddings in one transaction
+        
+        Joins the caller's db.transaction() (as a savepoint) if one is open.
+        
+        Args:
+            rows: (artifact_id, embedding, content_checksum) tuples
+        
+        Returns: Number of rows stored (0 on failure)
+        """
+        try:
+            with self.db.transaction() as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO artifact_embeddings
+                    (embedding_id, artifact_id, embedding_vector, embedding_provider,
+                     embedding_model, embedding_dimension, content_checksum)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, [(f"emb_{artifact_id}", artifact_id, encode_vector(embedding),
+                       self.embedding_provider, self.embedding_model, len(embedding),
+                       checksum)
+                      for artifact_id, embedding, checksum in rows])
+            
+            with self._cache_lock:
+                if self.vector_cache is not None:
+                    for artifact_id, embedding, _ in rows:
+                        if self.vector_cache.put(artifact_id, embedding):
+                            self.ann.add(artifact_id)
+                    self._update_partitions(self.partitions, self.vector_cache,
+                                            {artifact_id: artifact_id
+                                             for artifact_id, _, _ in rows})
+            logger.info(f"Stored {len(rows)} embeddings")
+            return len(rows)
+        
+        except Exception as e:
+            logger.error(f"Failed to store embeddings: {e}")
+            return 0
+    
+    def chunk_text(self, text: str) -> List[Tuple[int, int, str]]:
+        """Passage chunks of an artifact text: [(start_char, end_char, text)]"""
+        return [(start, end, text[start:end])
+                for start, end in split_into_chunks(text, self.chunk_chars, self.chunk_overlap)]
+    
+    @staticmethod
+    def embedding_inputs(text: str, chunks: List[Tuple[int, int, str]]) -> List[str]:
+        """
+        Texts to embed for one artifact: the whole text, then each chunk
+        
+        Single-chunk artifacts reuse the artifact vector for their chunk, so
+        short documents still cost one input.
+        """
+        if len(chunks) <= 1:
+            return [text]
+        return [text] + [chunk for _, _, chunk in chunks]
+    
+    def store_chunks(self, artifact_id: str, chunks: List[Tuple[int, int, str]],
+                     vectors: List[List[float]], content_checksum: str = None) -> bool:
+        """
+        Replace an artifact's passage chunks
+        
+        Args:
+            artifact_id: Artifact ID
+            chunks: chunk_text() output
+            vectors: One vector per chunk
+            content_checksum: text_checksum() of the full artifact text
+        
+        Returns: True if successful
+        """
+        try:
+            rows = [(f"{artifact_id}#{index}", artifact_id, index, start, end, text,
+                     encode_vector(vector), self.embedding_provider, self.embedding_model,
+                     len(vector), content_checksum)
+                    for index, ((start, end, text), vector) in enumerate(zip(chunks, vectors))]
+            
+            with self.db.transaction() as conn:
+                conn.execute("DELETE FROM artifact_chunks WHERE artifact_id = ?", (artifact_id,))
+                conn.executemany("""
+                    INSERT INTO artifact_chunks
+                    (chunk_id, artifact_id, chunk_index, start_char, end_char, chunk_text,
+                     embedding_vector, embedding_provider, embedding_model,
+                     embedding_dimension, content_checksum)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+            
+            # Chunks dropped by a shorter revision stay in the matrix until
+            # reload; passage_search discards ids missing from the table
+            with self._cache_lock:
+                if self.chunk_cache is not None:
+                    for row, vector in zip(rows, vectors):
+                        if self.chunk_cache.put(row[0], vector):
+                            self.chunk_ann.add(row[0])
+                    self._update_partitions(self.chunk_partitions, self.chunk_cache,
+                                            {row[0]: artifact_id for row in rows})
+            return True
+        
+        except Exception as e:
+            logger.error(f"Failed to store chunks for {artifact_id}: {e}")
+            return False
+    
     def get_embedding(self, artifact_id: str) -> Optional[np.ndarray]:
         """
         Retrieve embedding vector for an artifact
@@ -136,49 +558,102 @@ class CanonEmbeddings:
         Returns: NumPy array of embedding or None
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT embedding_vector FROM artifact_embeddings
-                WHERE artifact_id = ?
-            """, (artifact_id,))
+            with self.db.reader() as conn:
+                row = conn.execute("""
+                    SELECT embedding_vector FROM artifact_embeddings
+                    WHERE artifact_id = ?
+                """, (artifact_id,)).fetchone()
             
-            row = cursor.fetchone()
             if not row:
                 return None
             
-            import json
-            embedding = json.loads(row[0])
-            return np.array(embedding)
+            return decode_vector(row[0])
         
         except Exception as e:
             logger.error(f"Failed to get embedding: {e}")
             return None
     
-    def embed_artifact(self, artifact_id: str, artifact_text: str) -> bool:
+    def embed_artifact(self, artifact_id: str, artifact_text: str,
+                       force: bool = False) -> bool:
         """
         Generate and store embedding for an artifact
         
+        Skips the API call when the stored embedding was made from identical
+        text with the current model.
+        
         Args:
             artifact_id: Artifact ID
             artifact_text: Text to embed (title + summary + content)
+            force: Re-embed even if the stored embedding is current
         
-        Returns: True if successful
+        Returns: True if successful (including skipped-as-current)
         """
+        checksum = text_checksum(artifact_text)
+        
+        if not force and self.is_embedding_current(artifact_id, checksum):
+            logger.info(f"Embedding unchanged, skipping: {artifact_id}")
+            # Type/category may have changed without the text changing
+            self.refresh_partitions(artifact_id)
+            return True
+        
         logger.info(f"Embedding artifact: {artifact_id}")
         
-        # Generate embedding
-        embedding = self.generate_embedding(artifact_text)
-        if not embedding:
-            logger.error(f"Failed to embed artifact {artifact_id}")
+        # Generate artifact + passage embeddings in one request
+        chunks = self.chunk_text(artifact_text)
+        try:
+            vectors = self.generate_embeddings(self.embedding_inputs(artifact_text, chunks))
+        except Exception as e:
+            logger.error(f"Failed to embed artifact {artifact_id}: {e}")
             return False
         
-        # Store embedding
-        success = self.store_embedding(artifact_id, embedding)
-        return success
+        return self.store_artifact_vectors(artifact_id, chunks, vectors, checksum)
+    
+    def store_artifact_vectors(self, artifact_id: str, chunks: List[Tuple[int, int, str]],
+                               vectors: List[List[float]], content_checksum: str) -> bool:
+        """
+        Store the output of embedding_inputs(): artifact vector + chunk vectors
+        
+        Both are written in one transaction (nested in the caller's, if any).
+        
+        Returns: True if successful
+        """
+        chunk_vectors = vectors[1:] or vectors[:1]
+        try:
+            with self.db.transaction():
+                if not self.store_embeddings([(artifact_id, vectors[0], content_checksum)]):
+                    raise RuntimeError("artifact vector not stored")
+                if not self.store_chunks(artifact_id, chunks, chunk_vectors, content_checksum):
+                    raise RuntimeError("chunk vectors not stored")
+        except RuntimeError as e:
+            logger.error(f"Failed to store vectors for {artifact_id}: {e}")
+            return False
+        return True
+    
+    def is_embedding_current(self, artifact_id: str, content_checksum: str) -> bool:
+        """
+        True if the stored embedding and passage chunks match this text
+        checksum and provider/model
+        """
+        with self.db.reader() as conn:
+            row = conn.execute("""
+                SELECT 1 FROM artifact_embeddings
+                WHERE artifact_id = ? AND content_checksum = ?
+                  AND embedding_provider = ? AND embedding_model = ?
+                  AND EXISTS (
+                      SELECT 1 FROM artifact_chunks c
+                      WHERE c.artifact_id = artifact_embeddings.artifact_id
+                        AND c.content_checksum = artifact_embeddings.content_checksum
+                        AND c.embedding_provider = artifact_embeddings.embedding_provider
+                        AND c.embedding_model = artifact_embeddings.embedding_model
+                  )
+            """, (artifact_id, content_checksum, self.embedding_provider,
+                  self.embedding_model)).fetchone()
+        return row is not None
     
     def semantic_search(self, query: str, limit: int = 10,
                        artifact_type: str = None, category: str = None,
-                       min_similarity: float = 0.5) -> List[Dict[str, Any]]:
+                       min_similarity: float = 0.5, approximate: bool = None,
+                       nprobe: int = None) -> List[Dict[str, Any]]:
         """
         Semantic search using cosine similarity
         
@@ -188,182 +663,497 @@ class CanonEmbeddings:
             artifact_type: Filter by type (optional)
             category: Filter by category (optional)
             min_similarity: Minimum cosine similarity threshold (0-1)
+            approximate: Use the ANN index (None = instance default)
+            nprobe: ANN recall/latency knob (buckets probed, IVF only)
         
         Returns: List of artifacts with similarity scores
         """
         logger.info(f"Semantic search: query='{query}', limit={limit}")
         
-        # Step 1: Generate query embedding
-        query_embedding = self.generate_embedding(query)
+        # Step 1: Generate query embedding (cached for repeated queries)
+        query_embedding = self.embed_query(query)
         if not query_embedding:
             logger.error("Failed to generate query embedding")
             return []
         
-        query_vector = np.array(query_embedding)
+        results = self.search_by_vector(
+            query_embedding, limit=limit, artifact_type=artifact_type,
+            category=category, min_similarity=min_similarity,
+            approximate=approximate, nprobe=nprobe
+        )
         
-        # Step 2: Get all artifact embeddings
-        cursor = self.conn.cursor()
+        logger.info(f"Semantic search returned {len(results)} results")
+        return results
+    
+    def search_by_vector(self, query_embedding, limit: int = 10,
+                         artifact_type: str = None, category: str = None,
+                         min_similarity: float = 0.5, approximate: bool = None,
+                         nprobe: int = None) -> List[Dict[str, Any]]:
+        """
+        Rank artifacts against an already-computed query embedding
         
-        # Build query with filters
-        sql = """
-            SELECT ae.artifact_id, ae.embedding_vector, 
-                   a.title, a.type, a.category, a.summary, a.source
-            FROM artifact_embeddings ae
-            JOIN artifacts a ON ae.artifact_id = a.artifact_id
-            WHERE 1=1
+        Same arguments/results as semantic_search, minus the embedding call.
         """
-        params = []
+        # Step 2: Score cached vectors (exact: one matrix-vector product,
+        # approximate: only the rows in the closest ANN buckets)
+        cache, ann, partitions = self._artifact_matrix()
+        if not len(cache):
+            logger.warning("No embeddings found in database")
+            return []
         
-        if artifact_type:
-            sql += " AND a.type = ?"
-            params.append(artifact_type)
+        # Over-fetch slightly: embeddings without an artifact row are dropped below
+        hits = self._search_cache(
+            cache, ann, partitions, query_embedding, limit + 5,
+            min_similarity, artifact_type, category, approximate, nprobe
+        )
         
-        if category:
-            sql += " AND a.category = ?"
-            params.append(category)
+        # Step 3: Attach artifact metadata for the top hits only
+        artifacts = self._fetch_summaries([artifact_id for artifact_id, _ in hits])
         
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
+        results = []
+        for artifact_id, similarity in hits:
+            row = artifacts.get(artifact_id)
+            if not row or not self._matches(row, artifact_type, category):
+                continue
+            
+            results.append({
+                "artifact_id": artifact_id,
+                "title": row["title"],
+                "type": row["type"],
+                "category": row["category"],
+                "summary": row["summary"],
+                "source": row["source"],
+                "similarity": similarity,
+                "relevance_score": similarity * 10  # Scale to 0-10
+            })
         
-        if not rows:
-            logger.warning("No embeddings found in database")
+        return results[:limit]
+    
+    def passage_search(self, query: str, limit: int = 5,
+                       artifact_type: str = None, category: str = None,
+                       min_similarity: float = 0.5, passages_per_artifact: int = 2,
+                       approximate: bool = None, nprobe: int = None) -> List[Dict[str, Any]]:
+        """
+        Passage-level semantic search over artifact chunks
+        
+        Args:
+            query: Search query
+            limit: Max artifacts
+            artifact_type: Filter by type (optional)
+            category: Filter by category (optional)
+            min_similarity: Minimum cosine similarity for a passage
+            passages_per_artifact: Best-matching passages returned per artifact
+            approximate: Use the chunk ANN index (None = instance default)
+            nprobe: ANN recall/latency knob
+        
+        Returns: Artifacts ranked by their best passage, each with "passages":
+                 [{chunk_id, chunk_index, start_char, end_char, text, similarity}]
+        """
+        logger.info(f"Passage search: query='{query}', limit={limit}")
+        
+        query_embedding = self.embed_query(query)
+        if not query_embedding:
+            logger.error("Failed to generate query embedding")
             return []
         
-        # Step 3: Calculate cosine similarity for each artifact
-        import json
-        results = []
+        cache, chunk_ann, chunk_partitions = self._chunk_matrix()
+        if not len(cache):
+            logger.warning("No passage chunks found in database")
+            return []
         
-        for row in rows:
-            artifact_id = row[0]
-            embedding_json = row[1]
-            
-            # Deserialize embedding
-            embedding = np.array(json.loads(embedding_json))
+        # Several passages may come from one artifact: widen the candidate
+        # pool until it covers `limit` artifacts (or the whole cache)
+        fetch = max(limit * passages_per_artifact * 4, 20)
+        while True:
+            hits = self._search_cache(
+                cache, chunk_ann, chunk_partitions, query_embedding, fetch,
+                min_similarity, artifact_type, category, approximate, nprobe
+            )
             
-            # Calculate cosine similarity
-            similarity = self._cosine_similarity(query_vector, embedding)
+            chunks = self._fetch_chunks([chunk_id for chunk_id, _ in hits])
+            grouped: Dict[str, List[Dict[str, Any]]] = {}
+            for chunk_id, similarity in hits:
+                chunk = chunks.get(chunk_id)
+                if not chunk:
+                    continue  # Stale chunk from a since-shortened artifact
+                passages = grouped.setdefault(chunk["artifact_id"], [])
+                if len(passages) < passages_per_artifact:
+                    passages.append({
+                        "chunk_id": chunk_id,
+                        "chunk_index": chunk["chunk_index"],
+                        "start_char": chunk["start_char"],
+                        "end_char": chunk["end_char"],
+                        "text": chunk["chunk_text"],
+                        "similarity": similarity
+                    })
             
-            # Filter by minimum similarity
-            if similarity < min_similarity:
+            if len(grouped) >= limit or len(hits) < fetch or fetch >= len(cache):
+                break
+            fetch *= 2
+        
+        artifacts = self._fetch_summaries(list(grouped))
+        
+        results = []
+        for artifact_id, passages in grouped.items():
+            row = artifacts.get(artifact_id)
+            if not row or not self._matches(row, artifact_type, category):
                 continue
             
+            similarity = passages[0]["similarity"]
             results.append({
                 "artifact_id": artifact_id,
-                "title": row[2],
-                "type": row[3],
-                "category": row[4],
-                "summary": row[5],
-                "source": row[6],
-                "similarity": float(similarity),
-                "relevance_score": float(similarity * 10)  # Scale to 0-10
+                "title": row["title"],
+                "type": row["type"],
+                "category": row["category"],
+                "summary": row["summary"],
+                "source": row["source"],
+                "similarity": similarity,
+                "relevance_score": similarity * 10,
+                "passages": passages
             })
+            if len(results) >= limit:
+                break
         
-        # Step 4: Sort by similarity (descending) and limit
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        results = results[:limit]
-        
-        logger.info(f"Semantic search returned {len(results)} results")
+        logger.info(f"Passage search returned {len(results)} artifacts")
         return results
     
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
+    def get_chunk_cache(self) -> VectorCache:
+        """Return the resident passage matrix, loading it from SQLite on first use"""
+        return self._chunk_matrix()[0]
+    
+    def _chunk_matrix(self) -> Tuple[VectorCache, VectorIndex, PartitionIndex]:
+        """Passage (cache, ANN index, partitions), built together on first use (internal)"""
+        with self._cache_lock:
+            if self.chunk_cache is None:
+                chunk_db_path = f"{self.db_path}.chunks" if self.db_path != ":memory:" else None
+                cache = self._new_cache("artifact_chunks", "chunk_id", chunk_db_path)
+                
+                with self.db.reader() as conn:
+                    cursor = conn.execute("""
+                        SELECT chunk_id, embedding_vector FROM artifact_chunks
+                        WHERE embedding_provider = ? AND embedding_model = ?
+                          AND embedding_dimension = ?
+                    """, (self.embedding_provider, self.embedding_model,
+                          self.embedding_dimension))
+                    loaded = cache.load((row[0], decode_vector(row[1])) for row in cursor)
+                logger.info(f"Chunk cache loaded: {loaded} passages")
+                
+                chunk_ann = self._new_ann_index(cache, chunk_db_path)
+                chunk_partitions = self._build_partitions(cache, """
+                    SELECT c.chunk_id, a.type, a.category FROM artifact_chunks c
+                    JOIN artifacts a ON a.artifact_id = c.artifact_id
+                """)
+                self.chunk_ann, self.chunk_partitions = chunk_ann, chunk_partitions
+                self.chunk_cache = cache
+            return self.chunk_cache, self.chunk_ann, self.chunk_partitions
+    
+    def get_vector_cache(self) -> VectorCache:
+        """Return the resident vector matrix, loading it from SQLite on first use"""
+        return self._artifact_matrix()[0]
+    
+    def _artifact_matrix(self) -> Tuple[VectorCache, VectorIndex, PartitionIndex]:
+        """Artifact (cache, ANN index, partitions), built together on first use (internal)"""
+        with self._cache_lock:
+            if self.vector_cache is None:
+                cache = self._load_vector_cache()
+                ann = self._new_ann_index(cache, self.db_path)
+                partitions = self._build_partitions(cache, """
+                    SELECT artifact_id, type, category FROM artifacts
+                """)
+                self.ann, self.partitions = ann, partitions
+                self.vector_cache = cache
+            return self.vector_cache, self.ann, self.partitions
+    
+    def get_ann_index(self) -> VectorIndex:
+        """Return the ANN index (loading the vector cache if needed)"""
+        return self._artifact_matrix()[1]
+    
+    def invalidate_cache(self):
+        """Drop the resident matrices (e.g. after writes from another process)"""
+        with self._cache_lock:
+            self.vector_cache = None
+            self.ann = None
+            self.chunk_cache = None
+            self.chunk_ann = None
+            self.partitions = None
+            self.chunk_partitions = None
+    
+    def refresh_partitions(self, artifact_id: str):
+        """Re-read an artifact's type/category into the loaded partitions"""
+        with self._cache_lock:
+            if self.vector_cache is not None:
+                self._update_partitions(self.partitions, self.vector_cache,
+                                        {artifact_id: artifact_id})
+            if self.chunk_cache is not None:
+                with self.db.reader() as conn:
+                    rows = conn.execute(
+                        "SELECT chunk_id FROM artifact_chunks WHERE artifact_id = ?",
+                        (artifact_id,)
+                    ).fetchall()
+                self._update_partitions(self.chunk_partitions, self.chunk_cache,
+                                        {row[0]: artifact_id for row in rows})
+    
+    def _search_cache(self, cache, ann: VectorIndex, partitions: PartitionIndex,
+                      query_embedding, limit: int, min_similarity: float,
+                      artifact_type: str = None, category: str = None,
+                      approximate: bool = None, nprobe: int = None):
         """
-        Calculate cosine similarity between two vectors
-        
-        Args:
-            vec1: First vector
-            vec2: Second vector
+        Top hits from a resident matrix with type/category filters applied
         
-        Returns: Similarity score (0-1)
+        Plans:
+            unfiltered: exact scan or ANN search
+            prefilter:  selective filter - exact scan of the partition rows only
+                        (also avoids ANN probes that hold few matching rows)
+            postfilter: broad filter - normal exact/ANN search, masked
         """
-        # Normalize vectors
-        vec1_norm = vec1 / np.linalg.norm(vec1)
-        vec2_norm = vec2 / np.linalg.norm(vec2)
+        rows = partitions.rows(type=artifact_type, category=category)
+        if rows is None:
+            plan = "unfiltered"
+        else:
+            plan = plan_filtered_search(rows.size, len(cache), self.prefilter_max_selectivity)
+        self.filter_plans[plan] += 1
+        
+        if plan == "prefilter":
+            return cache.top_k(query_embedding, limit, min_similarity, rows=rows, prefilter=True)
+        
+        use_ann = self.approximate_search if approximate is None else approximate
+        if use_ann:
+            return ann.search(query_embedding, limit, min_similarity, rows=rows, nprobe=nprobe)
+        return cache.top_k(query_embedding, limit, min_similarity, rows=rows)
+    
+    @staticmethod
+    def _matches(row: sqlite3.Row, artifact_type: str = None, category: str = None) -> bool:
+        """Final filter check on fetched metadata (partitions may lag external writes)"""
+        if artifact_type and row["type"] != artifact_type:
+            return False
+        if category and row["category"] != category:
+            return False
+        return True
+    
+    def _build_partitions(self, cache, sql: str) -> PartitionIndex:
+        """Partition cache rows by type/category; `sql` yields (id, type, category)"""
+        partitions = PartitionIndex()
+        with self.db.reader() as conn:
+            for key, artifact_type, category in conn.execute(sql):
+                row = cache.row_of(key)
+                if row is not None:
+                    partitions.assign(row, type=artifact_type, category=category)
+        return partitions
+    
+    def _update_partitions(self, partitions: PartitionIndex, cache,
+                           keys: Dict[str, str]):
+        """Assign cache rows {cache key: artifact_id} to their artifact's partitions"""
+        if partitions is None or not keys:
+            return
+        
+        artifact_ids = sorted(set(keys.values()))
+        placeholders = ",".join("?" * len(artifact_ids))
+        with self.db.reader() as conn:
+            cursor = conn.execute(f"""
+                SELECT artifact_id, type, category FROM artifacts
+                WHERE artifact_id IN ({placeholders})
+            """, artifact_ids)
+            facets = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+        
+        for key, artifact_id in keys.items():
+            row = cache.row_of(key)
+            if row is not None:
+                artifact_type, category = facets.get(artifact_id, (None, None))
+                partitions.assign(row, type=artifact_type, category=category)
+    
+    def _load_vector_cache(self) -> VectorCache:
+        """Build the resident matrix from artifact_embeddings"""
+        cache = self._new_cache("artifact_embeddings", "artifact_id", self.db_path)
+        
+        with self.db.reader() as conn:
+            cursor = conn.execute("""
+                SELECT artifact_id, embedding_vector FROM artifact_embeddings
+                WHERE embedding_provider = ? AND embedding_model = ?
+                  AND embedding_dimension = ?
+            """, (self.embedding_provider, self.embedding_model, self.embedding_dimension))
+            loaded = cache.load((row[0], decode_vector(row[1])) for row in cursor)
+        logger.info(f"Vector cache loaded: {loaded} embeddings")
+        return cache
+    
+    def _new_cache(self, table: str, id_column: str, db_path: str):
+        """Empty resident matrix: float32 VectorCache or a quantized one"""
+        if not self.quantization:
+            return VectorCache(self.embedding_dimension)
+        
+        return create_quantized_cache(
+            self.quantization, self.embedding_dimension,
+            vector_loader=lambda ids: self._load_exact_vectors(table, id_column, ids),
+            db_path=db_path, **self.quantization_options
+        )
+    
+    def _new_ann_index(self, cache, db_path: str) -> VectorIndex:
+        """ANN index over a cache (quantized caches only support exact scans)"""
+        kind = "exact" if self.quantization else self.ann_index
+        return create_ann_index(kind, cache, db_path=db_path, **self.ann_options)
+    
+    def _load_exact_vectors(self, table: str, id_column: str,
+                            ids: List[str]) -> Dict[str, np.ndarray]:
+        """Stored float32 vectors for a re-rank shortlist"""
+        if not ids:
+            return {}
+        
+        placeholders = ",".join("?" * len(ids))
+        with self.db.reader() as conn:
+            rows = conn.execute(f"""
+                SELECT {id_column}, embedding_vector FROM {table}
+                WHERE {id_column} IN ({placeholders})
+            """, ids).fetchall()
+        
+        return {row[0]: decode_vector(row[1]) for row in rows}
+    
+    def _fetch_chunks(self, chunk_ids: List[str]) -> Dict[str, sqlite3.Row]:
+        """Load passage text/offsets for a small set of chunks"""
+        if not chunk_ids:
+            return {}
         
-        # Dot product
-        similarity = np.dot(vec1_norm, vec2_norm)
+        placeholders = ",".join("?" * len(chunk_ids))
+        with self.db.reader() as conn:
+            rows = conn.execute(f"""
+                SELECT chunk_id, artifact_id, chunk_index, start_char, end_char, chunk_text
+                FROM artifact_chunks
+                WHERE chunk_id IN ({placeholders})
+            """, chunk_ids).fetchall()
         
-        return similarity
+        return {row["chunk_id"]: row for row in rows}
+    
+    def _fetch_summaries(self, artifact_ids: List[str]) -> Dict[str, sqlite3.Row]:
+        """Load summary columns for a small set of artifacts"""
+        if not artifact_ids:
+            return {}
+        
+        placeholders = ",".join("?" * len(artifact_ids))
+        with self.db.reader() as conn:
+            rows = conn.execute(f"""
+                SELECT artifact_id, title, type, category, summary, source
+                FROM artifacts
+                WHERE artifact_id IN ({placeholders})
+            """, artifact_ids).fetchall()
+        
+        return {row["artifact_id"]: row for row in rows}
     
     def has_embedding(self, artifact_id: str) -> bool:
         """Check if artifact has an embedding"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(*) FROM artifact_embeddings
-            WHERE artifact_id = ?
-        """, (artifact_id,))
+        with self.db.reader() as conn:
+            count = conn.execute("""
+                SELECT COUNT(*) FROM artifact_embeddings
+                WHERE artifact_id = ?
+            """, (artifact_id,)).fetchone()[0]
         
-        count = cursor.fetchone()[0]
         return count > 0
     
-    def reindex_all(self, canon_index) -> Dict[str, int]:
+    def reindex_all(self, canon_index, incremental: bool = True,
+                    resume: bool = True, **pipeline_options) -> Dict[str, Any]:
         """
         Reindex all artifacts (generate embeddings for all)
         
+        Runs the batched EmbeddingPipeline: many artifacts per API request,
+        bounded concurrency under a tokens/minute budget, bulk writes and a
+        resumable checkpoint.
+        
         Args:
             canon_index: CanonIndex instance to read artifacts from
+            incremental: Only embed artifacts whose embedding is missing, was
+                made with another model, or whose text changed since.
+                False re-embeds everything.
+            resume: Continue an interrupted reindex from its checkpoint
+            **pipeline_options: EmbeddingPipeline knobs (batch_size,
+                max_concurrency, tokens_per_minute, max_retries, ...)
         
-        Returns: Stats {total, success, failed}
+        Returns: Stats {total, success, failed, skipped, requests, ...}
         """
-        logger.info("Reindexing all artifacts")
-        
-        # Get all artifacts
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT artifact_id, title, summary, content
-            FROM artifacts
-        """)
+        from wos.embedding_pipeline import EmbeddingPipeline
         
-        artifacts = cursor.fetchall()
+        logger.info(f"Reindexing all artifacts (incremental={incremental})")
         
-        stats = {"total": len(artifacts), "success": 0, "failed": 0}
-        
-        for row in artifacts:
-            artifact_id = row[0]
-            title = row[1] or ""
-            summary = row[2] or ""
-            content = row[3] or ""
-            
-            # Combine text for embedding
-            artifact_text = f"{title}\n{summary}\n{content}"
-            
-            # Generate and store embedding
-            success = self.embed_artifact(artifact_id, artifact_text)
-            
-            if success:
-                stats["success"] += 1
-            else:
-                stats["failed"] += 1
+        pipeline = EmbeddingPipeline(self, **pipeline_options)
+        stats = pipeline.run(job_id="reindex_all", incremental=incremental, resume=resume)
         
         logger.info(f"Reindex complete: {stats}")
         return stats
     
+    def embed_many(self, artifact_ids: List[str], incremental: bool = True,
+                   **pipeline_options) -> Dict[str, Any]:
+        """
+        Embed specific artifacts with the batched EmbeddingPipeline
+        
+        Args:
+            artifact_ids: Artifacts to embed (e.g. from CanonIndex.store_many)
+            incremental: Skip artifacts whose embedding is already current
+            **pipeline_options: EmbeddingPipeline knobs
+        
+        Returns: Stats {total, success, failed, skipped, requests, elapsed_seconds}
+        """
+        from wos.embedding_pipeline import EmbeddingPipeline
+        
+        pipeline = EmbeddingPipeline(self, **pipeline_options)
+        return pipeline.embed_artifacts(artifact_ids, incremental=incremental)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get embeddings statistics"""
-        cursor = self.conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) FROM artifact_embeddings")
-        total_embeddings = cursor.fetchone()[0]
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("SELECT COUNT(*) FROM artifact_embeddings")
+            total_embeddings = cursor.fetchone()[0]
+            
+            # Embeddings from another provider/model count as missing: they are
+            # never searched against this provider's query vectors
+            cursor.execute("""
+                SELECT COUNT(*) FROM artifacts a
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM artifact_embeddings ae
+                    WHERE ae.artifact_id = a.artifact_id
+                      AND ae.embedding_provider = ? AND ae.embedding_model = ?
+                )
+            """, (self.embedding_provider, self.embedding_model))
+            missing_embeddings = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM artifact_chunks")
+            total_chunks = cursor.fetchone()[0]
         
-        cursor.execute("""
-            SELECT COUNT(*) FROM artifacts a
-            WHERE NOT EXISTS (
-                SELECT 1 FROM artifact_embeddings ae
-                WHERE ae.artifact_id = a.artifact_id
-            )
-        """)
-        missing_embeddings = cursor.fetchone()[0]
+        vector_cache = None
+        if self.vector_cache is not None:
+            vector_cache = {
+                "rows": len(self.vector_cache),
+                "bytes": self.vector_cache.nbytes,
+                "quantization": self.quantization or "float32"
+            }
         
         return {
             "total_embeddings": total_embeddings,
             "missing_embeddings": missing_embeddings,
+            "total_chunks": total_chunks,
+            "embedding_provider": self.embedding_provider,
             "embedding_model": self.embedding_model,
-            "embedding_dimension": self.embedding_dimension
+            "embedding_dimension": self.embedding_dimension,
+            "vector_cache": vector_cache,
+            "filter_plans": dict(self.filter_plans),
+            "query_cache": self.query_cache.get_stats() if self.query_cache is not None else None
         }
     
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Persist the ANN indexes and release the shared database connection"""
+        with self._cache_lock:
+            for index in (self.ann, self.chunk_ann):
+                if index is not None:
+                    try:
+                        index.save()
+                    except Exception as e:
+                        logger.error(f"Failed to save ANN index: {e}")
+            self.invalidate_cache()
+        if self.db:
+            self.db.release()
+            self.db = None
+            self.conn = None
     
     def __del__(self):
-        self.close()
+        # Interpreter shutdown is no place for file I/O: only release the
+        # connection here (ANN state is saved on close() and periodically)
+        if getattr(self, "db", None):
+            self.db.release()
+            self.db = None
@@ -6,13 +6,98 @@ Implements Phase 4 Memory Layer - retrieval-first knowledge base
 
 import sqlite3
 import json
+import base64
 import logging
-from datetime import datetime
-from typing import Optional, Dict, List, Any
+import re
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, List, Any, Iterable, Iterator
+from itertools import islice
 import hashlib
+import uuid
+
+from wos.db import get_connection_manager
+from wos.content_codec import get_content_codec
+from wos.text_delta import make_delta, apply_delta
+from wos.retrieval_log import RetrievalLogWriter
 
 logger = logging.getLogger("wos.canon_index")
 
+# Columns list/search/lazy reads fetch up front
+SUMMARY_COLUMNS = ("artifact_id", "title", "type", "category", "summary", "source",
+                   "approval_status", "created_at", "updated_at", "version")
+
+# Columns list_artifacts returns
+LIST_COLUMNS = ("artifact_id", "title", "type", "category", "created_at")
+
+# A rewrite only creates a new version if one of these changed
+VERSIONED_FIELDS = ("title", "type", "category", "summary", "source", "source_url",
+                    "tags", "metadata", "checksum")
+
+# Every Nth version stores full content, bounding delta replay on old reads
+SNAPSHOT_INTERVAL = 16
+
+# Heavy / rarely needed columns, loaded by LazyArtifact on first access
+LAZY_COLUMNS = ("content", "metadata", "tags", "source_url", "expires_at",
+                "owner", "checksum")
+
+
+def _count_occurrences(text: str, needle: str) -> int:
+    """SQL wos_count(text, needle): case-insensitive occurrences (needle lowercase)"""
+    if not text or not needle:
+        return 0
+    return text.lower().count(needle)
+
+
+def _utc_timestamp(value: str) -> datetime:
+    """
+    Naive UTC datetime of a stored or caller timestamp
+    
+    Rows hold both isoformat() ("2025-01-02T03:04:05.123456") and
+    CURRENT_TIMESTAMP ("2025-01-02 03:04:05") values, which do not compare
+    correctly as strings. Raises ValueError if malformed.
+    """
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class LazyArtifact(dict):
+    """
+    Artifact dict that loads its heavy columns on first access
+    
+    Starts with whatever summary fields the query returned. Reading a
+    LAZY_COLUMNS key with [] or get() fetches all of them in one query.
+    Iteration, len() and json.dumps() only see loaded keys: call load()
+    for a complete artifact.
+    """
+    
+    def __init__(self, fields: Dict[str, Any], loader):
+        super().__init__(fields)
+        self._loader = loader
+        self.loaded = False
+    
+    def load(self) -> "LazyArtifact":
+        """Fetch the lazy columns now (no-op once loaded)"""
+        if not self.loaded:
+            self.loaded = True
+            self.update(self._loader(self["artifact_id"]) or {})
+        return self
+    
+    def __missing__(self, key):
+        if key in LAZY_COLUMNS and not self.loaded:
+            self.load()
+            if dict.__contains__(self, key):
+                return dict.__getitem__(self, key)
+        raise KeyError(key)
+    
+    def get(self, key, default=None):
+        if key in LAZY_COLUMNS and not self.loaded and not dict.__contains__(self, key):
+            self.load()
+        return dict.get(self, key, default)
+
+
 class CanonIndex:
     """
     Canon Index v0
@@ -22,17 +107,45 @@ class CanonIndex:
     Enables retrieval-first decision making.
     """
     
-    def __init__(self, db_path: str = "canon.db"):
+    def __init__(self, db_path: str = "canon.db", async_retrieval_log: bool = True,
+                 compression: str = None):
+        """
+        Args:
+            db_path: SQLite database path
+            async_retrieval_log: Write retrieval audit rows from a background
+                thread in batches (False = insert inline, per retrieval)
+            compression: Compress stored content: None, "zlib" or "zstd"
+                (reads are transparent either way, see wos.content_codec)
+        """
         self.db_path = db_path
+        self.compression = compression
+        self.db = None
         self.conn = None
+        self.codec = None
+        self.fts_enabled = False
+        self.retrieval_log = None
         self.init_db()
+        
+        if async_retrieval_log:
+            self.retrieval_log = RetrievalLogWriter(self.db)
     
     def init_db(self):
         """Initialize SQLite database with Canon Index schema"""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
-        cursor = self.conn.cursor()
+        # Shared with CanonEmbeddings / IntentRegistry on the same file
+        # (WAL, pragmas, serialized writer - see wos.db)
+        self.db = get_connection_manager(self.db_path)
+        self.conn = self.db.writer
+        # Registers wos_decompress() (used by the FTS view and search) first
+        self.codec = get_content_codec(self.db, self.compression)
+        self.db.create_function("wos_count", 2, _count_occurrences)
+        
+        with self.db.transaction() as conn:
+            self._create_schema(conn.cursor())
         
+        logger.info(f"Canon Index initialized at {self.db_path}")
+    
+    def _create_schema(self, cursor):
+        """Create tables, indexes and the FTS index (internal)"""
         # Artifacts table - central knowledge store
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS artifacts (
@@ -55,6 +168,47 @@ class CanonIndex:
             )
         """)
         
+        # Compressed content (NULL = plain text) and its uncompressed size
+        try:
+            cursor.execute("ALTER TABLE artifacts ADD COLUMN content_encoding TEXT")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
+        try:
+            cursor.execute("ALTER TABLE artifacts ADD COLUMN content_size INTEGER")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
+        # Current version number (artifact_versions holds the chain)
+        try:
+            cursor.execute("ALTER TABLE artifacts ADD COLUMN version INTEGER DEFAULT 1")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
+        # Append-only version chain: line deltas against the previous version,
+        # full snapshots where base_version IS NULL (content via ContentCodec)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS artifact_versions (
+                artifact_id TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                base_version INTEGER,
+                delta BLOB NOT NULL,
+                delta_encoding TEXT,
+                title TEXT,
+                type TEXT,
+                category TEXT,
+                summary TEXT,
+                source TEXT,
+                source_url TEXT,
+                tags TEXT,
+                metadata JSON,
+                checksum TEXT,
+                content_size INTEGER,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (artifact_id, version)
+            )
+        """)
+        
         # Artifact retrieval log (audit trail)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS retrieval_log (
@@ -83,7 +237,7 @@ class CanonIndex:
             )
         """)
         
-        # Search index (for fast lookups)
+        # Legacy search index (superseded by artifacts_fts, no longer written)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS search_index (
                 idx_id TEXT PRIMARY KEY,
@@ -97,11 +251,96 @@ class CanonIndex:
         # Create indexes for performance
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_artifact_type ON artifacts(type)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_artifact_category ON artifacts(category)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_artifact_created ON artifacts(created_at)")
+        # Keyset pagination order (iter_artifacts); supersedes idx_artifact_created
+        cursor.execute("DROP INDEX IF EXISTS idx_artifact_created")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_artifact_created_id
+            ON artifacts(created_at, artifact_id)
+        """)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_artifact_approval ON artifacts(approval_status)")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_versions_time
+            ON artifact_versions(artifact_id, created_at)
+        """)
         
-        self.conn.commit()
-        logger.info(f"Canon Index initialized at {self.db_path}")
+        # Relationship lookups/traversal walk edges from either end
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rel_source
+            ON artifact_relationships(source_artifact_id, relationship_type)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rel_target
+            ON artifact_relationships(target_artifact_id, relationship_type)
+        """)
+        
+        self.fts_enabled = self._init_fts(cursor)
+    
+    def _init_fts(self, cursor) -> bool:
+        """
+        Create the FTS5 full-text index over artifacts (internal)
+        
+        External-content table over the artifacts_text view (artifacts with
+        content decompressed) keyed by artifacts.rowid, so text is stored
+        once. _write_artifacts() keeps it in sync with plain SQL: there are
+        no triggers on artifacts, so other SQLite clients can still write it
+        (without wos_decompress()); their inserts/deletes are picked up by a
+        rebuild on the next open, edits by rebuild_fts(). Returns False if
+        this SQLite build lacks FTS5 (search then falls back to LIKE scans).
+        """
+        cursor.execute("""
+            CREATE VIEW IF NOT EXISTS artifacts_text AS
+            SELECT rowid AS artifact_rowid, title, summary,
+                   wos_decompress(content, content_encoding) AS content, tags
+            FROM artifacts
+        """)
+        
+        cursor.execute("""
+            SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'artifacts_fts'
+        """)
+        row = cursor.fetchone()
+        exists = row is not None and "artifacts_text" in row[0]
+        
+        # Sync triggers of older versions called wos_decompress(), which
+        # broke writes from any client without it
+        for trigger in ("artifacts_fts_ai", "artifacts_fts_ad", "artifacts_fts_au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        
+        if row is not None and not exists:
+            # Index predates compression (read artifacts directly): recreate
+            cursor.execute("DROP TABLE artifacts_fts")
+            logger.info("Recreating FTS5 index over decompressed content")
+        
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS artifacts_fts USING fts5(
+                    title, summary, content, tags,
+                    content='artifacts_text', content_rowid='artifact_rowid',
+                    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, text search uses LIKE scans: {e}")
+            return False
+        
+        # Backfill artifacts stored before the FTS table existed, or
+        # added / deleted by another client since
+        if exists:
+            indexed = cursor.execute("SELECT COUNT(*) FROM artifacts_fts_docsize").fetchone()[0]
+            stored = cursor.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+        if not exists or indexed != stored:
+            cursor.execute("INSERT INTO artifacts_fts (artifacts_fts) VALUES ('rebuild')")
+            logger.info("Built FTS5 index for existing artifacts")
+        
+        return True
+    
+    def rebuild_fts(self) -> bool:
+        """Rebuild the full-text index from the artifacts table"""
+        if not self.fts_enabled:
+            return False
+        with self.db.transaction() as conn:
+            conn.execute("INSERT INTO artifacts_fts (artifacts_fts) VALUES ('rebuild')")
+        logger.info("FTS5 index rebuilt")
+        return True
     
     def store_artifact(self, artifact_id: str, title: str, content: str,
                       artifact_type: str = "document", category: str = None,
@@ -109,7 +348,10 @@ class CanonIndex:
                       source_url: str = None, tags: List[str] = None,
                       metadata: Dict = None) -> bool:
         """
-        Store a new artifact in Canon Index
+        Store an artifact in Canon Index (new, or a new version of an existing one)
+        
+        Rewrites keep created_at; a changed artifact gets the next version
+        in its history (see get_artifact_version), an identical one is a no-op.
         
         Args:
             artifact_id: Unique artifact identifier
@@ -126,29 +368,14 @@ class CanonIndex:
         Returns: True if successful
         """
         try:
-            cursor = self.conn.cursor()
-            
-            # Generate checksum for content integrity
-            checksum = hashlib.sha256(content.encode()).hexdigest()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO artifacts 
-                (artifact_id, title, type, category, content, summary, 
-                 source, source_url, tags, metadata, checksum, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                artifact_id, title, artifact_type, category, content,
-                summary, source, source_url,
-                json.dumps(tags) if tags else None,
-                json.dumps(metadata) if metadata else None,
-                checksum,
-                datetime.utcnow().isoformat()
-            ))
+            row = self._artifact_row(
+                artifact_id, title, content, artifact_type, category, summary,
+                source, source_url, tags, metadata
+            )
             
-            # Update search index
-            self._index_artifact(artifact_id, title, content, tags or [])
+            with self.db.transaction() as conn:
+                self._write_artifacts(conn, [row])
             
-            self.conn.commit()
             logger.info(f"Stored artifact: {artifact_id}")
             return True
         
@@ -156,8 +383,274 @@ class CanonIndex:
             logger.error(f"Failed to store artifact {artifact_id}: {e}")
             return False
     
+    def store_many(self, artifacts: Iterable[Dict[str, Any]],
+                   batch_size: int = 500) -> Dict[str, Any]:
+        """
+        Bulk-import artifacts in a single transaction
+        
+        Streams the iterable through executemany in batches of `batch_size`
+        (FTS rows included), and the whole import commits
+        once: a database error rolls everything back. Entries with missing/invalid fields are skipped and counted.
+        
+        Args:
+            artifacts: Dicts of store_artifact() keyword arguments
+                (artifact_id, title, content, artifact_type, category, ...)
+            batch_size: Artifacts per executemany call
+        
+        Returns: Stats {stored, unchanged, failed, artifact_ids, elapsed_seconds,
+                        rows_per_second} (+ error if the import rolled back);
+                 stored counts new/changed rows, unchanged the no-op rewrites,
+                 artifact_ids lists both
+        """
+        start = time.monotonic()
+        updated_at = datetime.utcnow().isoformat()
+        stats = {"stored": 0, "unchanged": 0, "failed": 0, "artifact_ids": []}
+        rows = []
+        
+        try:
+            with self.db.transaction() as conn:
+                for artifact in artifacts:
+                    try:
+                        rows.append(self._artifact_row(updated_at=updated_at, **artifact))
+                    except (TypeError, ValueError, KeyError, AttributeError) as e:
+                        logger.error(f"Skipping invalid artifact in bulk import: {e}")
+                        stats["failed"] += 1
+                        continue
+                    
+                    if len(rows) >= batch_size:
+                        self._write_batch(conn, rows, stats)
+                        rows = []
+                
+                if rows:
+                    self._write_batch(conn, rows, stats)
+        
+        except Exception as e:
+            logger.error(f"Bulk import rolled back: {e}")
+            stats["failed"] += len(stats["artifact_ids"]) + len(rows)
+            stats["stored"] = 0
+            stats["unchanged"] = 0
+            stats["artifact_ids"] = []
+            stats["error"] = str(e)
+        
+        elapsed = time.monotonic() - start
+        stats["elapsed_seconds"] = round(elapsed, 3)
+        stats["rows_per_second"] = round(stats["stored"] / elapsed, 1) if elapsed > 0 else None
+        logger.info(f"Bulk stored {stats['stored']} artifacts "
+                    f"({stats['unchanged']} unchanged, {stats['failed']} failed, "
+                    f"{stats['rows_per_second']} rows/s)")
+        return stats
+    
+    def _write_batch(self, conn, rows: List[Dict[str, Any]], stats: Dict[str, Any]):
+        """store_many() batch: write and count stored / unchanged rows (internal)"""
+        written = self._write_artifacts(conn, rows)
+        stats["stored"] += written
+        stats["unchanged"] += len(rows) - written
+        stats["artifact_ids"] += [row["artifact_id"] for row in rows]
+    
+    def _artifact_row(self, artifact_id: str, title: str, content: str,
+                      artifact_type: str = "document", category: str = None,
+                      summary: str = None, source: str = None,
+                      source_url: str = None, tags: List[str] = None,
+                      metadata: Dict = None, updated_at: str = None) -> Dict[str, Any]:
+        """Parameters for the artifacts upsert, plus the plain text (internal)"""
+        if not artifact_id or title is None or content is None:
+            raise ValueError(f"artifact_id, title and content are required ({artifact_id})")
+        
+        # Generate checksum for content integrity (of the plain text)
+        raw = content.encode()
+        checksum = hashlib.sha256(raw).hexdigest()
+        stored, encoding = self.codec.encode(content)
+        
+        return {
+            "artifact_id": artifact_id,
+            "title": title,
+            "type": artifact_type,
+            "category": category,
+            "content": stored,
+            "content_encoding": encoding,
+            "content_size": len(raw),
+            "summary": summary,
+            "source": source,
+            "source_url": source_url,
+            "tags": json.dumps(tags) if tags else None,
+            "metadata": json.dumps(metadata) if metadata else None,
+            "checksum": checksum,
+            "updated_at": updated_at or datetime.utcnow().isoformat(),
+            "text": content
+        }
+    
+    def _write_artifacts(self, conn, rows: List[Dict[str, Any]]) -> int:
+        """
+        Upsert artifact rows and append their versions (internal)
+        
+        A row identical to the stored artifact is skipped. A changed one
+        keeps created_at (and approval, unless the content changed) and gets
+        the next version: a line delta against the previous version, or a
+        full snapshot every SNAPSHOT_INTERVAL versions / when the delta is
+        no smaller than the content. The FTS index is updated in the same
+        transaction.
+        
+        Returns: Number of rows written (changed or new)
+        """
+        current = self._current_rows(conn, [row["artifact_id"] for row in rows])
+        stored = dict(current)
+        upserts, versions = [], []
+        
+        for row in rows:
+            old = current.get(row["artifact_id"])
+            if old and all(old[field] == row[field] for field in VERSIONED_FIELDS):
+                continue
+            
+            if old is None:
+                row["version"], row["head"], row["last_snapshot"] = 1, 1, 1
+                versions.append(self._version_row(row, 1, None, row["content"],
+                                                  row["content_encoding"]))
+            else:
+                head, last_snapshot = old["head"], old["last_snapshot"]
+                if head is None:
+                    # Stored before versioning: its current state starts the chain
+                    head = last_snapshot = old["version"] or 1
+                    versions.append(self._version_row(old, head, None, old["content"],
+                                                      old["content_encoding"]))
+                
+                version = head + 1
+                delta = None
+                if version - last_snapshot < SNAPSHOT_INTERVAL:
+                    old_text = old.get("text")
+                    if old_text is None:
+                        old_text = old["text"] = self.codec.decode(old["content"],
+                                                                   old["content_encoding"])
+                    delta = make_delta(old_text, row["text"])
+                    if len(delta) >= len(row["text"]):
+                        delta = None
+                
+                if delta is None:
+                    versions.append(self._version_row(row, version, None, row["content"],
+                                                      row["content_encoding"]))
+                    last_snapshot = version
+                else:
+                    versions.append(self._version_row(row, version, head,
+                                                      *self.codec.encode(delta)))
+                row["version"], row["head"], row["last_snapshot"] = version, version, last_snapshot
+            
+            upserts.append(row)
+            # Later rows of the same batch build on this one
+            current[row["artifact_id"]] = row
+        
+        conn.executemany("""
+            INSERT INTO artifacts 
+            (artifact_id, title, type, category, content, content_encoding, content_size,
+             summary, source, source_url, tags, metadata, checksum, updated_at, version)
+            VALUES (:artifact_id, :title, :type, :category, :content, :content_encoding,
+                    :content_size, :summary, :source, :source_url, :tags, :metadata,
+                    :checksum, :updated_at, :version)
+            ON CONFLICT(artifact_id) DO UPDATE SET
+                title = excluded.title, type = excluded.type, category = excluded.category,
+                content = excluded.content, content_encoding = excluded.content_encoding,
+                content_size = excluded.content_size, summary = excluded.summary,
+                source = excluded.source, source_url = excluded.source_url,
+                tags = excluded.tags, metadata = excluded.metadata,
+                approval_status = CASE WHEN checksum = excluded.checksum
+                                       THEN approval_status ELSE 'draft' END,
+                checksum = excluded.checksum, updated_at = excluded.updated_at,
+                version = excluded.version
+        """, upserts)
+        
+        conn.executemany("""
+            INSERT INTO artifact_versions
+            (artifact_id, version, base_version, delta, delta_encoding, title, type,
+             category, summary, source, source_url, tags, metadata, checksum,
+             content_size, created_at)
+            VALUES (:artifact_id, :version, :base_version, :delta, :delta_encoding, :title,
+                    :type, :category, :summary, :source, :source_url, :tags, :metadata,
+                    :checksum, :content_size, :created_at)
+        """, versions)
+        
+        if self.fts_enabled and upserts:
+            self._index_fts(conn, stored, {row["artifact_id"]: row for row in upserts})
+        
+        return len(upserts)
+    
+    def _index_fts(self, conn, stored: Dict[str, Dict[str, Any]],
+                   written: Dict[str, Dict[str, Any]]):
+        """Replace the FTS entries of written artifacts with their plain text (internal)"""
+        deletes = []
+        for artifact_id in written:
+            old = stored.get(artifact_id)
+            if old is None:
+                continue
+            old_text = old.get("text")
+            if old_text is None:
+                old_text = self.codec.decode(old["content"], old["content_encoding"])
+            deletes.append((old["artifact_rowid"], old["title"], old["summary"],
+                            old_text, old["tags"]))
+        
+        conn.executemany("""
+            INSERT INTO artifacts_fts (artifacts_fts, rowid, title, summary, content, tags)
+            VALUES ('delete', ?, ?, ?, ?, ?)
+        """, deletes)
+        
+        inserts = []
+        artifact_ids = list(written)
+        for offset in range(0, len(artifact_ids), 500):
+            page = artifact_ids[offset:offset + 500]
+            placeholders = ",".join("?" * len(page))
+            for rowid, artifact_id in conn.execute(f"""
+                SELECT rowid, artifact_id FROM artifacts WHERE artifact_id IN ({placeholders})
+            """, page):
+                row = written[artifact_id]
+                inserts.append((rowid, row["title"], row["summary"], row["text"], row["tags"]))
+        
+        conn.executemany("""
+            INSERT INTO artifacts_fts (rowid, title, summary, content, tags)
+            VALUES (?, ?, ?, ?, ?)
+        """, inserts)
+    
+    def _current_rows(self, conn, artifact_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Stored rows of these artifacts with their chain head / last snapshot (internal)"""
+        current = {}
+        unique_ids = list(dict.fromkeys(artifact_ids))
+        for offset in range(0, len(unique_ids), 500):
+            page = unique_ids[offset:offset + 500]
+            placeholders = ",".join("?" * len(page))
+            for row in conn.execute(f"""
+                SELECT a.rowid AS artifact_rowid, a.*,
+                       (SELECT MAX(version) FROM artifact_versions v
+                        WHERE v.artifact_id = a.artifact_id) AS head,
+                       (SELECT MAX(version) FROM artifact_versions v
+                        WHERE v.artifact_id = a.artifact_id AND v.base_version IS NULL)
+                           AS last_snapshot
+                FROM artifacts a WHERE a.artifact_id IN ({placeholders})
+            """, page):
+                current[row["artifact_id"]] = dict(row)
+        return current
+    
+    @staticmethod
+    def _version_row(row: Dict[str, Any], version: int, base_version: Optional[int],
+                     delta: Any, delta_encoding: Optional[str]) -> Dict[str, Any]:
+        """Parameters for an artifact_versions insert (internal)"""
+        return {
+            "artifact_id": row["artifact_id"],
+            "version": version,
+            "base_version": base_version,
+            "delta": delta,
+            "delta_encoding": delta_encoding,
+            "title": row["title"],
+            "type": row["type"],
+            "category": row["category"],
+            "summary": row["summary"],
+            "source": row["source"],
+            "source_url": row["source_url"],
+            "tags": row["tags"],
+            "metadata": row["metadata"],
+            "checksum": row["checksum"],
+            "content_size": row["content_size"],
+            "created_at": row["updated_at"]
+        }
+    
     def get_artifact(self, artifact_id: str, log_retrieval: bool = True,
-                    request_id: str = None, execution_id: str = None) -> Optional[Dict]:
+                    request_id: str = None, execution_id: str = None,
+                    lazy: bool = False) -> Optional[Dict]:
         """
         Retrieve full artifact by ID
         
@@ -166,24 +659,24 @@ class CanonIndex:
             log_retrieval: Whether to log this retrieval (for audit)
             request_id: Request ID for audit trail
             execution_id: Execution ID for audit trail
+            lazy: Fetch summary columns only; content/metadata/tags load on
+                first access (LazyArtifact)
         
         Returns: Artifact dict or None if not found
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM artifacts WHERE artifact_id = ?", (artifact_id,))
-        row = cursor.fetchone()
+        columns = ", ".join(SUMMARY_COLUMNS) if lazy else "*"
+        with self.db.reader() as conn:
+            row = conn.execute(f"SELECT {columns} FROM artifacts WHERE artifact_id = ?",
+                               (artifact_id,)).fetchone()
         
         if not row:
             logger.warning(f"Artifact not found: {artifact_id}")
             return None
         
-        artifact = dict(row)
-        
-        # Parse JSON fields
-        if artifact.get("tags"):
-            artifact["tags"] = json.loads(artifact["tags"])
-        if artifact.get("metadata"):
-            artifact["metadata"] = json.loads(artifact["metadata"])
+        if lazy:
+            artifact = LazyArtifact(dict(row), self._load_lazy_columns)
+        else:
+            artifact = self._from_row(row)
         
         # Log retrieval for audit trail
         if log_retrieval:
@@ -192,83 +685,168 @@ class CanonIndex:
         logger.info(f"Retrieved artifact: {artifact_id}")
         return artifact
     
+    def get_artifact_version(self, artifact_id: str, version: int = None,
+                             as_of: str = None) -> Optional[Dict]:
+        """
+        Artifact as it was at a given version or point in time
+        
+        Rebuilds content from the nearest snapshot at or below the version
+        plus at most SNAPSHOT_INTERVAL - 1 deltas. (The latest state is
+        get_artifact: one lookup, no replay.)
+        
+        Args:
+            artifact_id: Artifact ID
+            version: Version number (see list_versions)
+            as_of: ISO timestamp: the newest version written at or before it
+                (used when version is None; both None = latest version)
+        
+        Returns: Artifact dict with "version" (updated_at = when that version
+                 was written), or None if there is no such version
+        """
+        as_of_time = None
+        if as_of is not None:
+            try:
+                as_of_time = _utc_timestamp(as_of)
+            except ValueError:
+                logger.error(f"Invalid as_of timestamp: {as_of}")
+                return None
+            # One format for SQLite's julianday() (stored values mix 'T' and ' ')
+            as_of = as_of_time.isoformat(sep=" ")
+        
+        with self.db.reader() as conn:
+            if version is None:
+                version = conn.execute("""
+                    SELECT MAX(version) FROM artifact_versions
+                    WHERE artifact_id = ? AND (? IS NULL OR julianday(created_at) <= julianday(?))
+                """, (artifact_id, as_of, as_of)).fetchone()[0]
+            
+            rows = []
+            if version is not None:
+                rows = conn.execute("""
+                    SELECT * FROM artifact_versions
+                    WHERE artifact_id = ? AND version <= ? AND version >= (
+                        SELECT MAX(version) FROM artifact_versions
+                        WHERE artifact_id = ? AND version <= ? AND base_version IS NULL
+                    )
+                    ORDER BY version
+                """, (artifact_id, version, artifact_id, version)).fetchall()
+        
+        if not rows or rows[-1]["version"] != version:
+            # Never rewritten since versioning began: only its current state exists
+            artifact = self.get_artifact(artifact_id, log_retrieval=False)
+            if (artifact and version in (None, artifact.get("version")) and
+                    (as_of_time is None or
+                     _utc_timestamp(artifact["updated_at"]) <= as_of_time)):
+                return artifact
+            logger.warning(f"Artifact version not found: {artifact_id} v{version} (as of {as_of})")
+            return None
+        
+        content = None
+        for row in rows:
+            data = self.codec.decode(row["delta"], row["delta_encoding"])
+            content = data if row["base_version"] is None else apply_delta(content, data)
+        
+        latest = rows[-1]
+        if hashlib.sha256(content.encode()).hexdigest() != latest["checksum"]:
+            logger.error(f"Version chain of {artifact_id} is corrupt at v{version}")
+            return None
+        
+        artifact = {key: latest[key] for key in ("artifact_id", "title", "type", "category",
+                                                 "summary", "source", "source_url", "tags",
+                                                 "metadata", "checksum", "version")}
+        artifact["content"] = content
+        artifact["updated_at"] = latest["created_at"]
+        return self._parse_json_fields(artifact)
+    
+    def list_versions(self, artifact_id: str) -> List[Dict]:
+        """
+        Version history of an artifact, newest first
+        
+        Returns: [{version, created_at, title, checksum, content_size,
+                   stored_bytes, snapshot}]
+        """
+        with self.db.reader() as conn:
+            rows = conn.execute("""
+                SELECT version, created_at, title, checksum, content_size,
+                       length(CAST(delta AS BLOB)) AS stored_bytes,
+                       base_version IS NULL AS snapshot
+                FROM artifact_versions WHERE artifact_id = ?
+                ORDER BY version DESC
+            """, (artifact_id,)).fetchall()
+        
+        return [dict(row, snapshot=bool(row["snapshot"])) for row in rows]
+    
+    def _load_lazy_columns(self, artifact_id: str) -> Optional[Dict[str, Any]]:
+        """LazyArtifact loader: the LAZY_COLUMNS of one artifact (internal)"""
+        with self.db.reader() as conn:
+            row = conn.execute(f"""
+                SELECT {", ".join(LAZY_COLUMNS)}, content_encoding
+                FROM artifacts WHERE artifact_id = ?
+            """, (artifact_id,)).fetchone()
+        return self._from_row(row) if row else None
+    
+    def _from_row(self, row) -> Dict[str, Any]:
+        """Artifact dict from a row: content decoded, JSON fields parsed,
+        storage-only columns dropped (internal)"""
+        artifact = dict(row)
+        encoding = artifact.pop("content_encoding", None)
+        artifact.pop("content_size", None)
+        if "content" in artifact:
+            artifact["content"] = self.codec.decode(artifact["content"], encoding)
+        return self._parse_json_fields(artifact)
+    
+    @staticmethod
+    def _parse_json_fields(artifact: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode the JSON tags/metadata columns in place (internal)"""
+        if artifact.get("tags"):
+            artifact["tags"] = json.loads(artifact["tags"])
+        if artifact.get("metadata"):
+            artifact["metadata"] = json.loads(artifact["metadata"])
+        return artifact
+    
     def search_artifacts(self, query: str, limit: int = 10,
                         artifact_type: str = None, category: str = None,
                         request_id: str = None, execution_id: str = None) -> List[Dict]:
         """
         Search Canon Index for relevant artifacts
         
+        Full-text search (FTS5, BM25-ranked) over title, summary, content and tags.
+        
+        Query syntax:
+            brand voice       all terms must match (any order)
+            "brand voice"     exact phrase
+            play*             prefix match
+        
         Args:
-            query: Search query (simple text matching for v0)
+            query: Search query
             limit: Max results to return
             artifact_type: Filter by type (optional)
             category: Filter by category (optional)
             request_id: Request ID for audit
             execution_id: Execution ID for audit
         
-        Returns: List of artifact summaries with relevance scores
+        Returns: Artifact summaries (LazyArtifact) with relevance scores and snippets
         """
         try:
-            query_lower = query.lower()
-            
-            # Build query
-            sql = "SELECT * FROM artifacts WHERE "
-            params = []
+            if self.fts_enabled:
+                match = self._fts_query(query)
+                if not match:
+                    return []
+                try:
+                    results = self._search_fts(match, limit, artifact_type, category)
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"FTS query failed ({e}), falling back to LIKE")
+                    results = self._search_like(query, limit, artifact_type, category)
+            else:
+                results = self._search_like(query, limit, artifact_type, category)
             
-            # Search in title and summary
-            sql += "(LOWER(title) LIKE ? OR LOWER(summary) LIKE ?)"
-            params.append(f"%{query_lower}%")
-            params.append(f"%{query_lower}%")
-            
-            # Filter by type if specified
-            if artifact_type:
-                sql += " AND type = ?"
-                params.append(artifact_type)
-            
-            # Filter by category if specified
-            if category:
-                sql += " AND category = ?"
-                params.append(category)
-            
-            # Order by recency, limit results
-            sql += " ORDER BY created_at DESC LIMIT ?"
-            params.append(limit)
-            
-            cursor = self.conn.cursor()
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-            
-            # Convert to dicts with relevance scores
-            results = []
-            for row in rows:
-                artifact = dict(row)
-                
-                # Calculate relevance score (simple: how many times query appears)
-                content_text = (artifact.get("title", "") + " " + 
-                               artifact.get("summary", "") + " " + 
-                               artifact.get("content", "")).lower()
-                relevance_score = min(10.0, content_text.count(query_lower) * 2.0)
-                
-                artifact["relevance_score"] = relevance_score
-                
-                # Log retrieval
-                if request_id or execution_id:
+            # Log retrieval
+            if request_id or execution_id:
+                for result in results:
                     self._log_retrieval(
-                        artifact["artifact_id"], "search",
-                        request_id, execution_id, relevance_score
+                        result["artifact_id"], "search",
+                        request_id, execution_id, result["relevance_score"]
                     )
-                
-                # Return summary, not full content
-                results.append({
-                    "artifact_id": artifact["artifact_id"],
-                    "title": artifact["title"],
-                    "type": artifact["type"],
-                    "category": artifact["category"],
-                    "summary": artifact.get("summary", artifact["content"][:200]),
-                    "source": artifact.get("source"),
-                    "relevance_score": relevance_score,
-                    "created_at": artifact["created_at"]
-                })
             
             logger.info(f"Search found {len(results)} artifacts for: {query}")
             return results
@@ -277,6 +855,158 @@ class CanonIndex:
             logger.error(f"Search failed: {e}", exc_info=True)
             return []
     
+    def _search_fts(self, match: str, limit: int, artifact_type: str = None,
+                    category: str = None) -> List[Dict]:
+        """BM25-ranked FTS5 query (internal)"""
+        # Column weights: title, summary, content, tags
+        sql = """
+            SELECT a.rowid, a.artifact_id, a.title, a.type, a.category, a.summary,
+                   a.source, a.created_at,
+                   bm25(artifacts_fts, 10.0, 5.0, 1.0, 3.0) AS rank
+            FROM artifacts_fts
+            JOIN artifacts a ON a.rowid = artifacts_fts.rowid
+            WHERE artifacts_fts MATCH ?
+        """
+        params = [match]
+        
+        if artifact_type:
+            sql += " AND a.type = ?"
+            params.append(artifact_type)
+        
+        if category:
+            sql += " AND a.category = ?"
+            params.append(category)
+        
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        
+        with self.db.reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
+            if not rows:
+                return []
+            
+            # Snippets only for the final top-k (snippet() is the costly part)
+            rowids = [row["rowid"] for row in rows]
+            placeholders = ",".join("?" * len(rowids))
+            cursor = conn.execute(f"""
+                SELECT rowid, snippet(artifacts_fts, 2, '**', '**', '…', 16)
+                FROM artifacts_fts
+                WHERE artifacts_fts MATCH ? AND rowid IN ({placeholders})
+            """, [match] + rowids)
+            snippets = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        # bm25() is negative (lower = better) and corpus-dependent: a term in
+        # most documents has an IDF near 0, so absolute scores can all be ~0.
+        # Scale 0-10 against the best hit; rank position if none scores
+        best = max(-row["rank"] for row in rows)
+        
+        results = []
+        for position, row in enumerate(rows):
+            if best > 0:
+                relevance_score = round(10.0 * max(-row["rank"], 0.0) / best, 2)
+            else:
+                relevance_score = round(10.0 * (1 - position / len(rows)), 2)
+            snippet = snippets.get(row["rowid"])
+            
+            results.append(LazyArtifact({
+                "artifact_id": row["artifact_id"],
+                "title": row["title"],
+                "type": row["type"],
+                "category": row["category"],
+                "summary": row["summary"] or snippet,
+                "snippet": snippet,
+                "source": row["source"],
+                "relevance_score": relevance_score,
+                "created_at": row["created_at"]
+            }, self._load_lazy_columns))
+        
+        return results
+    
+    def _search_like(self, query: str, limit: int, artifact_type: str = None,
+                     category: str = None) -> List[Dict]:
+        """Substring match on title/summary, for SQLite builds without FTS5 (internal)"""
+        query_lower = query.lower()
+        
+        # Build query: relevance (occurrences of the query, via wos_count)
+        # and the summary fallback are computed in SQL for the final rows
+        # only, so content never leaves SQLite and is decompressed once
+        sql = """
+            SELECT a.artifact_id, a.title, a.type, a.category, a.source, a.created_at,
+                   COALESCE(NULLIF(a.summary, ''),
+                            substr(wos_decompress(a.content, a.content_encoding), 1, 200))
+                       AS summary,
+                   wos_count(a.title || ' ' || COALESCE(a.summary, '') || ' ' ||
+                             wos_decompress(a.content, a.content_encoding), ?) AS hits
+            FROM (
+                SELECT rowid AS match_rowid FROM artifacts WHERE 
+        """
+        params = [query_lower]
+        
+        # Search in title and summary
+        sql += "(LOWER(title) LIKE ? OR LOWER(summary) LIKE ?)"
+        params.append(f"%{query_lower}%")
+        params.append(f"%{query_lower}%")
+        
+        # Filter by type if specified
+        if artifact_type:
+            sql += " AND type = ?"
+            params.append(artifact_type)
+        
+        # Filter by category if specified
+        if category:
+            sql += " AND category = ?"
+            params.append(category)
+        
+        # Order by recency, limit results
+        sql += """
+                ORDER BY created_at DESC LIMIT ?
+            ) top
+            JOIN artifacts a ON a.rowid = top.match_rowid
+            ORDER BY a.created_at DESC
+        """
+        params.append(limit)
+        
+        with self.db.reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        
+        # Relevance score (simple: how many times query appears)
+        return [
+            LazyArtifact({
+                "artifact_id": row["artifact_id"],
+                "title": row["title"],
+                "type": row["type"],
+                "category": row["category"],
+                "summary": row["summary"],
+                "source": row["source"],
+                "relevance_score": min(10.0, (row["hits"] or 0) * 2.0),
+                "created_at": row["created_at"]
+            }, self._load_lazy_columns)
+            for row in rows
+        ]
+    
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """
+        Translate a user query into a safe FTS5 MATCH expression (internal)
+        
+        Every term is quoted so FTS operators/punctuation in user input can't
+        cause syntax errors; "phrases" and trailing-* prefixes are preserved.
+        """
+        parts = []
+        for phrase, term in re.findall(r'"([^"]*)"|(\S+)', query):
+            if phrase:
+                words = re.findall(r"\w+", phrase)
+                if words:
+                    parts.append('"' + " ".join(words) + '"')
+                continue
+            
+            words = re.findall(r"\w+", term)
+            for i, word in enumerate(words):
+                prefix = "*" if term.endswith("*") and i == len(words) - 1 else ""
+                parts.append(f'"{word}"{prefix}')
+        
+        return " ".join(parts)
+    
     def list_artifacts(self, artifact_type: str = None, category: str = None,
                       limit: int = 50) -> List[Dict]:
         """
@@ -287,35 +1017,131 @@ class CanonIndex:
             category: Filter by category
             limit: Max results
         
-        Returns: List of artifact summaries
+        Returns: Artifact summaries (LazyArtifact: other columns load on access)
+        """
+        return list(islice(self.iter_artifacts(
+            artifact_type=artifact_type,
+            category=category,
+            columns=LIST_COLUMNS,
+            page_size=limit
+        ), limit))
+    
+    def list_page(self, artifact_type: str = None, category: str = None,
+                  limit: int = 50, cursor: str = None) -> Dict[str, Any]:
+        """
+        One page of list_artifacts, resumable with a cursor
+        
+        Args:
+            artifact_type: Filter by type
+            category: Filter by category
+            limit: Max results
+            cursor: next_cursor of the previous page (None = first page)
+        
+        Returns: {"artifacts": [...], "next_cursor": str or None (last page)}
+        """
+        rows = list(islice(self.iter_artifacts(
+            artifact_type=artifact_type,
+            category=category,
+            columns=LIST_COLUMNS,
+            after=cursor,
+            page_size=limit + 1
+        ), limit + 1))
+        
+        artifacts = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit and artifacts:
+            next_cursor = self.encode_cursor(artifacts[-1])
+        
+        return {"artifacts": artifacts, "next_cursor": next_cursor}
+    
+    def iter_artifacts(self, artifact_type: str = None, category: str = None,
+                       approval_status: str = None, columns: Iterable[str] = SUMMARY_COLUMNS,
+                       after: str = None, page_size: int = 500) -> Iterator[Dict]:
+        """
+        Stream artifacts newest first, one keyset page at a time
+        
+        Pages continue from the last (created_at, artifact_id) seen instead of
+        an OFFSET, so every page is an index seek and memory stays at one page
+        whatever the Canon size. The read connection is returned between pages.
+        
+        Args:
+            artifact_type: Filter by type
+            category: Filter by category
+            approval_status: Filter by approval status
+            columns: Columns to fetch (LazyArtifact for the rest);
+                None = full artifacts with tags/metadata decoded
+            after: Cursor to start after (encode_cursor / list_page next_cursor)
+            page_size: Rows fetched per query
+        
+        Yields: Artifact dicts
         """
-        sql = "SELECT * FROM artifacts WHERE 1=1"
+        if columns is None:
+            select = "*"
+        else:
+            columns = list(columns)
+            # The keyset needs both sort columns on every row
+            for key in ("artifact_id", "created_at"):
+                if key not in columns:
+                    columns.append(key)
+            select = ", ".join(columns)
+        
+        filters = []
         params = []
         
         if artifact_type:
-            sql += " AND type = ?"
+            filters.append("type = ?")
             params.append(artifact_type)
         
         if category:
-            sql += " AND category = ?"
+            filters.append("category = ?")
             params.append(category)
         
-        sql += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
+        if approval_status:
+            filters.append("approval_status = ?")
+            params.append(approval_status)
         
-        cursor = self.conn.cursor()
-        cursor.execute(sql, params)
+        position = self.decode_cursor(after) if after else None
         
-        return [
-            {
-                "artifact_id": dict(row)["artifact_id"],
-                "title": dict(row)["title"],
-                "type": dict(row)["type"],
-                "category": dict(row)["category"],
-                "created_at": dict(row)["created_at"]
-            }
-            for row in cursor.fetchall()
-        ]
+        while True:
+            where = list(filters)
+            page_params = list(params)
+            if position:
+                where.append("(created_at, artifact_id) < (?, ?)")
+                page_params.extend(position)
+            
+            sql = f"SELECT {select} FROM artifacts"
+            if where:
+                sql += " WHERE " + " AND ".join(where)
+            sql += " ORDER BY created_at DESC, artifact_id DESC LIMIT ?"
+            page_params.append(page_size)
+            
+            with self.db.reader() as conn:
+                rows = conn.execute(sql, page_params).fetchall()
+            
+            for row in rows:
+                if columns is None:
+                    yield self._from_row(row)
+                else:
+                    yield LazyArtifact(dict(row), self._load_lazy_columns)
+            
+            if len(rows) < page_size:
+                return
+            position = (rows[-1]["created_at"], rows[-1]["artifact_id"])
+    
+    @staticmethod
+    def encode_cursor(artifact: Dict[str, Any]) -> str:
+        """Opaque cursor positioned just after an artifact returned by iter_artifacts"""
+        key = json.dumps([artifact["created_at"], artifact["artifact_id"]])
+        return base64.urlsafe_b64encode(key.encode("utf-8")).decode("ascii")
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple:
+        """(created_at, artifact_id) of a cursor; raises ValueError if malformed"""
+        try:
+            created_at, artifact_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        return created_at, artifact_id
     
     def link_artifacts(self, source_id: str, target_id: str,
                       relationship_type: str = "related") -> bool:
@@ -330,16 +1156,15 @@ class CanonIndex:
         Returns: True if successful
         """
         try:
-            cursor = self.conn.cursor()
             rel_id = f"{source_id}→{target_id}"
             
-            cursor.execute("""
-                INSERT OR REPLACE INTO artifact_relationships
-                (rel_id, source_artifact_id, target_artifact_id, relationship_type)
-                VALUES (?, ?, ?, ?)
-            """, (rel_id, source_id, target_id, relationship_type))
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO artifact_relationships
+                    (rel_id, source_artifact_id, target_artifact_id, relationship_type)
+                    VALUES (?, ?, ?, ?)
+                """, (rel_id, source_id, target_id, relationship_type))
             
-            self.conn.commit()
             logger.info(f"Linked artifacts: {source_id} → {target_id}")
             return True
         
@@ -349,108 +1174,318 @@ class CanonIndex:
     
     def get_related_artifacts(self, artifact_id: str) -> List[Dict]:
         """Get artifacts related to a given artifact"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT target_artifact_id, relationship_type
-            FROM artifact_relationships
-            WHERE source_artifact_id = ?
-            ORDER BY created_at DESC
-        """, (artifact_id,))
-        
-        related = []
-        for row in cursor.fetchall():
-            target_id = row[0]
-            rel_type = row[1]
-            target = self.get_artifact(target_id, log_retrieval=False)
-            if target:
-                related.append({
-                    "artifact_id": target_id,
-                    "relationship_type": rel_type,
-                    "title": target["title"]
-                })
-        
-        return related
+        # One JOIN instead of a get_artifact() (full row + JSON parsing) per target
+        with self.db.reader() as conn:
+            rows = conn.execute("""
+                SELECT r.target_artifact_id, r.relationship_type, a.title
+                FROM artifact_relationships r
+                JOIN artifacts a ON a.artifact_id = r.target_artifact_id
+                WHERE r.source_artifact_id = ?
+                ORDER BY r.created_at DESC
+            """, (artifact_id,)).fetchall()
+        
+        return [
+            {
+                "artifact_id": row[0],
+                "relationship_type": row[1],
+                "title": row[2]
+            }
+            for row in rows
+        ]
+    
+    def traverse_related(self, artifact_id: str, max_depth: int = 2,
+                         relationship_types: List[str] = None,
+                         direction: str = "outgoing", limit: int = 100) -> List[Dict]:
+        """
+        Multi-hop walk of the artifact relationship graph
+        
+        One recursive CTE: each step follows indexed edges from the frontier,
+        and a path string rejects artifacts already on the current path, so
+        cycles terminate. Every reachable artifact is returned once, at its
+        shortest depth.
+        
+        Args:
+            artifact_id: Start artifact
+            max_depth: Max hops (1 = direct relations)
+            relationship_types: Only follow these relationship types (None = all)
+            direction: "outgoing" (source → target), "incoming" or "both"
+            limit: Max artifacts returned
+        
+        Returns: [{artifact_id, title, type, category, depth, relationship_type,
+                   via, path}] ordered by depth; `via` is the previous hop and
+                   `path` the artifact ids from the start artifact
+        """
+        if direction not in ("outgoing", "incoming", "both"):
+            raise ValueError(f"Unknown traversal direction: {direction}")
+        if max_depth < 1:
+            return []
+        
+        type_filter = ""
+        type_params = []
+        if relationship_types:
+            type_filter = f" AND r.relationship_type IN ({','.join('?' * len(relationship_types))})"
+            type_params = list(relationship_types)
+        
+        # (edge column matched against the frontier, column of the next artifact)
+        ends = {
+            "outgoing": [("source_artifact_id", "target_artifact_id")],
+            "incoming": [("target_artifact_id", "source_artifact_id")],
+            "both": [("source_artifact_id", "target_artifact_id"),
+                     ("target_artifact_id", "source_artifact_id")]
+        }[direction]
+        
+        steps = []
+        params = [artifact_id, artifact_id]
+        for near, far in ends:
+            steps.append(f"""
+                SELECT r.{far}, w.depth + 1, r.relationship_type, w.artifact_id,
+                       w.path || r.{far} || char(31)
+                FROM walk w
+                JOIN artifact_relationships r ON r.{near} = w.artifact_id
+                WHERE w.depth < ?
+                  AND instr(w.path, char(31) || r.{far} || char(31)) = 0{type_filter}
+            """)
+            params += [max_depth] + type_params
+        
+        # Paths are char(31)-delimited so ids can't match inside one another
+        sql = f"""
+            WITH RECURSIVE walk(artifact_id, depth, relationship_type, via, path) AS (
+                SELECT ?, 0, NULL, NULL, char(31) || ? || char(31)
+                UNION ALL
+                {" UNION ALL ".join(steps)}
+            )
+            SELECT w.artifact_id, w.depth, w.relationship_type, w.via, w.path,
+                   a.title, a.type, a.category
+            FROM walk w
+            JOIN artifacts a ON a.artifact_id = w.artifact_id
+            WHERE w.depth > 0
+            ORDER BY w.depth, w.artifact_id
+        """
+        
+        with self.db.reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        
+        results = {}
+        for row in rows:
+            if row["artifact_id"] in results:
+                continue  # Already reached by a shorter (or equal) path
+            results[row["artifact_id"]] = {
+                "artifact_id": row["artifact_id"],
+                "title": row["title"],
+                "type": row["type"],
+                "category": row["category"],
+                "depth": row["depth"],
+                "relationship_type": row["relationship_type"],
+                "via": row["via"],
+                "path": row["path"].strip("\x1f").split("\x1f")
+            }
+            if len(results) >= limit:
+                break
+        
+        return list(results.values())
     
     def approve_artifact(self, artifact_id: str, approver: str = "founder") -> bool:
         """Mark artifact as approved"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE artifacts
-                SET approval_status = 'approved', updated_at = ?
-                WHERE artifact_id = ?
-            """, (datetime.utcnow().isoformat(), artifact_id))
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    UPDATE artifacts
+                    SET approval_status = 'approved', updated_at = ?
+                    WHERE artifact_id = ?
+                """, (datetime.utcnow().isoformat(), artifact_id))
             
-            self.conn.commit()
             logger.info(f"Approved artifact: {artifact_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to approve artifact: {e}")
             return False
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get Canon Index statistics"""
-        cursor = self.conn.cursor()
+    def compress_artifacts(self, compression: str = None, train_dictionary: bool = True,
+                           sample_size: int = 500, batch_size: int = 500) -> Dict[str, Any]:
+        """
+        Compress stored artifacts with the current codec (one-off migration)
+        
+        Optionally trains a dictionary on a random sample of existing content
+        first, then re-encodes every row not already using the active
+        codec/dictionary, one transaction per batch. Also empties the legacy
+        search_index table (FTS5 replaced it; it duplicated content).
         
-        cursor.execute("SELECT COUNT(*) as total FROM artifacts")
-        total = cursor.fetchone()[0]
+        Args:
+            compression: Switch codec first ("zlib" / "zstd"); default: current
+            train_dictionary: Train a new dictionary from existing artifacts
+            sample_size: Artifacts sampled for dictionary training
+            batch_size: Rows re-encoded per transaction
+        
+        Returns: Stats {compressed, unchanged, dictionary_id, bytes_before,
+                        bytes_after, elapsed_seconds}
+        """
+        start = time.monotonic()
+        if compression:
+            self.codec.set_compression(compression)
+        if not self.codec.compression:
+            logger.error("No compression codec set (CanonIndex(compression=...))")
+            return {"compressed": 0, "unchanged": 0, "error": "compression is off"}
+        
+        if train_dictionary:
+            with self.db.reader() as conn:
+                rows = conn.execute("""
+                    SELECT content, content_encoding FROM artifacts
+                    ORDER BY random() LIMIT ?
+                """, (sample_size,)).fetchall()
+            self.codec.train_dictionary([self.codec.decode(row[0], row[1]) for row in rows])
+        
+        target = self.codec.compression
+        if self.codec.dictionary_id:
+            target = f"{target}:{self.codec.dictionary_id}"
         
-        cursor.execute("SELECT type, COUNT(*) as count FROM artifacts GROUP BY type")
-        by_type = {row[0]: row[1] for row in cursor.fetchall()}
+        stats = {"compressed": 0, "unchanged": 0, "dictionary_id": self.codec.dictionary_id,
+                 "bytes_before": 0, "bytes_after": 0}
+        last_rowid = 0
+        while True:
+            with self.db.transaction() as conn:
+                rows = conn.execute("""
+                    SELECT rowid, content, content_encoding FROM artifacts
+                    WHERE rowid > ? ORDER BY rowid LIMIT ?
+                """, (last_rowid, batch_size)).fetchall()
+                if not rows:
+                    break
+                
+                updates = []
+                for rowid, content, encoding in rows:
+                    stored_bytes = len(content) if isinstance(content, bytes) else len(content.encode())
+                    stats["bytes_before"] += stored_bytes
+                    if encoding == target:
+                        stats["unchanged"] += 1
+                        stats["bytes_after"] += stored_bytes
+                        continue
+                    
+                    text = self.codec.decode(content, encoding)
+                    value, new_encoding = self.codec.encode(text)
+                    if new_encoding == encoding:
+                        stats["unchanged"] += 1
+                        stats["bytes_after"] += stored_bytes
+                        continue
+                    
+                    raw = text.encode()
+                    updates.append((value, new_encoding, len(raw), rowid))
+                    if new_encoding:
+                        stats["compressed"] += 1
+                        stats["bytes_after"] += len(value)
+                    else:
+                        # Stored compressed, but no longer worth it: back to plain text
+                        stats["unchanged"] += 1
+                        stats["bytes_after"] += len(raw)
+                
+                conn.executemany("""
+                    UPDATE artifacts SET content = ?, content_encoding = ?, content_size = ?
+                    WHERE rowid = ?
+                """, updates)
+            last_rowid = rows[-1][0]
         
-        cursor.execute("SELECT category, COUNT(*) as count FROM artifacts WHERE category IS NOT NULL GROUP BY category")
-        by_category = {row[0]: row[1] for row in cursor.fetchall()}
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM search_index")
         
-        cursor.execute("SELECT COUNT(*) as total FROM retrieval_log")
-        total_retrievals = cursor.fetchone()[0]
+        stats["elapsed_seconds"] = round(time.monotonic() - start, 2)
+        logger.info(f"Compressed Canon content: {stats}")
+        return stats
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get Canon Index statistics"""
+        # Count audit rows still queued in the background writer
+        if self.retrieval_log:
+            self.retrieval_log.flush(timeout=5.0)
+        
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("SELECT COUNT(*) as total FROM artifacts")
+            total = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT type, COUNT(*) as count FROM artifacts GROUP BY type")
+            by_type = {row[0]: row[1] for row in cursor.fetchall()}
+            
+            cursor.execute("SELECT category, COUNT(*) as count FROM artifacts WHERE category IS NOT NULL GROUP BY category")
+            by_category = {row[0]: row[1] for row in cursor.fetchall()}
+            
+            cursor.execute("SELECT COUNT(*) as total FROM retrieval_log")
+            total_retrievals = cursor.fetchone()[0]
+            
+            # Stored vs plain-text content size, per encoding
+            cursor.execute("""
+                SELECT COALESCE(content_encoding, 'plain') AS encoding, COUNT(*),
+                       SUM(length(CAST(content AS BLOB))),
+                       SUM(COALESCE(content_size, length(CAST(content AS BLOB))))
+                FROM artifacts GROUP BY 1
+            """)
+            by_encoding = {row[0]: {"artifacts": row[1], "stored_bytes": row[2],
+                                    "content_bytes": row[3]}
+                           for row in cursor.fetchall()}
+            
+            cursor.execute("SELECT SUM(length(CAST(searchable_text AS BLOB))) FROM search_index")
+            search_index_bytes = cursor.fetchone()[0] or 0
+            
+            cursor.execute("""
+                SELECT COUNT(*), SUM(base_version IS NULL),
+                       SUM(length(CAST(delta AS BLOB))), SUM(content_size)
+                FROM artifact_versions
+            """)
+            row = cursor.fetchone()
+            versions = {"total_versions": row[0], "snapshots": row[1] or 0,
+                        "stored_bytes": row[2] or 0, "content_bytes": row[3] or 0}
+        
+        stored_bytes = sum(entry["stored_bytes"] or 0 for entry in by_encoding.values())
+        content_bytes = sum(entry["content_bytes"] or 0 for entry in by_encoding.values())
+        storage = {
+            "content_bytes": content_bytes,
+            "stored_bytes": stored_bytes,
+            "compression_ratio": round(content_bytes / stored_bytes, 2) if stored_bytes else None,
+            "by_encoding": by_encoding,
+            "legacy_search_index_bytes": search_index_bytes
+        }
         
         return {
             "total_artifacts": total,
             "by_type": by_type,
             "by_category": by_category,
             "total_retrievals": total_retrievals,
+            "full_text_search": "fts5" if self.fts_enabled else "like",
+            "storage": storage,
+            "versions": versions,
+            "content_codec": self.codec.get_stats(),
+            "retrieval_log": self.retrieval_log.get_stats() if self.retrieval_log else None,
             "db_path": self.db_path
         }
     
-    def _index_artifact(self, artifact_id: str, title: str, content: str,
-                       tags: List[str]):
-        """Create search index for artifact (internal)"""
-        try:
-            cursor = self.conn.cursor()
-            searchable_text = f"{title} {content} {' '.join(tags)}".lower()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO search_index
-                (idx_id, artifact_id, searchable_text)
-                VALUES (?, ?, ?)
-            """, (f"idx_{artifact_id}", artifact_id, searchable_text[:5000]))
-            
-            self.conn.commit()
-        except Exception as e:
-            logger.error(f"Failed to index artifact: {e}")
-    
     def _log_retrieval(self, artifact_id: str, retrieval_type: str,
                       request_id: str = None, execution_id: str = None,
                       relevance_score: float = None):
         """Log artifact retrieval for audit trail (internal)"""
         try:
-            cursor = self.conn.cursor()
-            log_id = f"log_{artifact_id}_{datetime.utcnow().isoformat()}"
+            if self.retrieval_log:
+                self.retrieval_log.log(artifact_id, retrieval_type, request_id,
+                                       execution_id, relevance_score)
+                return
             
-            cursor.execute("""
-                INSERT INTO retrieval_log
-                (log_id, artifact_id, request_id, execution_id, retrieval_type, relevance_score)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (log_id, artifact_id, request_id, execution_id, retrieval_type, relevance_score))
+            log_id = f"log_{uuid.uuid4().hex}"
             
-            self.conn.commit()
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    INSERT INTO retrieval_log
+                    (log_id, artifact_id, request_id, execution_id, retrieval_type, relevance_score)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (log_id, artifact_id, request_id, execution_id, retrieval_type, relevance_score))
         except Exception as e:
             logger.error(f"Failed to log retrieval: {e}")
     
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Flush queued retrieval logs and release the shared database connection"""
+        if self.retrieval_log:
+            self.retrieval_log.close()
+            self.retrieval_log = None
+        if self.db:
+            self.db.release()
+            self.db = None
+            self.conn = None
     
     def __del__(self):
         self.close()
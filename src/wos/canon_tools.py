@@ -4,13 +4,65 @@ Retrieval-first interface for Canon Index (SQLite-backed)
 Implements Phase 4 Memory Layer tools + Phase 4.1 Semantic Search
 """
 
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Any, Optional, Iterable
 from wos.canon_index import CanonIndex
 from wos.canon_embeddings import CanonEmbeddings
 
 logger = logging.getLogger("wos.canon_tools")
 
+# Search modes accepted by CanonTools.search
+SEARCH_MODES = ("semantic", "text", "hybrid")
+
+
+def reciprocal_rank_fusion(ranked_lists: Dict[str, List[Dict[str, Any]]],
+                           k: int = 60, limit: int = None) -> List[Dict[str, Any]]:
+    """
+    Fuse ranked result lists with Reciprocal Rank Fusion
+    
+    score(d) = sum over retrievers of 1 / (k + rank_r(d)), ranks starting at 1.
+    Rank-based, so BM25 and cosine scores never need calibrating against
+    each other.
+    
+    Args:
+        ranked_lists: {retriever_name: [result dicts with "artifact_id"]}
+        k: RRF damping constant (60 is the standard choice)
+        limit: Max fused results
+    
+    Returns: Fused results, each with "rrf_score", "retriever_ranks" and a
+             0-10 "relevance_score" (share of the best achievable RRF score,
+             counting only retrievers that returned results)
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    
+    for retriever, results in ranked_lists.items():
+        for rank, result in enumerate(results, start=1):
+            entry = fused.get(result["artifact_id"])
+            if entry is None:
+                entry = dict(result)
+                entry["rrf_score"] = 0.0
+                entry["retriever_ranks"] = {}
+                fused[result["artifact_id"]] = entry
+            else:
+                # Keep fields only one retriever provides (similarity, snippet)
+                for key, value in result.items():
+                    entry.setdefault(key, value)
+            entry["rrf_score"] += 1.0 / (k + rank)
+            entry["retriever_ranks"][retriever] = rank
+    
+    # An empty list (retriever timed out, failed or disabled) cannot score
+    contributing = sum(1 for results in ranked_lists.values() if results)
+    best_possible = contributing / (k + 1.0) if contributing else 1.0
+    ordered = sorted(fused.values(), key=lambda x: x["rrf_score"], reverse=True)
+    for entry in ordered:
+        entry["relevance_score"] = round(10.0 * entry["rrf_score"] / best_possible, 2)
+    
+    return ordered[:limit] if limit else ordered
+
 class CanonTools:
     """
     Canon Tools v0.1
@@ -21,20 +73,46 @@ class CanonTools:
     """
     
     def __init__(self, canon_index: CanonIndex = None, canon_db_path: str = "canon.db",
-                 use_semantic_search: bool = True, openai_api_key: str = None):
+                 use_semantic_search: bool = True, openai_api_key: str = None,
+                 approximate_search: bool = False, ann_options: Dict[str, Any] = None,
+                 search_mode: str = "semantic", semantic_timeout: float = 5.0,
+                 embedding_provider: str = None, quantization: str = None,
+                 compression: str = None):
         """
         Initialize Canon Tools
         
         Args:
             canon_index: Existing CanonIndex instance (or None to create new)
             canon_db_path: Path to Canon SQLite database
-            use_semantic_search: Enable semantic search (requires OpenAI API key)
+            use_semantic_search: Enable semantic search
             openai_api_key: OpenAI API key for embeddings
+            approximate_search: Default to ANN (IVF) search instead of exact scan
+            ann_options: ANN index knobs, e.g. {"nprobe": 8}
+            search_mode: Default search mode: "semantic", "text" or "hybrid"
+            semantic_timeout: Hybrid mode: seconds to wait for the query
+                embedding before answering with lexical results only
+            embedding_provider: "openai" or "local" (None = WOS_EMBEDDING_PROVIDER,
+                else OpenAI when a key is set, else local)
+            quantization: Compress resident vectors: None, "int8" or "pq"
+            compression: Compress stored artifact content: None, "zlib" or
+                "zstd" (only used when creating the CanonIndex)
         """
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {search_mode}")
+        
+        self.search_mode = search_mode
+        self.semantic_timeout = semantic_timeout
+        
+        # Worker threads for hybrid search (query embedding is network-bound)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        
+        # close() only closes a CanonIndex this instance created
+        self._owns_canon = not canon_index
         if canon_index:
             self.canon = canon_index
         else:
-            self.canon = CanonIndex(db_path=canon_db_path)
+            self.canon = CanonIndex(db_path=canon_db_path, compression=compression)
         
         # Initialize embeddings layer if enabled
         self.use_semantic_search = use_semantic_search
@@ -44,7 +122,11 @@ class CanonTools:
             try:
                 self.embeddings = CanonEmbeddings(
                     db_path=canon_db_path,
-                    api_key=openai_api_key
+                    api_key=openai_api_key,
+                    ann_options=ann_options,
+                    approximate_search=approximate_search,
+                    provider=embedding_provider,
+                    quantization=quantization
                 )
                 logger.info("Semantic search enabled")
             except Exception as e:
@@ -54,11 +136,16 @@ class CanonTools:
     
     def search(self, query: str, limit: int = 5, artifact_type: str = None,
               category: str = None, request_id: str = None,
-              execution_id: str = None, use_semantic: bool = None) -> List[Dict[str, Any]]:
+              execution_id: str = None, use_semantic: bool = None,
+              approximate: bool = None, mode: str = None) -> List[Dict[str, Any]]:
         """
         Search Canon Index for relevant artifacts
         
-        Uses semantic search (embeddings) if enabled, falls back to text search.
+        Modes:
+            semantic: embeddings first, text search if that returns nothing
+            text:     FTS5 only
+            hybrid:   lexical + semantic concurrently, fused with RRF
+                      (see hybrid_search for per-retriever timings)
         
         Args:
             query: Search query (text)
@@ -68,6 +155,8 @@ class CanonTools:
             request_id: Request ID for audit trail
             execution_id: Execution ID for audit trail
             use_semantic: Override semantic search setting (True/False/None)
+            approximate: ANN (True) vs exact (False) vector search, None = default
+            mode: "semantic", "text" or "hybrid" (None = instance default)
         
         Returns: List of artifact references:
         [
@@ -85,8 +174,19 @@ class CanonTools:
         """
         logger.info(f"Canon search: query='{query}', limit={limit}")
         
+        mode = mode or self.search_mode
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode}")
+        
+        if mode == "hybrid" and use_semantic is not False:
+            return self.hybrid_search(
+                query=query, limit=limit, artifact_type=artifact_type,
+                category=category, request_id=request_id,
+                execution_id=execution_id, approximate=approximate
+            )["results"]
+        
         # Determine which search method to use
-        should_use_semantic = (
+        should_use_semantic = mode != "text" and (
             use_semantic if use_semantic is not None 
             else self.use_semantic_search
         )
@@ -102,7 +202,8 @@ class CanonTools:
                     limit=limit,
                     artifact_type=artifact_type,
                     category=category,
-                    min_similarity=0.5
+                    min_similarity=0.5,
+                    approximate=approximate
                 )
                 
                 # Log retrievals
@@ -134,8 +235,203 @@ class CanonTools:
         logger.info(f"Canon search returned {len(results)} results")
         return results
     
+    def search_passages(self, query: str, limit: int = 5, artifact_type: str = None,
+                        category: str = None, request_id: str = None,
+                        execution_id: str = None, passages_per_artifact: int = 2,
+                        approximate: bool = None) -> List[Dict[str, Any]]:
+        """
+        Search Canon for the best-matching passages of each artifact
+        
+        Lets handlers pull just the relevant section of a long document
+        instead of its full content. Falls back to full-text search (one
+        snippet per artifact) when semantic search is unavailable.
+        
+        Args:
+            query: Search query (text)
+            limit: Max artifacts to return
+            artifact_type: Filter by type (optional)
+            category: Filter by category (optional)
+            request_id: Request ID for audit trail
+            execution_id: Execution ID for audit trail
+            passages_per_artifact: Passages returned per artifact
+            approximate: ANN (True) vs exact (False) vector search, None = default
+        
+        Returns: Search results (see search) with "passages":
+        [{"chunk_id", "chunk_index", "start_char", "end_char", "text", "similarity"}]
+        """
+        logger.info(f"Canon passage search: query='{query}', limit={limit}")
+        
+        results = []
+        
+        if self.use_semantic_search and self.embeddings:
+            try:
+                results = self.embeddings.passage_search(
+                    query=query,
+                    limit=limit,
+                    artifact_type=artifact_type,
+                    category=category,
+                    min_similarity=0.5,
+                    passages_per_artifact=passages_per_artifact,
+                    approximate=approximate
+                )
+                
+                for result in results:
+                    if request_id or execution_id:
+                        self.canon._log_retrieval(
+                            result["artifact_id"], "passage_search",
+                            request_id, execution_id, result.get("relevance_score")
+                        )
+            except Exception as e:
+                logger.error(f"Passage search failed: {e}")
+                logger.warning("Falling back to text search")
+                results = []
+        
+        if not results:
+            results = self.canon.search_artifacts(
+                query=query,
+                limit=limit,
+                artifact_type=artifact_type,
+                category=category,
+                request_id=request_id,
+                execution_id=execution_id
+            )
+            for result in results:
+                snippet = result.get("snippet") or result.get("summary") or ""
+                result["passages"] = [{"chunk_id": None, "chunk_index": None,
+                                       "start_char": None, "end_char": None,
+                                       "text": snippet, "similarity": None}]
+        
+        logger.info(f"Canon passage search returned {len(results)} results")
+        return results
+    
+    def hybrid_search(self, query: str, limit: int = 5, artifact_type: str = None,
+                      category: str = None, request_id: str = None,
+                      execution_id: str = None, approximate: bool = None,
+                      semantic_timeout: float = None, rrf_k: int = 60) -> Dict[str, Any]:
+        """
+        Hybrid lexical + semantic search fused with Reciprocal Rank Fusion
+        
+        The query embedding (network call) runs on a worker thread while the
+        FTS5 query runs here; vector scoring is in-memory once the embedding
+        arrives. If the embedding fails or exceeds semantic_timeout, lexical
+        results are returned on their own instead of paying for a fallback.
+        
+        Args:
+            query: Search query (text)
+            limit: Max results to return
+            artifact_type: Filter by type (optional)
+            category: Filter by category (optional)
+            request_id: Request ID for audit trail
+            execution_id: Execution ID for audit trail
+            approximate: ANN (True) vs exact (False) vector search, None = default
+            semantic_timeout: Seconds to wait for the query embedding
+            rrf_k: RRF damping constant
+        
+        Returns:
+        {
+            "results": [fused artifact references, see search()],
+            "retrievers": {"lexical": int, "semantic": int},  # hits per retriever
+            "timings_ms": {"lexical": float, "embedding": float,
+                           "semantic": float, "total": float},
+            "semantic_status": "ok" | "failed" | "timeout" | "disabled"
+        }
+        """
+        logger.info(f"Canon hybrid search: query='{query}', limit={limit}")
+        
+        start = time.perf_counter()
+        timeout = self.semantic_timeout if semantic_timeout is None else semantic_timeout
+        depth = max(limit * 3, 10)  # per-retriever candidates fed into fusion
+        timings = {}
+        
+        # Kick off the query embedding first so it overlaps the FTS5 query
+        # (cache lookups stay on this thread: the backing store is SQLite)
+        future = None
+        cached_embedding = None
+        if self.embeddings and self.use_semantic_search:
+            cached_embedding = self.embeddings.get_cached_query_embedding(query)
+            if cached_embedding is None:
+                future = self._get_executor().submit(self._timed_embedding, query)
+        
+        lexical_start = time.perf_counter()
+        lexical = self.canon.search_artifacts(
+            query=query,
+            limit=depth,
+            artifact_type=artifact_type,
+            category=category
+        )
+        timings["lexical"] = (time.perf_counter() - lexical_start) * 1000
+        
+        semantic = []
+        semantic_status = "disabled"
+        if future is not None or cached_embedding is not None:
+            remaining = max(0.0, timeout - (time.perf_counter() - start))
+            try:
+                if cached_embedding is not None:
+                    query_embedding, timings["embedding"] = cached_embedding, 0.0
+                else:
+                    query_embedding, timings["embedding"] = future.result(timeout=remaining)
+                    if query_embedding:
+                        self.embeddings.remember_query_embedding(query, query_embedding)
+                if query_embedding:
+                    semantic_start = time.perf_counter()
+                    semantic = self.embeddings.search_by_vector(
+                        query_embedding,
+                        limit=depth,
+                        artifact_type=artifact_type,
+                        category=category,
+                        min_similarity=0.5,
+                        approximate=approximate
+                    )
+                    timings["semantic"] = (time.perf_counter() - semantic_start) * 1000
+                    semantic_status = "ok"
+                else:
+                    semantic_status = "failed"
+            except FutureTimeoutError:
+                logger.warning(f"Query embedding exceeded {timeout}s, using lexical results only")
+                semantic_status = "timeout"
+            except Exception as e:
+                logger.error(f"Semantic retriever failed: {e}")
+                semantic_status = "failed"
+        
+        results = reciprocal_rank_fusion(
+            {"lexical": lexical, "semantic": semantic}, k=rrf_k, limit=limit
+        )
+        
+        # Log retrievals
+        if request_id or execution_id:
+            for result in results:
+                self.canon._log_retrieval(
+                    result["artifact_id"], "hybrid_search",
+                    request_id, execution_id, result.get("relevance_score")
+                )
+        
+        timings["total"] = (time.perf_counter() - start) * 1000
+        logger.info(f"Hybrid search returned {len(results)} results "
+                    f"(lexical={len(lexical)}, semantic={len(semantic)}, "
+                    f"{timings['total']:.1f} ms)")
+        
+        return {
+            "results": results,
+            "retrievers": {"lexical": len(lexical), "semantic": len(semantic)},
+            "timings_ms": {name: round(ms, 2) for name, ms in timings.items()},
+            "semantic_status": semantic_status
+        }
+    
+    def _timed_embedding(self, query: str):
+        """Generate a query embedding and time it (runs on a worker thread)"""
+        start = time.perf_counter()
+        embedding = self.embeddings.generate_embedding(query)
+        return embedding, (time.perf_counter() - start) * 1000
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=4,
+                                                    thread_name_prefix="canon-search")
+            return self._executor
+    
     def get(self, artifact_id: str, request_id: str = None,
-           execution_id: str = None) -> Optional[Dict[str, Any]]:
+           execution_id: str = None, lazy: bool = False) -> Optional[Dict[str, Any]]:
         """
         Retrieve full artifact by ID
         
@@ -143,6 +439,7 @@ class CanonTools:
             artifact_id: Artifact ID
             request_id: Request ID for audit trail
             execution_id: Execution ID for audit trail
+            lazy: Defer loading content/metadata/tags until first accessed
         
         Returns:
         {
@@ -166,7 +463,8 @@ class CanonTools:
             artifact_id=artifact_id,
             log_retrieval=True,
             request_id=request_id,
-            execution_id=execution_id
+            execution_id=execution_id,
+            lazy=lazy
         )
         
         if not artifact:
@@ -218,9 +516,10 @@ class CanonTools:
         if success and auto_embed and self.embeddings:
             try:
                 artifact_text = f"{title}\n{summary or ''}\n{content}"
+                # Skipped (no API call) when the text is unchanged since last embed
                 embed_success = self.embeddings.embed_artifact(artifact_id, artifact_text)
                 if embed_success:
-                    logger.info(f"Generated embedding for {artifact_id}")
+                    logger.info(f"Embedding up to date for {artifact_id}")
                 else:
                     logger.warning(f"Failed to generate embedding for {artifact_id}")
             except Exception as e:
@@ -228,6 +527,44 @@ class CanonTools:
         
         return success
     
+    def store_many(self, artifacts: Iterable[Dict[str, Any]], auto_embed: bool = True,
+                   batch_size: int = 500,
+                   pipeline_options: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Bulk-import artifacts (newsletter archives, Notion exports, ...)
+        
+        All artifact rows go in with one transaction (CanonIndex.store_many),
+        then embeddings are generated in batched requests rather than one API
+        call + commit per artifact.
+        
+        Args:
+            artifacts: Dicts of store() keyword arguments (artifact_id, title,
+                content, artifact_type, category, summary, tags, ...)
+            auto_embed: Embed the imported artifacts afterwards
+            batch_size: Artifacts per executemany call
+            pipeline_options: EmbeddingPipeline knobs (batch_size,
+                max_concurrency, tokens_per_minute, ...)
+        
+        Returns: {stored, unchanged, failed, elapsed_seconds, rows_per_second,
+                  embeddings: pipeline stats or None}
+        """
+        start = time.perf_counter()
+        stats = self.canon.store_many(artifacts, batch_size=batch_size)
+        artifact_ids = stats.pop("artifact_ids")
+        
+        stats["embeddings"] = None
+        if auto_embed and self.embeddings and artifact_ids:
+            stats["embeddings"] = self.embeddings.embed_many(artifact_ids,
+                                                             **(pipeline_options or {}))
+        
+        # End-to-end throughput (import + embeddings)
+        elapsed = time.perf_counter() - start
+        stats["total_seconds"] = round(elapsed, 3)
+        stats["total_rows_per_second"] = round(stats["stored"] / elapsed, 1) if elapsed > 0 else None
+        logger.info(f"Canon bulk import: {stats['stored']} stored, {stats['failed']} failed, "
+                    f"{stats['total_rows_per_second']} rows/s end-to-end")
+        return stats
+    
     def list(self, artifact_type: str = None, category: str = None,
             limit: int = 50) -> List[Dict]:
         """
@@ -248,6 +585,86 @@ class CanonTools:
             limit=limit
         )
     
+    def get_version(self, artifact_id: str, version: int = None,
+                   as_of: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve an artifact as it was at an earlier version or time
+        
+        Args:
+            artifact_id: Artifact ID
+            version: Version number (see history)
+            as_of: ISO timestamp: newest version written at or before it
+        
+        Returns: Artifact dict with "version", or None if there is no such version
+        """
+        logger.info(f"Canon get_version: {artifact_id} (version={version}, as_of={as_of})")
+        
+        return self.canon.get_artifact_version(artifact_id, version=version, as_of=as_of)
+    
+    def history(self, artifact_id: str) -> List[Dict]:
+        """
+        Version history of an artifact, newest first
+        
+        Returns: [{version, created_at, title, checksum, content_size, stored_bytes, snapshot}]
+        """
+        logger.info(f"Canon history: {artifact_id}")
+        
+        return self.canon.list_versions(artifact_id)
+    
+    def list_page(self, artifact_type: str = None, category: str = None,
+                  limit: int = 50, cursor: str = None) -> Dict[str, Any]:
+        """
+        Page through artifacts (newest first) with a resumable cursor
+        
+        Args:
+            artifact_type: Filter by type
+            category: Filter by category
+            limit: Max results per page
+            cursor: next_cursor from the previous page (None = first page)
+        
+        Returns: {"artifacts": [summaries], "next_cursor": str or None}
+        """
+        logger.info(f"Canon list_page: type={artifact_type}, category={category}, "
+                    f"cursor={'yes' if cursor else 'no'}")
+        
+        return self.canon.list_page(
+            artifact_type=artifact_type,
+            category=category,
+            limit=limit,
+            cursor=cursor
+        )
+    
+    def export(self, path: str, artifact_type: str = None, category: str = None,
+              page_size: int = 500) -> Dict[str, Any]:
+        """
+        Export artifacts to a JSON Lines file (one full artifact per line)
+        
+        Streams through CanonIndex.iter_artifacts: only one page of artifacts
+        is in memory at a time, whatever the Canon size.
+        
+        Args:
+            path: Output file
+            artifact_type: Filter by type
+            category: Filter by category
+            page_size: Artifacts read per query
+        
+        Returns: {"exported": int, "path": str, "elapsed_seconds": float}
+        """
+        logger.info(f"Canon export: {path} (type={artifact_type}, category={category})")
+        
+        start = time.perf_counter()
+        exported = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for artifact in self.canon.iter_artifacts(artifact_type=artifact_type,
+                                                      category=category, columns=None,
+                                                      page_size=page_size):
+                f.write(json.dumps(artifact, ensure_ascii=False) + "\n")
+                exported += 1
+        
+        elapsed = time.perf_counter() - start
+        logger.info(f"Canon export: {exported} artifacts in {elapsed:.2f}s")
+        return {"exported": exported, "path": path, "elapsed_seconds": round(elapsed, 2)}
+    
     def get_related(self, artifact_id: str) -> List[Dict]:
         """
         Get artifacts related to a given artifact
@@ -261,6 +678,27 @@ class CanonTools:
         
         return self.canon.get_related_artifacts(artifact_id)
     
+    def traverse(self, artifact_id: str, max_depth: int = 2,
+                 relationship_types: List[str] = None, direction: str = "outgoing",
+                 limit: int = 100) -> List[Dict]:
+        """
+        Walk the knowledge graph several hops out from an artifact
+        
+        Args:
+            artifact_id: Start artifact
+            max_depth: Max hops (1 = direct relations)
+            relationship_types: Only follow these relationship types
+            direction: "outgoing", "incoming" or "both"
+            limit: Max artifacts returned
+        
+        Returns: Reachable artifacts with depth, relationship type and path
+        """
+        logger.info(f"Canon traverse: {artifact_id} (depth {max_depth}, {direction})")
+        
+        return self.canon.traverse_related(artifact_id, max_depth=max_depth,
+                                           relationship_types=relationship_types,
+                                           direction=direction, limit=limit)
+    
     def link(self, source_id: str, target_id: str,
             relationship_type: str = "related") -> bool:
         """
@@ -308,7 +746,8 @@ class CanonTools:
             "embeddings": {
                 "total_embeddings": int,
                 "missing_embeddings": int,
-                "embedding_model": str
+                "embedding_model": str,
+                "query_cache": {hits, misses, hit_rate, entries, ...}
             }
         }
         """
@@ -322,7 +761,8 @@ class CanonTools:
         
         return stats
     
-    def reindex_embeddings(self) -> Dict[str, int]:
+    def reindex_embeddings(self, incremental: bool = True, resume: bool = True,
+                           **pipeline_options) -> Dict[str, Any]:
         """
         Regenerate embeddings for all artifacts
         
@@ -331,32 +771,89 @@ class CanonTools:
         - After bulk importing artifacts
         - After changing embedding model
         
-        Returns: {total, success, failed}
+        Args:
+            incremental: Only embed missing/stale artifacts (False = all)
+            resume: Continue an interrupted reindex from its checkpoint
+            **pipeline_options: Batch size / concurrency / rate limit knobs
+        
+        Returns: {total, success, failed, skipped, requests, ...}
         """
         if not self.embeddings:
             logger.error("Semantic search not enabled")
-            return {"total": 0, "success": 0, "failed": 0}
+            return {"total": 0, "success": 0, "failed": 0, "skipped": 0}
         
         logger.info("Reindexing all embeddings")
-        return self.embeddings.reindex_all(self.canon)
+        return self.embeddings.reindex_all(self.canon, incremental=incremental,
+                                           resume=resume, **pipeline_options)
+    
+    def compress(self, compression: str = None, train_dictionary: bool = True,
+                sample_size: int = 500) -> Dict[str, Any]:
+        """
+        Compress already-stored artifact content
+        
+        New writes are compressed as they arrive once a codec is set; this
+        migrates existing rows (and trains a dictionary on them first).
+        Reads stay transparent: get/search return plain text.
+        
+        Args:
+            compression: "zlib" or "zstd" (default: the CanonIndex codec)
+            train_dictionary: Train a dictionary on existing artifacts first
+            sample_size: Artifacts sampled for training
+        
+        Returns: {compressed, unchanged, dictionary_id, bytes_before, bytes_after, ...}
+        """
+        logger.info(f"Canon compress: {compression or self.canon.codec.compression}")
+        
+        return self.canon.compress_artifacts(compression=compression,
+                                             train_dictionary=train_dictionary,
+                                             sample_size=sample_size)
+    
+    def close(self):
+        """Stop the hybrid search workers and close the embeddings (and own CanonIndex)"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        if self.embeddings is not None:
+            self.embeddings.close()
+        if self._owns_canon:
+            self.canon.close()
 
 
 # Helper function to create CanonTools
 def create_canon_tools(canon_db_path: str = "canon.db", 
                       use_semantic_search: bool = True,
-                      openai_api_key: str = None) -> CanonTools:
+                      openai_api_key: str = None,
+                      approximate_search: bool = False,
+                      ann_options: Dict[str, Any] = None,
+                      search_mode: str = "semantic",
+                      embedding_provider: str = None,
+                      quantization: str = None,
+                      compression: str = None) -> CanonTools:
     """
     Factory function to create CanonTools
     
     Args:
         canon_db_path: Path to Canon SQLite database
-        use_semantic_search: Enable semantic search (requires OpenAI API key)
+        use_semantic_search: Enable semantic search
         openai_api_key: OpenAI API key for embeddings
+        approximate_search: Default to ANN (IVF) search instead of exact scan
+        ann_options: ANN index knobs, e.g. {"nprobe": 8}
+        search_mode: Default search mode: "semantic", "text" or "hybrid"
+        embedding_provider: "openai" or "local" (see CanonTools)
+        quantization: Compress resident vectors: None, "int8" or "pq"
+        compression: Compress stored artifact content: None, "zlib" or "zstd"
     """
-    canon_index = CanonIndex(db_path=canon_db_path)
+    # CanonTools creates the CanonIndex itself, so close() also closes it
     return CanonTools(
-        canon_index=canon_index,
         canon_db_path=canon_db_path,
         use_semantic_search=use_semantic_search,
-        openai_api_key=openai_api_key
+        openai_api_key=openai_api_key,
+        approximate_search=approximate_search,
+        ann_options=ann_options,
+        search_mode=search_mode,
+        embedding_provider=embedding_provider,
+        quantization=quantization,
+        compression=compression
     )
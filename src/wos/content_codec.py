@@ -0,0 +1,307 @@
+"""
+WOS Content Codec v0
+Transparent per-row compression of Canon artifact content
+zlib (stdlib) or zstd (optional `zstandard`), with dictionaries trained
+on the Canon's own artifacts
+"""
+
+import time
+import zlib
+import logging
+import threading
+import weakref
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger("wos.content_codec")
+
+# artifacts.content_encoding: NULL = plain text, "<codec>" = compressed,
+# "<codec>:<dict_id>" = compressed with a compression_dictionaries row
+CODECS = ("zlib", "zstd")
+
+# SQL function registered on every connection: wos_decompress(content, content_encoding)
+SQL_FUNCTION = "wos_decompress"
+
+# zlib only looks back 32 KB, so a larger preset dictionary is never used
+ZLIB_MAX_DICT_SIZE = 32 * 1024
+ZSTD_DICT_SIZE = 64 * 1024
+
+# Rows that shrink less than this stay plain text (not worth decoding)
+MIN_SAVINGS = 0.1
+
+
+def _zstandard():
+    import zstandard  # Optional dependency: only needed for zstd compression
+    return zstandard
+
+
+class ContentCodec:
+    """
+    Compresses artifact content on write and decodes it on read
+
+    One codec per database (see get_content_codec). It registers
+    wos_decompress() on every connection, so the FTS index rebuild and
+    SQL-side search expressions work on plain text while the artifacts
+    table stores compressed bytes.
+
+    Compression is per row: only when a codec is set, the text is at least
+    `min_size` bytes and compressing saves at least 10%. Plain and
+    compressed rows (and rows from older dictionaries) mix freely, and every
+    row stays readable with compression switched off.
+    """
+
+    def __init__(self, db, compression: str = None, min_size: int = 256,
+                 level: int = None):
+        """
+        Args:
+            db: wos.db.ConnectionManager of the Canon database
+            compression: None (store plain text), "zlib" or "zstd"
+            min_size: Smallest content (bytes) worth compressing
+            level: Codec compression level (default: zlib 6, zstd 3)
+        """
+        self.db = db
+        self.min_size = min_size
+        self.level = level
+        self.compression = None
+        self.dictionary_id = None
+        self._dictionaries: Dict[int, Tuple[str, bytes]] = {}
+        self._zstd_dicts: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+        self.stats = {"encoded": 0, "decoded": 0, "decode_seconds": 0.0,
+                      "max_decode_seconds": 0.0}
+
+        self.init_db()
+        db.create_function(SQL_FUNCTION, 2, self._sql_decode)
+        self.set_compression(compression)
+
+    def init_db(self):
+        """Create the dictionary table"""
+        with self.db.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS compression_dictionaries (
+                    dict_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    codec TEXT NOT NULL,
+                    data BLOB NOT NULL,
+                    sample_count INTEGER,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+    def set_compression(self, compression: str = None):
+        """
+        Choose the codec for new writes (None = plain text)
+
+        zstd falls back to zlib when the zstandard package is missing.
+        The newest dictionary trained for the codec becomes active.
+        """
+        if compression and compression not in CODECS:
+            raise ValueError(f"Unknown compression: {compression} (use one of {CODECS})")
+
+        if compression == "zstd":
+            try:
+                _zstandard()
+            except ImportError:
+                logger.warning("zstandard not installed, compressing Canon content with zlib")
+                compression = "zlib"
+
+        self.compression = compression
+        self.dictionary_id = None
+        if compression:
+            with self.db.reader() as conn:
+                row = conn.execute("""
+                    SELECT dict_id FROM compression_dictionaries
+                    WHERE codec = ? ORDER BY dict_id DESC LIMIT 1
+                """, (compression,)).fetchone()
+            self.dictionary_id = row[0] if row else None
+
+    def encode(self, text: str) -> Tuple[Any, Optional[str]]:
+        """
+        Content value to store and its content_encoding
+
+        Returns: (text, None) when left uncompressed, else (bytes, encoding)
+        """
+        if not self.compression or text is None:
+            return text, None
+
+        raw = text.encode("utf-8")
+        if len(raw) < self.min_size:
+            return text, None
+
+        data = self._compress(self.compression, raw, self.dictionary_id)
+        if len(data) > len(raw) * (1 - MIN_SAVINGS):
+            return text, None
+
+        self.stats["encoded"] += 1
+        if self.dictionary_id:
+            return data, f"{self.compression}:{self.dictionary_id}"
+        return data, self.compression
+
+    def decode(self, value: Any, encoding: Optional[str]) -> Any:
+        """Plain text of a stored content value"""
+        if not encoding or value is None:
+            return value
+
+        start = time.perf_counter()
+        codec, _, dict_id = encoding.partition(":")
+        text = self._decompress(codec, value, int(dict_id) if dict_id else None).decode("utf-8")
+
+        elapsed = time.perf_counter() - start
+        self.stats["decoded"] += 1
+        self.stats["decode_seconds"] += elapsed
+        if elapsed > self.stats["max_decode_seconds"]:
+            self.stats["max_decode_seconds"] = elapsed
+        return text
+
+    def _sql_decode(self, value, encoding):
+        return self.decode(value, encoding)
+
+    def _compress(self, codec: str, raw: bytes, dict_id: int = None) -> bytes:
+        level = self.level
+        if codec == "zstd":
+            zstd = _zstandard()
+            compressor = zstd.ZstdCompressor(level=level or 3,
+                                             dict_data=self._zstd_dict(dict_id))
+            return compressor.compress(raw)
+
+        if dict_id:
+            compressor = zlib.compressobj(level or 6, zdict=self._dictionary(dict_id, codec))
+            return compressor.compress(raw) + compressor.flush()
+        return zlib.compress(raw, level or 6)
+
+    def _decompress(self, codec: str, data: bytes, dict_id: int = None) -> bytes:
+        if codec == "zstd":
+            zstd = _zstandard()
+            return zstd.ZstdDecompressor(dict_data=self._zstd_dict(dict_id)).decompress(data)
+
+        if codec == "zlib":
+            if dict_id:
+                decompressor = zlib.decompressobj(zdict=self._dictionary(dict_id, codec))
+                return decompressor.decompress(data) + decompressor.flush()
+            return zlib.decompress(data)
+
+        raise ValueError(f"Unknown content encoding: {codec}")
+
+    def _dictionary(self, dict_id: int, codec: str) -> bytes:
+        """Dictionary bytes (cached; loaded on first use)"""
+        entry = self._dictionaries.get(dict_id)
+        if entry is None:
+            with self.db.reader() as conn:
+                row = conn.execute("""
+                    SELECT codec, data FROM compression_dictionaries WHERE dict_id = ?
+                """, (dict_id,)).fetchone()
+            if row is None:
+                raise ValueError(f"Compression dictionary {dict_id} not found")
+            entry = (row[0], bytes(row[1]))
+            with self._lock:
+                self._dictionaries[dict_id] = entry
+
+        if entry[0] != codec:
+            raise ValueError(f"Dictionary {dict_id} is for {entry[0]}, not {codec}")
+        return entry[1]
+
+    def _zstd_dict(self, dict_id: int = None):
+        if not dict_id:
+            return None
+        zstd_dict = self._zstd_dicts.get(dict_id)
+        if zstd_dict is None:
+            zstd_dict = _zstandard().ZstdCompressionDict(self._dictionary(dict_id, "zstd"))
+            with self._lock:
+                self._zstd_dicts[dict_id] = zstd_dict
+        return zstd_dict
+
+    def train_dictionary(self, samples: List[str], dict_size: int = None) -> Optional[int]:
+        """
+        Train a dictionary for the current codec and make it active
+
+        zstd uses its own trainer; zlib gets a preset dictionary of the
+        lines most shared across samples (boilerplate headings, templates),
+        most common last since zlib favours the closest matches.
+
+        Returns: dict_id, or None if compression is off or nothing was learned
+        """
+        if not self.compression:
+            logger.warning("Compression is off, not training a dictionary")
+            return None
+
+        encoded = [sample.encode("utf-8") for sample in samples if sample]
+        try:
+            if self.compression == "zstd":
+                data = _zstandard().train_dictionary(dict_size or ZSTD_DICT_SIZE, encoded).as_bytes()
+            else:
+                data = self._build_zlib_dictionary(encoded, min(dict_size or ZLIB_MAX_DICT_SIZE,
+                                                                ZLIB_MAX_DICT_SIZE))
+        except Exception as e:
+            logger.warning(f"Dictionary training failed ({len(encoded)} samples): {e}")
+            return None
+
+        if not data:
+            logger.info("No shared content across samples, no dictionary trained")
+            return None
+
+        with self.db.transaction() as conn:
+            cursor = conn.execute("""
+                INSERT INTO compression_dictionaries (codec, data, sample_count)
+                VALUES (?, ?, ?)
+            """, (self.compression, data, len(encoded)))
+            dict_id = cursor.lastrowid
+
+        with self._lock:
+            self._dictionaries[dict_id] = (self.compression, data)
+        self.dictionary_id = dict_id
+        logger.info(f"Trained {self.compression} dictionary {dict_id} "
+                    f"({len(data)} bytes from {len(encoded)} samples)")
+        return dict_id
+
+    @staticmethod
+    def _build_zlib_dictionary(samples: List[bytes], dict_size: int) -> bytes:
+        """Lines occurring in more than one sample, best savings last"""
+        frequency = Counter()
+        for sample in samples:
+            frequency.update(set(line for line in sample.splitlines(keepends=True)
+                                 if len(line.strip()) >= 8))
+
+        shared = [(count * len(line), line) for line, count in frequency.items() if count > 1]
+        shared.sort(reverse=True)
+
+        chosen, size = [], 0
+        for _, line in shared:
+            if size + len(line) > dict_size:
+                continue
+            chosen.append(line)
+            size += len(line)
+
+        return b"".join(reversed(chosen))
+
+    def get_stats(self) -> Dict[str, Any]:
+        decoded = self.stats["decoded"]
+        return {
+            "compression": self.compression,
+            "dictionary_id": self.dictionary_id,
+            "encoded": self.stats["encoded"],
+            "decoded": decoded,
+            "avg_decode_ms": round(self.stats["decode_seconds"] * 1000 / decoded, 4) if decoded else None,
+            "max_decode_ms": round(self.stats["max_decode_seconds"] * 1000, 4)
+        }
+
+
+_codecs: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_codecs_lock = threading.Lock()
+
+
+def get_content_codec(db, compression: str = None) -> ContentCodec:
+    """
+    The ContentCodec of a database (created and registered on first use)
+
+    Every component reading artifact content through SQL must call this
+    first so wos_decompress() exists on its connections. A non-None
+    `compression` switches the codec used for new writes.
+    """
+    with _codecs_lock:
+        codec = _codecs.get(db)
+        if codec is None:
+            codec = ContentCodec(db)
+            _codecs[db] = codec
+
+    if compression and compression != codec.compression:
+        codec.set_compression(compression)
+    return codec
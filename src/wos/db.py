@@ -0,0 +1,255 @@
+"""
+WOS Database v0
+Shared SQLite connection manager for canon.db / intent_registry.db
+WAL journaling, tuned pragmas, pooled readers + one serialized writer
+"""
+
+import os
+import queue
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any
+
+logger = logging.getLogger("wos.db")
+
+# Applied to every connection. WAL lets readers run while the writer commits;
+# synchronous=NORMAL is durable across application crashes in WAL mode and
+# skips the per-commit fsync of FULL.
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,        # ms to wait on another process's lock
+    "cache_size": -32000,        # ~32 MB page cache per connection
+    "mmap_size": 268435456,      # 256 MB memory-mapped reads
+    "temp_store": "MEMORY",
+    "recursive_triggers": "ON",  # INSERT OR REPLACE must fire delete triggers (FTS sync)
+}
+
+
+class ConnectionManager:
+    """
+    One SQLite database, shared by every component that opens it
+
+    - Writer: a single connection; transaction() serializes writers across
+      threads with a lock and BEGIN IMMEDIATE, so concurrent writers queue
+      instead of failing with "database is locked". Nested transaction()
+      calls become SAVEPOINTs, so helpers can be atomic on their own and
+      still join a caller's larger transaction.
+    - Readers: a small pool of query-only connections (WAL snapshots, never
+      blocked by the writer). A thread inside transaction() reads through
+      the writer so it sees its own uncommitted rows.
+    - Prepared statements: each connection keeps an LRU of compiled
+      statements keyed by SQL text (`cached_statements`).
+
+    Connections run in autocommit mode (isolation_level=None): statements
+    outside transaction() commit individually.
+    """
+
+    def __init__(self, db_path: str, max_readers: int = 4,
+                 pragmas: Dict[str, Any] = None, cached_statements: int = 256):
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self.pragmas = dict(DEFAULT_PRAGMAS, **(pragmas or {}))
+        self.cached_statements = cached_statements
+
+        # In-memory databases are per-connection: everything uses the writer
+        self.in_memory = db_path == ":memory:" or db_path.startswith("file::memory:")
+
+        self._write_lock = threading.RLock()
+        self._depth = 0
+        self._owner = None
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._reader_conns = []
+        self._functions: Dict[str, tuple] = {}
+        self._refs = 0
+        self.closed = False
+
+        self.writer = self._connect()
+        logger.info(f"Opened {db_path} (journal_mode={self._journal_mode()})")
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.pragmas.get("busy_timeout", 5000) / 1000.0,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            if name == "journal_mode" and self.in_memory:
+                continue
+            conn.execute(f"PRAGMA {name} = {value}")
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        for name, (num_params, func) in self._functions.items():
+            conn.create_function(name, num_params, func, deterministic=True)
+        return conn
+
+    def create_function(self, name: str, num_params: int, func):
+        """
+        Register a deterministic SQL function on every connection (current
+        and future), e.g. for use in triggers and views
+        """
+        self._functions[name] = (num_params, func)
+        with self._write_lock:
+            self.writer.create_function(name, num_params, func, deterministic=True)
+        with self._reader_lock:
+            for conn in self._reader_conns:
+                conn.create_function(name, num_params, func, deterministic=True)
+
+    def _journal_mode(self) -> str:
+        return self.writer.execute("PRAGMA journal_mode").fetchone()[0]
+
+    @contextmanager
+    def transaction(self):
+        """
+        Serialized write transaction on the shared writer
+
+        Commits on success, rolls back on exception. Nested calls (same
+        thread) use a SAVEPOINT: an inner failure only undoes the inner work.
+        """
+        with self._write_lock:
+            self._depth += 1
+            depth = self._depth
+            savepoint = f"sp_{depth}"
+            try:
+                if depth == 1:
+                    self._owner = threading.get_ident()
+                    self.writer.execute("BEGIN IMMEDIATE")
+                else:
+                    self.writer.execute(f"SAVEPOINT {savepoint}")
+
+                try:
+                    yield self.writer
+                except BaseException:
+                    if depth == 1:
+                        self.writer.execute("ROLLBACK")
+                    else:
+                        self.writer.execute(f"ROLLBACK TO {savepoint}")
+                        self.writer.execute(f"RELEASE {savepoint}")
+                    raise
+
+                if depth == 1:
+                    self.writer.execute("COMMIT")
+                else:
+                    self.writer.execute(f"RELEASE {savepoint}")
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._owner = None
+
+    @contextmanager
+    def exclusive(self):
+        """Writer connection with the lock held but no transaction (VACUUM, DDL batches)"""
+        with self._write_lock:
+            yield self.writer
+
+    @contextmanager
+    def reader(self):
+        """Read connection from the pool (the writer inside a transaction)"""
+        if self.in_memory or self._owner == threading.get_ident():
+            with self._write_lock:
+                yield self.writer
+            return
+
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            self._readers.put(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._reader_lock:
+            if self._reader_count < self.max_readers:
+                self._reader_count += 1
+                conn = self._connect(read_only=True)
+                self._reader_conns.append(conn)
+                return conn
+
+        return self._readers.get()
+
+    def acquire(self) -> "ConnectionManager":
+        # Users come and go on any thread: the count lives under the
+        # registry lock, so a manager is never handed out while closing
+        with _registry_lock:
+            self._refs += 1
+            return self
+
+    def release(self):
+        """Drop one user; the last one closes the connections"""
+        with _registry_lock:
+            self._refs -= 1
+            if self._refs > 0 or not self._detach():
+                return
+        self._close_connections()
+
+    def close(self):
+        with _registry_lock:
+            if not self._detach():
+                return
+        self._close_connections()
+
+    def _detach(self) -> bool:
+        """Mark closed and unregister (caller holds _registry_lock); False if already closed"""
+        if self.closed:
+            return False
+        self.closed = True
+        if _registry.get(self._key()) is self:
+            del _registry[self._key()]
+        return True
+
+    def _close_connections(self):
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            self.writer.close()
+        logger.info(f"Closed {self.db_path}")
+
+    def _key(self) -> str:
+        return os.path.abspath(self.db_path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "db_path": self.db_path,
+            "journal_mode": self._journal_mode(),
+            "readers": self._reader_count,
+            "users": self._refs
+        }
+
+
+_registry: Dict[str, ConnectionManager] = {}
+_registry_lock = threading.RLock()
+
+
+def get_connection_manager(db_path: str, **options) -> ConnectionManager:
+    """
+    Shared ConnectionManager for a database file (one per absolute path)
+
+    Every caller must release() it when done (component close()).
+    In-memory databases are never shared.
+    """
+    if db_path == ":memory:":
+        return ConnectionManager(db_path, **options).acquire()
+
+    key = os.path.abspath(db_path)
+    with _registry_lock:
+        manager = _registry.get(key)
+        if manager is None or manager.closed:
+            manager = ConnectionManager(db_path, **options)
+            _registry[key] = manager
+        return manager.acquire()
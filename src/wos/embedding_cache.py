@@ -0,0 +1,124 @@
+"""
+WOS Query Embedding Cache v0
+Bounded LRU (with TTL) of query embeddings for Canon semantic search
+Avoids a paid ~200 ms embeddings call for repeated queries
+"""
+
+import time
+import threading
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Callable
+
+logger = logging.getLogger("wos.embedding_cache")
+
+class QueryEmbeddingCache:
+    """
+    Thread-safe LRU cache of query embeddings
+
+    Keys are (model, normalized query text): case and whitespace differences
+    ("Brand  Voice" vs "brand voice") share an entry. Entries older than
+    ttl_seconds are treated as misses and evicted on access.
+
+    Optional backing store (e.g. a canon.db table) so entries survive
+    restarts: `loader(model, normalized_text) -> (embedding, created_at)`
+    is consulted on memory misses, `saver(model, normalized_text, embedding,
+    created_at)` is called on put. Both run on the caller's thread.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 7 * 24 * 3600,
+                 loader: Callable = None, saver: Callable = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.loader = loader
+        self.saver = saver
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[List[float], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Canonical cache form of a query: lowercased, single-spaced"""
+        return " ".join(text.lower().split())
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Return a cached embedding (and mark it recently used) or None"""
+        key = (model, self.normalize(text))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                embedding, created_at = entry
+                if not self._is_expired(created_at):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return embedding
+                del self._entries[key]
+                self.expired += 1
+
+        if self.loader:
+            try:
+                stored = self.loader(*key)
+            except Exception as e:
+                logger.warning(f"Query cache backing store lookup failed: {e}")
+                stored = None
+            if stored and not self._is_expired(stored[1]):
+                with self._lock:
+                    self._insert(key, stored[0], stored[1])
+                    self.hits += 1
+                    self.persistent_hits += 1
+                return stored[0]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, model: str, text: str, embedding: List[float],
+            created_at: float = None):
+        """Insert an embedding, evicting least-recently-used entries past capacity"""
+        key = (model, self.normalize(text))
+        created_at = created_at or time.time()
+        with self._lock:
+            self._insert(key, embedding, created_at)
+
+        if self.saver:
+            try:
+                self.saver(*key, embedding, created_at)
+            except Exception as e:
+                logger.warning(f"Query cache backing store write failed: {e}")
+
+    def _insert(self, key, embedding: List[float], created_at: float):
+        """Add/refresh an entry and enforce capacity (caller holds the lock)"""
+        self._entries[key] = (embedding, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _is_expired(self, created_at: float) -> bool:
+        return bool(self.ttl_seconds) and time.time() - created_at > self.ttl_seconds
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
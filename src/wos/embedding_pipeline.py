@@ -0,0 +1,369 @@
+"""
+WOS Embedding Pipeline v0
+Batched, rate-limited, parallel embedding generation for Canon reindexing
+Replaces one-request-per-artifact + commit-per-row reindex_all
+"""
+
+import time
+import random
+import threading
+import logging
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Iterator, Tuple
+
+from wos.canon_embeddings import text_checksum, MAX_EMBEDDING_CHARS
+from wos.content_codec import get_content_codec
+
+logger = logging.getLogger("wos.embedding_pipeline")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 chars per token for English markdown)"""
+    return len(text) // 4 + 1
+
+
+class TokenBucket:
+    """
+    Thread-safe token-per-minute budget
+
+    acquire(n) blocks until n tokens are available. Requests larger than the
+    whole budget are let through once the bucket is full, so they can't
+    deadlock.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int):
+        tokens = min(float(tokens), self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait_seconds = (tokens - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+class EmbeddingPipeline:
+    """
+    Embedding Pipeline
+
+    - Packs many artifacts (whole text + passage chunks) into each embeddings
+      request, bounded by input count and estimated tokens
+    - Runs up to max_concurrency requests at once under a tokens/minute budget
+    - Retries failed requests with jittered exponential backoff
+    - Writes each finished batch in one transaction (SQLite work stays on
+      the calling thread; workers only make HTTP calls)
+    - Records a checkpoint (last contiguous artifact_id done) per job, so an
+      interrupted run resumes where it stopped
+    """
+
+    def __init__(self, embeddings, batch_size: int = 96,
+                 max_batch_tokens: int = 250_000, max_concurrency: int = 4,
+                 tokens_per_minute: int = 1_000_000, max_retries: int = 5,
+                 base_delay: float = 1.0, page_size: int = 500):
+        """
+        Args:
+            embeddings: CanonEmbeddings instance (provides API + storage)
+            batch_size: Max inputs per embeddings request
+            max_batch_tokens: Max estimated tokens per request
+            max_concurrency: Max requests in flight
+            tokens_per_minute: Rate budget shared by all workers (hosted
+                providers only; None = unthrottled)
+            max_retries: Attempts per request after the first
+            base_delay: Initial backoff delay in seconds
+            page_size: Artifacts read from SQLite per page
+        """
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.page_size = page_size
+        # Artifact content may be stored compressed
+        self.codec = get_content_codec(embeddings.db)
+        # Local providers have no quota to respect
+        self.rate_limiter = None
+        if tokens_per_minute and embeddings.provider.rate_limited:
+            self.rate_limiter = TokenBucket(tokens_per_minute)
+
+        self.init_db()
+
+    def init_db(self):
+        """Create the checkpoint table"""
+        with self.embeddings.db.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_checkpoints (
+                    job_id TEXT PRIMARY KEY,
+                    last_artifact_id TEXT,
+                    processed INTEGER DEFAULT 0,
+                    failed INTEGER DEFAULT 0,
+                    completed BOOLEAN DEFAULT 0,
+                    updated_at TEXT
+                )
+            """)
+
+    def run(self, job_id: str = "reindex_all", incremental: bool = True,
+            resume: bool = True) -> Dict[str, Any]:
+        """
+        Embed every pending artifact
+
+        Args:
+            job_id: Checkpoint key
+            incremental: Skip artifacts whose embedding is current
+            resume: Continue after the last checkpoint of an unfinished job
+
+        Returns: Stats {total, success, failed, skipped, requests,
+                        resumed_after, elapsed_seconds}
+        """
+        start = time.monotonic()
+        after_id = self._load_checkpoint(job_id) if resume else None
+        if after_id:
+            logger.info(f"Resuming {job_id} after artifact {after_id}")
+        self._save_checkpoint(job_id, after_id, 0, 0, completed=False)
+
+        stats = {"total": 0, "success": 0, "failed": 0, "skipped": 0,
+                 "requests": 0, "resumed_after": after_id}
+
+        existing = self._load_existing() if incremental else {}
+
+        # Checkpoint watermark only advances over contiguous finished batches
+        finished = {}
+        next_seq = 0
+        watermark = after_id
+        blocked = False
+
+        def on_batch(seq: int, batch: List[Tuple[str, List[str], str, list]], ok: bool):
+            nonlocal next_seq, watermark, blocked
+            finished[seq] = (batch[-1][0], ok)
+            while next_seq in finished:
+                last_id, done = finished.pop(next_seq)
+                blocked = blocked or not done
+                if not blocked:
+                    watermark = last_id
+                next_seq += 1
+
+            # Runs inside the batch's transaction: rows + checkpoint commit together
+            self._save_checkpoint(job_id, watermark, stats["success"], stats["failed"],
+                                  completed=False)
+
+        self._process(self._pending(self._iter_artifacts(after_id), existing, stats),
+                      stats, on_batch)
+
+        self._save_checkpoint(job_id, watermark, stats["success"], stats["failed"],
+                              completed=not blocked)
+        stats["elapsed_seconds"] = round(time.monotonic() - start, 2)
+        logger.info(f"Embedding pipeline {job_id} finished: {stats}")
+        return stats
+
+    def embed_artifacts(self, artifact_ids: List[str], incremental: bool = True) -> Dict[str, Any]:
+        """
+        Embed a given set of artifacts (e.g. right after a bulk import)
+
+        Same batching, concurrency and retries as run(), without a checkpoint:
+        anything that fails is picked up by the next incremental reindex.
+
+        Returns: Stats {total, success, failed, skipped, requests, elapsed_seconds}
+        """
+        start = time.monotonic()
+        stats = {"total": 0, "success": 0, "failed": 0, "skipped": 0, "requests": 0}
+        existing = self._load_existing() if incremental else {}
+
+        self._process(self._pending(self._iter_artifacts_by_id(artifact_ids), existing, stats),
+                      stats)
+
+        stats["elapsed_seconds"] = round(time.monotonic() - start, 2)
+        logger.info(f"Embedded {len(artifact_ids)} artifacts: {stats}")
+        return stats
+
+    def _pending(self, artifacts: Iterator[Tuple[str, str]], existing: Dict,
+                 stats: Dict[str, Any]) -> Iterator[Tuple[str, List[str], str, list]]:
+        """(artifact_id, inputs, checksum, chunks) for artifacts needing embeddings"""
+        current_model = (self.embeddings.embedding_provider, self.embeddings.embedding_model)
+        for artifact_id, text in artifacts:
+            stats["total"] += 1
+            checksum = text_checksum(text)
+            if existing.get(artifact_id) == (checksum, current_model, checksum):
+                stats["skipped"] += 1
+                continue
+            chunks = self.embeddings.chunk_text(text)
+            yield artifact_id, self.embeddings.embedding_inputs(text, chunks), checksum, chunks
+
+    def _process(self, items: Iterator[Tuple[str, List[str], str, list]],
+                 stats: Dict[str, Any], on_batch=None):
+        """
+        Embed and store pending items
+
+        Requests run on worker threads; each finished batch is stored in one
+        transaction on this thread, together with on_batch(seq, batch, ok).
+        """
+        def handle(seq: int, batch: List[Tuple[str, List[str], str, list]], vectors):
+            stats["requests"] += 1
+
+            with self.embeddings.db.transaction():
+                if vectors is None:
+                    stats["failed"] += len(batch)
+                else:
+                    # Split the flat response back into per-artifact vector lists
+                    offset = 0
+                    for artifact_id, inputs, checksum, chunks in batch:
+                        artifact_vectors = vectors[offset:offset + len(inputs)]
+                        offset += len(inputs)
+                        if self.embeddings.store_artifact_vectors(artifact_id, chunks,
+                                                                  artifact_vectors, checksum):
+                            stats["success"] += 1
+                        else:
+                            stats["failed"] += 1
+
+                if on_batch:
+                    on_batch(seq, batch, vectors is not None)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                thread_name_prefix="embed") as executor:
+            in_flight = {}
+            for seq, batch in enumerate(self._batches(items)):
+                # Bounded queue: memory stays flat regardless of Canon size
+                while len(in_flight) >= self.max_concurrency * 2:
+                    self._drain(in_flight, handle, FIRST_COMPLETED)
+                inputs = [text for _, texts, _, _ in batch for text in texts]
+                future = executor.submit(self._embed_batch, inputs)
+                in_flight[future] = (seq, batch)
+            while in_flight:
+                self._drain(in_flight, handle, FIRST_COMPLETED)
+
+    def _drain(self, in_flight: Dict, handle, return_when):
+        done, _ = wait(list(in_flight), return_when=return_when)
+        for future in done:
+            seq, batch = in_flight.pop(future)
+            try:
+                vectors = future.result()
+            except Exception as e:
+                logger.error(f"Embedding batch {seq} failed permanently: {e}")
+                vectors = None
+            handle(seq, batch, vectors)
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """One embeddings request with rate limiting and retries (worker thread)"""
+        tokens = sum(estimate_tokens(text[:MAX_EMBEDDING_CHARS]) for text in texts)
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(tokens)
+            try:
+                vectors = self.embeddings.generate_embeddings(texts)
+                if len(vectors) != len(texts):
+                    raise ValueError(f"Expected {len(texts)} embeddings, got {len(vectors)}")
+                return vectors
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.base_delay * (2 ** attempt) * (0.5 + random.random())
+                attempt += 1
+                logger.warning(f"Embedding request failed ({e}), retry {attempt} in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _batches(self, items: Iterator[Tuple[str, List[str], str, list]]):
+        """
+        Pack artifacts into requests bounded by input count and estimated tokens
+
+        An artifact's inputs are never split across requests, so one very long
+        document may exceed batch_size on its own.
+        """
+        batch, batch_inputs, batch_tokens = [], 0, 0
+        for item in items:
+            inputs = len(item[1])
+            tokens = sum(estimate_tokens(text[:MAX_EMBEDDING_CHARS]) for text in item[1])
+            if batch and (batch_inputs + inputs > self.batch_size or
+                          batch_tokens + tokens > self.max_batch_tokens):
+                yield batch
+                batch, batch_inputs, batch_tokens = [], 0, 0
+            batch.append(item)
+            batch_inputs += inputs
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+    def _iter_artifacts(self, after_id: str = None) -> Iterator[Tuple[str, str]]:
+        """Artifacts in artifact_id order, one page at a time"""
+        last_id = after_id or ""
+        while True:
+            with self.embeddings.db.reader() as conn:
+                rows = conn.execute("""
+                    SELECT artifact_id, title, summary, content, content_encoding FROM artifacts
+                    WHERE artifact_id > ?
+                    ORDER BY artifact_id
+                    LIMIT ?
+                """, (last_id, self.page_size)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row[0], self._artifact_text(row)
+            last_id = rows[-1][0]
+
+    def _artifact_text(self, row) -> str:
+        """Embedded text: title, summary and (decoded) content"""
+        content = self.codec.decode(row[3], row[4])
+        return f"{row[1] or ''}\n{row[2] or ''}\n{content or ''}"
+
+    def _iter_artifacts_by_id(self, artifact_ids: List[str]) -> Iterator[Tuple[str, str]]:
+        """The given artifacts (missing ids skipped), one page at a time"""
+        for offset in range(0, len(artifact_ids), self.page_size):
+            page = artifact_ids[offset:offset + self.page_size]
+            placeholders = ",".join("?" * len(page))
+            with self.embeddings.db.reader() as conn:
+                rows = conn.execute(f"""
+                    SELECT artifact_id, title, summary, content, content_encoding FROM artifacts
+                    WHERE artifact_id IN ({placeholders})
+                    ORDER BY artifact_id
+                """, page).fetchall()
+            for row in rows:
+                yield row[0], self._artifact_text(row)
+
+    def _load_existing(self) -> Dict[str, Tuple[str, Tuple[str, str], str]]:
+        """
+        {artifact_id: (checksum, (provider, model), chunk checksum)} for stored
+        embeddings; chunk checksum is None when the artifact has no current chunks
+        """
+        with self.embeddings.db.reader() as conn:
+            cursor = conn.execute("""
+                SELECT artifact_id, content_checksum FROM artifact_chunks
+                WHERE embedding_provider = ? AND embedding_model = ?
+                GROUP BY artifact_id
+            """, (self.embeddings.embedding_provider, self.embeddings.embedding_model))
+            chunked = {row[0]: row[1] for row in cursor.fetchall()}
+
+            cursor = conn.execute("""
+                SELECT artifact_id, content_checksum, embedding_provider, embedding_model
+                FROM artifact_embeddings
+            """)
+            return {row[0]: (row[1], (row[2], row[3]), chunked.get(row[0]))
+                    for row in cursor.fetchall()}
+
+    def _load_checkpoint(self, job_id: str):
+        with self.embeddings.db.reader() as conn:
+            row = conn.execute("""
+                SELECT last_artifact_id, completed FROM embedding_checkpoints WHERE job_id = ?
+            """, (job_id,)).fetchone()
+        if not row or row[1]:
+            return None
+        return row[0]
+
+    def _save_checkpoint(self, job_id: str, last_artifact_id: str, processed: int,
+                         failed: int, completed: bool):
+        with self.embeddings.db.transaction() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO embedding_checkpoints
+                (job_id, last_artifact_id, processed, failed, completed, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (job_id, last_artifact_id, processed, failed, completed,
+                  datetime.utcnow().isoformat()))
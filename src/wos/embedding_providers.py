@@ -0,0 +1,145 @@
+"""
+WOS Embedding Providers v0
+Pluggable text -> vector backends for Canon semantic search
+OpenAI (hosted) or a deterministic local hashing model (offline, zero-cost)
+"""
+
+import os
+import re
+import hashlib
+import logging
+import numpy as np
+from typing import List, Dict, Any
+
+logger = logging.getLogger("wos.embedding_providers")
+
+class EmbeddingProvider:
+    """
+    Base interface for embedding backends
+
+    embed() raises on failure so batch callers (EmbeddingPipeline) can retry;
+    CanonEmbeddings turns errors into None/False for single calls.
+    """
+
+    name = "base"
+
+    # Requests count against a hosted tokens/minute quota (EmbeddingPipeline
+    # only throttles providers that set this)
+    rate_limited = False
+
+    def __init__(self, model: str, dimension: int):
+        self.model = model
+        self.dimension = dimension
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """One vector per input text, in input order"""
+        raise NotImplementedError
+
+    def is_available(self) -> bool:
+        """True if the provider can serve requests (credentials, network deps)"""
+        return True
+
+    def describe(self) -> Dict[str, Any]:
+        return {"provider": self.name, "model": self.model, "dimension": self.dimension}
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """OpenAI embeddings API (text-embedding-3-small by default)"""
+
+    name = "openai"
+    rate_limited = True
+
+    def __init__(self, api_key: str = None, model: str = "text-embedding-3-small",
+                 dimension: int = 1536):
+        super().__init__(model, dimension)
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self._client = None
+
+        if not self.api_key:
+            logger.warning("OPENAI_API_KEY not set - embeddings will fail")
+
+    def is_available(self) -> bool:
+        return bool(self.api_key)
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        if self._client is None:
+            import openai  # Optional dependency: only needed for this provider
+            self._client = openai.OpenAI(api_key=self.api_key)
+
+        response = self._client.embeddings.create(model=self.model, input=texts)
+        data = sorted(response.data, key=lambda item: item.index)
+        return [item.embedding for item in data]
+
+
+class LocalHashEmbeddingProvider(EmbeddingProvider):
+    """
+    Deterministic local embeddings (no network, no key, no cost)
+
+    Signed feature hashing of word unigrams + bigrams with sublinear term
+    frequency - equivalent to a sparse random projection of the TF vector.
+    Lexical rather than semantic, but good enough to keep semantic search,
+    benchmarks and tests working offline. blake2b (not hash()) keeps vectors
+    stable across processes.
+    """
+
+    name = "local"
+
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+    def __init__(self, dimension: int = 512, model: str = None, ngrams: int = 2):
+        super().__init__(model or f"local-hash-{dimension}", dimension)
+        self.ngrams = ngrams
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed_one(text).tolist() for text in texts]
+
+    def _embed_one(self, text: str) -> np.ndarray:
+        tokens = self.TOKEN_PATTERN.findall(text.lower())
+        counts: Dict[str, int] = {}
+        for n in range(1, self.ngrams + 1):
+            for i in range(len(tokens) - n + 1):
+                feature = " ".join(tokens[i:i + n])
+                counts[feature] = counts.get(feature, 0) + 1
+
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for feature, count in counts.items():
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            sign = 1.0 if value & 1 else -1.0
+            vector[(value >> 1) % self.dimension] += sign * (1.0 + np.log(count))
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+# Provider registry - maps CanonEmbeddings(provider=...) names to classes
+EMBEDDING_PROVIDERS = {
+    "openai": OpenAIEmbeddingProvider,
+    "local": LocalHashEmbeddingProvider,
+}
+
+
+def create_embedding_provider(name: str = None, api_key: str = None,
+                              **options) -> EmbeddingProvider:
+    """
+    Build an embedding provider
+
+    Args:
+        name: Registered provider ("openai", "local"). None = WOS_EMBEDDING_PROVIDER
+              env var, else "openai" when an API key is available, else "local"
+        api_key: OpenAI API key (openai provider only)
+        **options: Provider-specific knobs (model, dimension, ...)
+    """
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    name = name or os.getenv("WOS_EMBEDDING_PROVIDER")
+    if not name:
+        name = "openai" if api_key else "local"
+        if name == "local":
+            logger.info("No OpenAI key: using local hashed embeddings")
+
+    if name not in EMBEDDING_PROVIDERS:
+        raise ValueError(f"Unknown embedding provider: {name}")
+
+    if name == "openai":
+        return OpenAIEmbeddingProvider(api_key=api_key, **options)
+    return EMBEDDING_PROVIDERS[name](**options)
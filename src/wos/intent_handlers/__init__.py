@@ -1,28 +1,48 @@
 """
 WOS Intent Handlers Package (Phase 3.3)
 Registry and factory for all intent handlers
+Handlers are created once per intent and reused across requests
 """
 
+import time
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, List
 
 logger = logging.getLogger("wos.intent_handlers")
 
 # Import handlers as they're added
-from wos.intent_handlers.creator_outreach import create_handler as create_creator_outreach_handler
-from wos.intent_handlers.content_idea_miner import create_handler as create_content_idea_miner_handler
+from wos.intent_handlers.creator_outreach import (
+    create_handler as create_creator_outreach_handler, CreatorOutreachHandler
+)
+from wos.intent_handlers.content_idea_miner import (
+    create_handler as create_content_idea_miner_handler, ContentIdeaMinerHandler
+)
 
 # Handler registry - maps intent_id to handler factory
+#
+# Lifecycle (all optional, each called with the handler instance):
+#   "warmup":       one-time setup after creation (load documents, prime caches)
+#   "health_check": cheap check before reuse, at most every HEALTH_CHECK_SECONDS;
+#                   False (or an exception) recycles the instance
+#   "shutdown":     release clients when the instance is dropped
+#   "reuse":        False to create a fresh handler per request (default True;
+#                   reused handlers must keep no per-request state)
 HANDLER_REGISTRY = {
     "creator_outreach_v0": {
         "factory": create_creator_outreach_handler,
         "name": "Creator Outreach",
         "version": "0.1",
+        "health_check": CreatorOutreachHandler.health_check,
+        "shutdown": CreatorOutreachHandler.shutdown,
     },
     "content_idea_miner_v1": {
         "factory": create_content_idea_miner_handler,
         "name": "Content Idea Miner",
         "version": "1.0",
+        "warmup": ContentIdeaMinerHandler.warmup,
+        "health_check": ContentIdeaMinerHandler.health_check,
+        "shutdown": ContentIdeaMinerHandler.shutdown,
     },
     # Future handlers will be added here:
     # "brief_generator_v0": {...},
@@ -30,11 +50,112 @@ HANDLER_REGISTRY = {
     # Note: daily_newsletter_digest is now autonomous (schedule-only, no webhook)
 }
 
+HEALTH_CHECK_SECONDS = 30
+
+# Recycled instances kept for their in-flight requests; past this, the
+# oldest is shut down anyway (a caller that never calls release_handler)
+MAX_RETIRED = 8
+
+# Handler pool: intent_id -> {"intent_id", "handler", "created_at", "checked_at",
+#                             "requests", "in_flight"}
+_pool: Dict[str, Dict[str, Any]] = {}
+# Recycled entries still serving requests: shut down by their last release
+_retired: List[Dict[str, Any]] = []
+_pool_lock = threading.Lock()
+_intent_locks: Dict[str, threading.Lock] = {}
+
+
+def _intent_lock(intent_id: str) -> threading.Lock:
+    with _pool_lock:
+        return _intent_locks.setdefault(intent_id, threading.Lock())
+
+
+def _run_hook(config: Dict, hook: str, handler) -> Any:
+    func = config.get(hook)
+    if func is None:
+        return True
+    return func(handler)
+
+
+def _create_handler(intent_id: str, config: Dict, n8n_executor):
+    """New handler instance, warmed up (None on failure)"""
+    factory = config["factory"]
+
+    try:
+        # Call factory with appropriate dependencies
+        # Each handler's factory decides which deps it needs
+        handler = factory(n8n_executor=n8n_executor)
+        _run_hook(config, "warmup", handler)
+        logger.info(f"Created handler for {intent_id}")
+        return handler
+    except Exception as e:
+        logger.error(f"Failed to create handler for {intent_id}: {e}", exc_info=True)
+        return None
+
+
+def _shutdown_handler(intent_id: str, config: Dict, handler):
+    try:
+        _run_hook(config, "shutdown", handler)
+    except Exception as e:
+        logger.warning(f"Handler shutdown failed for {intent_id}: {e}")
+
+
+def _lease(intent_id: str, entry: Dict) -> bool:
+    """Count a request on a pooled entry (False if it was recycled meanwhile)"""
+    with _pool_lock:
+        if _pool.get(intent_id) is not entry:
+            return False
+        entry["requests"] += 1
+        entry["in_flight"] += 1
+        return True
+
+
+def _retire(intent_id: str, entry: Dict):
+    """Take an entry out of the pool; shut it down once no request uses it"""
+    idle = []
+    with _pool_lock:
+        if _pool.get(intent_id) is entry:
+            del _pool[intent_id]
+        if entry["in_flight"] > 0:
+            _retired.append(entry)
+        else:
+            idle.append(entry)
+        while len(_retired) > MAX_RETIRED:
+            stale = _retired.pop(0)
+            logger.warning(f"Shutting down recycled {stale['intent_id']} handler "
+                           f"with {stale['in_flight']} unreleased requests")
+            idle.append(stale)
+
+    for retired in idle:
+        _shutdown_handler(retired["intent_id"], HANDLER_REGISTRY.get(retired["intent_id"], {}),
+                          retired["handler"])
+
+
+def _is_healthy(intent_id: str, config: Dict, entry: Dict) -> bool:
+    """Run the health check if due (True when skipped)"""
+    now = time.monotonic()
+    if now - entry["checked_at"] < HEALTH_CHECK_SECONDS:
+        return True
+
+    try:
+        healthy = bool(_run_hook(config, "health_check", entry["handler"]))
+    except Exception as e:
+        logger.warning(f"Health check raised for {intent_id}: {e}")
+        healthy = False
+
+    entry["checked_at"] = now
+    return healthy
+
 
 def get_handler(intent_id: str, n8n_executor, approval_gate=None, canon_tools=None):
     """
     Factory function to get a handler by intent_id
 
+    Returns the pooled instance of the intent (created and warmed up on
+    first use, recycled when its health check fails). The instance keeps
+    the dependencies it was created with. Callers pass it back to
+    release_handler() when their request is done.
+
     Args:
         intent_id: Intent ID (e.g., "daily_newsletter_digest_v0")
         n8n_executor: N8nExecutor instance
@@ -50,17 +171,115 @@ def get_handler(intent_id: str, n8n_executor, approval_gate=None, canon_tools=No
         return None
 
     handler_config = HANDLER_REGISTRY[intent_id]
-    factory = handler_config["factory"]
+    if not handler_config.get("reuse", True):
+        return _create_handler(intent_id, handler_config, n8n_executor)
 
-    try:
-        # Call factory with appropriate dependencies
-        # Each handler's factory decides which deps it needs
-        handler = factory(n8n_executor=n8n_executor)
-        logger.info(f"Created handler for {intent_id}")
+    entry = _pool.get(intent_id)
+    if entry and _is_healthy(intent_id, handler_config, entry) and _lease(intent_id, entry):
+        return entry["handler"]
+
+    # Create (or recycle) once, even with concurrent requests
+    with _intent_lock(intent_id):
+        current = _pool.get(intent_id)
+        if current is not None and current is not entry and _lease(intent_id, current):
+            return current["handler"]
+
+        if current is not None:
+            logger.warning(f"Recycling unhealthy handler for {intent_id}")
+            _retire(intent_id, current)
+
+        handler = _create_handler(intent_id, handler_config, n8n_executor)
+        if handler is not None:
+            now = time.monotonic()
+            with _pool_lock:
+                _pool[intent_id] = {"intent_id": intent_id, "handler": handler,
+                                    "created_at": now, "checked_at": now,
+                                    "requests": 1, "in_flight": 1}
         return handler
-    except Exception as e:
-        logger.error(f"Failed to create handler for {intent_id}: {e}", exc_info=True)
-        return None
+
+
+def release_handler(intent_id: str, handler):
+    """
+    A request is done with its get_handler() instance
+
+    A recycled instance is shut down with its last request, an instance
+    of a non-reused intent right away.
+    """
+    if handler is None:
+        return
+    config = HANDLER_REGISTRY.get(intent_id, {})
+    if not config.get("reuse", True):
+        _shutdown_handler(intent_id, config, handler)
+        return
+
+    with _pool_lock:
+        entry = _pool.get(intent_id)
+        retired = entry is None or entry["handler"] is not handler
+        if retired:
+            entry = next((item for item in _retired if item["handler"] is handler), None)
+            if entry is None:
+                return
+        entry["in_flight"] = max(entry["in_flight"] - 1, 0)
+        if not retired or entry["in_flight"] > 0:
+            return
+        _retired.remove(entry)
+
+    _shutdown_handler(intent_id, config, handler)
+    logger.info(f"Shut down recycled handler for {intent_id}")
+
+
+def warmup_handlers(n8n_executor=None, intent_ids: List[str] = None) -> Dict[str, bool]:
+    """
+    Create and warm up pooled handlers ahead of the first request
+
+    Returns: intent_id -> whether a handler is ready
+    """
+    ready = {}
+    for intent_id in intent_ids or list(HANDLER_REGISTRY):
+        config = HANDLER_REGISTRY.get(intent_id)
+        if config is None or not config.get("reuse", True):
+            ready[intent_id] = config is not None
+            continue
+        handler = get_handler(intent_id, n8n_executor)
+        release_handler(intent_id, handler)
+        ready[intent_id] = handler is not None
+    return ready
+
+
+def handler_status() -> Dict[str, Dict[str, Any]]:
+    """Pooled handlers: age, requests served / in flight, last health check"""
+    now = time.monotonic()
+    status = {}
+    with _pool_lock:
+        retired = [entry["intent_id"] for entry in _retired]
+    for intent_id in HANDLER_REGISTRY:
+        entry = _pool.get(intent_id)
+        status[intent_id] = {
+            "pooled": entry is not None,
+            "age_seconds": round(now - entry["created_at"]) if entry else None,
+            "checked_seconds_ago": round(now - entry["checked_at"]) if entry else None,
+            "requests": entry["requests"] if entry else 0,
+            "in_flight": entry["in_flight"] if entry else 0,
+            "retired": retired.count(intent_id)
+        }
+    return status
+
+
+def shutdown_handlers():
+    """Run the shutdown hook of every pooled (and recycled) handler and empty the pool"""
+    for intent_id in list(_pool):
+        with _intent_lock(intent_id):
+            entry = _pool.pop(intent_id, None)
+            if entry:
+                _shutdown_handler(intent_id, HANDLER_REGISTRY.get(intent_id, {}), entry["handler"])
+                logger.info(f"Shut down handler for {intent_id}")
+
+    with _pool_lock:
+        retired = list(_retired)
+        _retired.clear()
+    for entry in retired:
+        _shutdown_handler(entry["intent_id"], HANDLER_REGISTRY.get(entry["intent_id"], {}),
+                          entry["handler"])
 
 
 def list_handlers() -> Dict[str, Dict[str, Any]]:
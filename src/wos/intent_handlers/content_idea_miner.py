@@ -12,6 +12,7 @@ from notion_client import Client as NotionClient
 from anthropic import Anthropic
 
 from ..artifact_publisher import ArtifactPublisher
+from ..job_runner import report_progress
 
 logger = logging.getLogger("wos.intent_handlers.content_idea_miner")
 
@@ -26,8 +27,16 @@ class ContentIdeaMinerHandler:
     4. Create entries in Content Ideas Queue database
     5. Update original entry to "Ideas Generated" status
     6. Publish artifact with ideation log
+
+    One instance serves many requests (see intent_handlers.HANDLER_REGISTRY):
+    warmup() loads the Canon documents, health_check() fails once they
+    change on disk so the pool rebuilds the handler, shutdown() closes the
+    API clients.
     """
 
+    # A timed-out run may already have created ideas in the queue
+    retry_on_timeout = False
+
     def __init__(self):
         """Initialize handler with Notion, Claude, and Artifact Publisher"""
         self.notion_api_key = os.getenv("NOTION_API_KEY")
@@ -43,17 +52,47 @@ class ContentIdeaMinerHandler:
             raise ValueError("ANTHROPIC_API_KEY environment variable required")
 
         self.notion = NotionClient(auth=self.notion_api_key)
-        self.anthropic = Anthropic(api_key=self.anthropic_api_key)
+        # Bounded calls, so the intent's timeout_seconds covers a full run
+        self.anthropic = Anthropic(api_key=self.anthropic_api_key, timeout=90.0)
         self.artifact_publisher = ArtifactPublisher()
 
-        # Load Canon documents
+        # Canon documents (loaded by warmup)
+        self.canon_dir = os.path.join(os.path.dirname(__file__), "../../../canon")
+        self.brand_foundation = None
+        self.content_playbook = None
+        self._canon_mtimes: Dict[str, float] = {}
+
+    def warmup(self):
+        """Load Canon documents (once per handler instead of per request)"""
         self._load_canon()
 
+    def health_check(self) -> bool:
+        """False once the Canon documents changed on disk or the clients are closed"""
+        if self.anthropic.is_closed():
+            return False
+        return self._canon_mtimes == self._canon_file_mtimes()
+
+    def shutdown(self):
+        """Close the Notion and Claude HTTP clients"""
+        self.notion.close()
+        self.anthropic.close()
+
+    def _canon_file_mtimes(self) -> Dict[str, float]:
+        mtimes = {}
+        for name in ("brand_foundation.md", "cos_content_playbook.md"):
+            try:
+                mtimes[name] = os.path.getmtime(os.path.join(self.canon_dir, name))
+            except OSError:
+                mtimes[name] = None
+        return mtimes
+
     def _load_canon(self):
         """Load Canon documents for AI context"""
-        canon_dir = os.path.join(os.path.dirname(__file__), "../../../canon")
+        canon_dir = self.canon_dir
 
         try:
+            mtimes = self._canon_file_mtimes()
+
             # Load Brand Foundation
             with open(os.path.join(canon_dir, "brand_foundation.md"), "r") as f:
                 self.brand_foundation = f.read()
@@ -62,6 +101,7 @@ class ContentIdeaMinerHandler:
             with open(os.path.join(canon_dir, "cos_content_playbook.md"), "r") as f:
                 self.content_playbook = f.read()
 
+            self._canon_mtimes = mtimes
             logger.info("Canon documents loaded successfully")
 
         except Exception as e:
@@ -150,6 +190,13 @@ class ContentIdeaMinerHandler:
                     "error": str(e)
                 })
 
+            # Partial result for background-job status polls
+            report_progress({
+                "entries_found": len(entries),
+                "entries_processed": len(ideation_log),
+                "ideas_generated": total_ideas_created
+            })
+
         # Step 3: Publish ideation log as artifact
         artifact_markdown = self._format_ideation_log(ideation_log)
 
@@ -299,6 +346,10 @@ class ContentIdeaMinerHandler:
             List of idea dictionaries with title, angle, platform, format
         """
 
+        # Handler used without the pool's warmup
+        if self.brand_foundation is None:
+            self._load_canon()
+
         # Build the ideation prompt
         prompt = f"""You are the Content Idea Miner for WhyHi's Content Operating System (COS).
 
@@ -8,10 +8,12 @@ import logging
 import os
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-from notion_client import Client as NotionClient
+from notion_client import Client as NotionClient, AsyncClient as AsyncNotionClient
 
 from ..artifact_publisher import ArtifactPublisher
 from ..approval_gate import ApprovalGate
+from .. import cancellation
+from ..job_runner import report_progress
 
 logger = logging.getLogger("wos.intent_handlers.creator_outreach")
 
@@ -25,8 +27,13 @@ class CreatorOutreachHandler:
     3. Request approval via Approval Gate
     4. If approved, mark as "Outreach Sent" in CRM
     5. Publish artifact with outreach log
+
+    One instance serves many requests (see intent_handlers.HANDLER_REGISTRY).
     """
 
+    # A timed-out run may already have opened approvals / updated the CRM
+    retry_on_timeout = False
+
     def __init__(self):
         """Initialize handler with Notion, Artifact Publisher, and Approval Gate"""
         self.notion_api_key = os.getenv("NOTION_API_KEY")
@@ -39,6 +46,14 @@ class CreatorOutreachHandler:
         self.artifact_publisher = ArtifactPublisher()
         self.approval_gate = ApprovalGate()
 
+    def health_check(self) -> bool:
+        """False once the Notion client has been closed"""
+        return not self.notion.client.is_closed
+
+    def shutdown(self):
+        """Close the Notion HTTP client"""
+        self.notion.close()
+
     def execute(self, request_id: str, intent_input: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute creator outreach
@@ -89,25 +104,18 @@ class CreatorOutreachHandler:
         outreach_log = []
 
         for creator in creators:
+            # Caller gone: don't open approvals nobody will wait for
+            if cancellation.is_cancelled():
+                logger.warning(f"Outreach cancelled after {approvals_requested} approvals")
+                break
+
             try:
                 # Generate personalized message
                 message = self._generate_outreach_message(creator, custom_template)
 
                 # Request approval
-                approval_title = f"Outreach to {creator['name']} ({creator['platform']})"
-
                 approval = self.approval_gate.request_approval(
-                    request_id=request_id,
-                    intent_id="creator_outreach_v0",
-                    content=message,
-                    title=approval_title,
-                    metadata={
-                        "creator_name": creator["name"],
-                        "creator_url": creator["url"],
-                        "platform": creator["platform"],
-                        "contact_method": creator["contact_method"],
-                        "status_filter": status_filter
-                    }
+                    **self._approval_request(request_id, creator, message, status_filter)
                 )
 
                 approvals_requested += 1
@@ -127,46 +135,11 @@ class CreatorOutreachHandler:
                         self._update_crm_status(creator["page_id"], "Outreach Sent")
                         approved_count += 1
 
-                        outreach_log.append({
-                            "creator": creator["name"],
-                            "platform": creator["platform"],
-                            "status": "approved",
-                            "message": message,
-                            "notion_url": approval["notion_url"]
-                        })
-
-                        logger.info(f"Outreach approved for {creator['name']}")
-
-                    elif result["status"] == "rejected":
-                        outreach_log.append({
-                            "creator": creator["name"],
-                            "platform": creator["platform"],
-                            "status": "rejected",
-                            "notion_url": approval["notion_url"]
-                        })
-
-                        logger.info(f"Outreach rejected for {creator['name']}")
-
-                    else:
-                        # Timeout - don't update status
-                        outreach_log.append({
-                            "creator": creator["name"],
-                            "platform": creator["platform"],
-                            "status": "timeout",
-                            "notion_url": approval["notion_url"]
-                        })
-
-                        logger.warning(f"Approval timeout for {creator['name']}")
+                    outreach_log.append(self._log_entry(creator, approval, result["status"], message))
 
                 else:
                     # Dry run - just log the approval URL
-                    outreach_log.append({
-                        "creator": creator["name"],
-                        "platform": creator["platform"],
-                        "status": "dry_run",
-                        "message": message,
-                        "notion_url": approval["notion_url"]
-                    })
+                    outreach_log.append(self._log_entry(creator, approval, "dry_run", message))
 
             except Exception as e:
                 logger.error(f"Failed to process outreach for {creator.get('name', 'unknown')}: {e}")
@@ -176,7 +149,147 @@ class CreatorOutreachHandler:
                     "error": str(e)
                 })
 
+            # Partial result for background-job status polls
+            report_progress(self._progress(creators, outreach_log, approvals_requested,
+                                           approved_count))
+
         # Step 3: Publish outreach log as artifact
+        return self._publish_log(creators, outreach_log, status_filter, limit, dry_run,
+                                 approvals_requested, approved_count)
+
+    async def execute_async(self, request_id: str, intent_input: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async execute() (same input and result)
+
+        CRM and approval calls use the async Notion clients, so approval
+        waits don't hold a thread; publishing (file + git) runs in a worker
+        thread. Cancelling the task stops the outreach without publishing.
+        """
+
+        logger.info(f"Starting creator outreach (async, request_id={request_id})")
+
+        status_filter = intent_input.get("status_filter", "Draft Ready")
+        limit = intent_input.get("limit", 5)
+        dry_run = intent_input.get("dry_run", False)
+        custom_template = intent_input.get("template")
+
+        async with AsyncNotionClient(auth=self.notion_api_key) as notion:
+            creators = await self._query_crm_async(notion, status_filter, limit)
+
+            if not creators:
+                logger.info(f"No creators found with status '{status_filter}'")
+                return {
+                    "success": True,
+                    "creators_contacted": 0,
+                    "approvals_requested": 0,
+                    "message": f"No creators with status '{status_filter}'"
+                }
+
+            logger.info(f"Found {len(creators)} creators ready for outreach")
+
+            approvals_requested = 0
+            approved_count = 0
+            outreach_log = []
+
+            for creator in creators:
+                try:
+                    message = self._generate_outreach_message(creator, custom_template)
+
+                    approval = await self.approval_gate.request_approval_async(
+                        **self._approval_request(request_id, creator, message, status_filter)
+                    )
+
+                    approvals_requested += 1
+
+                    logger.info(f"Approval requested for {creator['name']}: {approval['notion_url']}")
+
+                    if not dry_run:
+                        result = await self.approval_gate.wait_for_approval_async(
+                            approval_id=approval["approval_id"],
+                            timeout_seconds=600,  # 10 minutes
+                            poll_interval=10
+                        )
+
+                        if result["status"] == "approved":
+                            await self._update_crm_status_async(notion, creator["page_id"], "Outreach Sent")
+                            approved_count += 1
+
+                        outreach_log.append(self._log_entry(creator, approval, result["status"], message))
+
+                    else:
+                        outreach_log.append(self._log_entry(creator, approval, "dry_run", message))
+
+                except Exception as e:
+                    logger.error(f"Failed to process outreach for {creator.get('name', 'unknown')}: {e}")
+                    outreach_log.append({
+                        "creator": creator.get("name", "unknown"),
+                        "status": "error",
+                        "error": str(e)
+                    })
+
+                report_progress(self._progress(creators, outreach_log, approvals_requested,
+                                               approved_count))
+
+        return await cancellation.run_in_thread(
+            self._publish_log, creators, outreach_log, status_filter, limit, dry_run,
+            approvals_requested, approved_count
+        )
+
+    def _approval_request(self, request_id: str, creator: Dict[str, Any], message: str,
+                          status_filter: str) -> Dict[str, Any]:
+        """request_approval() arguments for one creator"""
+        return {
+            "request_id": request_id,
+            "intent_id": "creator_outreach_v0",
+            "content": message,
+            "title": f"Outreach to {creator['name']} ({creator['platform']})",
+            "metadata": {
+                "creator_name": creator["name"],
+                "creator_url": creator["url"],
+                "platform": creator["platform"],
+                "contact_method": creator["contact_method"],
+                "status_filter": status_filter
+            }
+        }
+
+    def _log_entry(self, creator: Dict[str, Any], approval: Dict[str, Any], status: str,
+                   message: str) -> Dict[str, Any]:
+        """Outreach log entry for an approval outcome"""
+        entry = {
+            "creator": creator["name"],
+            "platform": creator["platform"],
+            "status": status,
+            "notion_url": approval["notion_url"]
+        }
+
+        if status in ("approved", "dry_run"):
+            entry["message"] = message
+
+        if status == "approved":
+            logger.info(f"Outreach approved for {creator['name']}")
+        elif status == "rejected":
+            logger.info(f"Outreach rejected for {creator['name']}")
+        elif status != "dry_run":
+            # Timeout / cancelled - CRM status left unchanged
+            logger.warning(f"Approval {status} for {creator['name']}")
+
+        return entry
+
+    def _progress(self, creators: List[Dict[str, Any]], outreach_log: List[Dict],
+                  approvals_requested: int, approved_count: int) -> Dict[str, Any]:
+        return {
+            "creators_found": len(creators),
+            "creators_processed": len(outreach_log),
+            "approvals_requested": approvals_requested,
+            "approved_count": approved_count,
+            "outreach_log": [{key: value for key, value in entry.items() if key != "message"}
+                             for entry in outreach_log]
+        }
+
+    def _publish_log(self, creators: List[Dict[str, Any]], outreach_log: List[Dict],
+                     status_filter: str, limit: int, dry_run: bool,
+                     approvals_requested: int, approved_count: int) -> Dict[str, Any]:
+        """Publish the outreach log artifact and build the handler result"""
         artifact_markdown = self._format_outreach_log(outreach_log, status_filter)
 
         artifact = self.artifact_publisher.publish_daily_artifact(
@@ -220,29 +333,45 @@ class CreatorOutreachHandler:
         """
         try:
             # Query Notion database with status filter
-            response = self.notion.databases.query(
-                database_id=self.notion_crm_db_id,
-                filter={
-                    "property": "Outreach Status",
-                    "select": {
-                        "equals": status_filter
-                    }
-                },
-                page_size=limit
-            )
+            response = self.notion.databases.query(**self._crm_query(status_filter, limit))
+            return self._creators_from_response(response)
 
-            creators = []
-            for page in response["results"]:
-                creator = self._extract_creator_from_page(page)
-                if creator:
-                    creators.append(creator)
+        except Exception as e:
+            logger.error(f"Failed to query CRM: {e}")
+            return []
 
-            return creators
+    async def _query_crm_async(self, notion, status_filter: str,
+                               limit: int) -> List[Dict[str, Any]]:
+        """Async _query_crm() with an AsyncNotionClient"""
+        try:
+            response = await notion.databases.query(**self._crm_query(status_filter, limit))
+            return self._creators_from_response(response)
 
         except Exception as e:
             logger.error(f"Failed to query CRM: {e}")
             return []
 
+    def _crm_query(self, status_filter: str, limit: int) -> Dict[str, Any]:
+        return {
+            "database_id": self.notion_crm_db_id,
+            "filter": {
+                "property": "Outreach Status",
+                "select": {
+                    "equals": status_filter
+                }
+            },
+            "page_size": limit
+        }
+
+    def _creators_from_response(self, response: Dict) -> List[Dict[str, Any]]:
+        creators = []
+        for page in response["results"]:
+            creator = self._extract_creator_from_page(page)
+            if creator:
+                creators.append(creator)
+
+        return creators
+
     def _extract_creator_from_page(self, page: Dict) -> Optional[Dict[str, Any]]:
         """Extract creator data from Notion page"""
         try:
@@ -356,6 +485,22 @@ Founder @ WhyHi"""
         except Exception as e:
             logger.error(f"Failed to update CRM status: {e}")
 
+    async def _update_crm_status_async(self, notion, page_id: str, new_status: str):
+        """Async _update_crm_status() with an AsyncNotionClient"""
+        try:
+            await notion.pages.update(
+                page_id=page_id,
+                properties={
+                    "Outreach Status": {
+                        "select": {"name": new_status}
+                    }
+                }
+            )
+            logger.info(f"Updated creator status to '{new_status}'")
+
+        except Exception as e:
+            logger.error(f"Failed to update CRM status: {e}")
+
     def _format_outreach_log(self, outreach_log: List[Dict], status_filter: str) -> str:
         """Format outreach log as markdown"""
 
@@ -26,6 +26,9 @@ class DailyNewsletterDigestHandler:
     Implements Phase 3.1 Acceptance Demo (Daily Newsletter Digest)
     """
     
+    # The webhook emails the digest: a timed-out run may still send it
+    retry_on_timeout = False
+    
     def __init__(self, n8n_executor):
         """
         Initialize handler with n8n executor
@@ -68,79 +71,112 @@ class DailyNewsletterDigestHandler:
             logger.info(f"Executing daily_digest: request_id={request_id}, execution_id={execution_id}")
             
             # Step 1: Call n8n workflow
-            # The workflow is already configured in n8n and triggered via webhook
-            # We pass through the request/execution IDs for tracking
-            
-            payload = {
-                "request_id": request_id,
-                "execution_id": execution_id,
-                "triggered_by": "wos_brain",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
             n8n_result = self.n8n_executor.execute_workflow(
                 workflow_name=self.workflow_name,
-                payload=payload,
+                payload=self._payload(request_id, execution_id),
                 timeout_seconds=120  # Digest can take time for GPT processing
             )
             
-            execution_time_ms = int(
-                (datetime.utcnow() - start_time).total_seconds() * 1000
-            )
-            
-            # Step 2: Parse n8n result
-            if n8n_result.get("status") == "failed":
-                logger.error(f"n8n workflow failed: {n8n_result.get('error')}")
-                return {
-                    "status": "failed",
-                    "result": None,
-                    "error": n8n_result.get("error"),
-                    "error_code": "N8N_EXECUTION_FAILED",
-                    "execution_time_ms": execution_time_ms
-                }
-            
-            # Step 3: Extract digest from n8n response
-            # n8n returns the digest HTML in the response
-            n8n_output = n8n_result.get("result", {})
-            
-            # The workflow sends an email, so the "result" is confirmation
-            digest_result = self._parse_digest_result(n8n_output)
-            
-            logger.info(f"Daily digest completed: {execution_id}")
-            
-            return {
-                "status": "success",
-                "result": {
-                    "digest_generated": True,
-                    "email_sent_to": "tom@whyhi.app",
-                    "digest_html": digest_result.get("digest_html", ""),
-                    "categories": {
-                        "product": digest_result.get("product_count", 0),
-                        "growth": digest_result.get("growth_count", 0),
-                        "operations": digest_result.get("operations_count", 0),
-                        "finance": digest_result.get("finance_count", 0)
-                    },
-                    "total_emails_processed": digest_result.get("email_count", 0),
-                    "execution_id": execution_id,
-                    "request_id": request_id
-                },
-                "error": None,
-                "execution_time_ms": execution_time_ms
-            }
+            return self._handle_result(n8n_result, start_time, request_id, execution_id)
         
         except Exception as e:
-            execution_time_ms = int(
-                (datetime.utcnow() - start_time).total_seconds() * 1000
+            return self._handler_error(e, start_time)
+    
+    async def execute_async(self, request_id: str, execution_id: str,
+                            intent_input: Dict[str, Any],
+                            intent_record: Dict[str, Any]) -> Dict[str, Any]:
+        """Async execute() for the async Brain (non-blocking n8n call)"""
+        
+        start_time = datetime.utcnow()
+        
+        try:
+            logger.info(f"Executing daily_digest (async): request_id={request_id}, execution_id={execution_id}")
+            
+            n8n_result = await self.n8n_executor.execute_workflow_async(
+                workflow_name=self.workflow_name,
+                payload=self._payload(request_id, execution_id),
+                timeout_seconds=120
             )
-            logger.error(f"daily_digest handler error: {e}", exc_info=True)
             
+            return self._handle_result(n8n_result, start_time, request_id, execution_id)
+        
+        except Exception as e:
+            return self._handler_error(e, start_time)
+    
+    def _payload(self, request_id: str, execution_id: str) -> Dict[str, Any]:
+        # The workflow is already configured in n8n and triggered via webhook
+        # We pass through the request/execution IDs for tracking
+        return {
+            "request_id": request_id,
+            "execution_id": execution_id,
+            "triggered_by": "wos_brain",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    def _handle_result(self, n8n_result: Dict[str, Any], start_time: datetime,
+                       request_id: str, execution_id: str) -> Dict[str, Any]:
+        """Handler result for an n8n workflow result (sync and async paths)"""
+        execution_time_ms = int(
+            (datetime.utcnow() - start_time).total_seconds() * 1000
+        )
+        
+        # Step 2: Parse n8n result
+        if n8n_result.get("status") == "failed":
+            logger.error(f"n8n workflow failed: {n8n_result.get('error')}")
             return {
                 "status": "failed",
                 "result": None,
-                "error": str(e),
-                "error_code": "HANDLER_ERROR",
-                "execution_time_ms": execution_time_ms
+                "error": n8n_result.get("error"),
+                "error_code": "N8N_EXECUTION_FAILED",
+                "execution_time_ms": execution_time_ms,
+                # 5xx / 429 and connection errors (see N8nExecutor); not
+                # n8n timeouts, the workflow may still send the email
+                "retryable": (n8n_result.get("retryable", False)
+                              and not n8n_result.get("timed_out", False))
             }
+        
+        # Step 3: Extract digest from n8n response
+        # n8n returns the digest HTML in the response
+        n8n_output = n8n_result.get("result", {})
+        
+        # The workflow sends an email, so the "result" is confirmation
+        digest_result = self._parse_digest_result(n8n_output)
+        
+        logger.info(f"Daily digest completed: {execution_id}")
+        
+        return {
+            "status": "success",
+            "result": {
+                "digest_generated": True,
+                "email_sent_to": "tom@whyhi.app",
+                "digest_html": digest_result.get("digest_html", ""),
+                "categories": {
+                    "product": digest_result.get("product_count", 0),
+                    "growth": digest_result.get("growth_count", 0),
+                    "operations": digest_result.get("operations_count", 0),
+                    "finance": digest_result.get("finance_count", 0)
+                },
+                "total_emails_processed": digest_result.get("email_count", 0),
+                "execution_id": execution_id,
+                "request_id": request_id
+            },
+            "error": None,
+            "execution_time_ms": execution_time_ms
+        }
+    
+    def _handler_error(self, e: Exception, start_time: datetime) -> Dict[str, Any]:
+        execution_time_ms = int(
+            (datetime.utcnow() - start_time).total_seconds() * 1000
+        )
+        logger.error(f"daily_digest handler error: {e}", exc_info=True)
+        
+        return {
+            "status": "failed",
+            "result": None,
+            "error": str(e),
+            "error_code": "HANDLER_ERROR",
+            "execution_time_ms": execution_time_ms
+        }
     
     def _parse_digest_result(self, n8n_output: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -10,6 +10,8 @@ import logging
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
+from wos.db import get_connection_manager
+
 logger = logging.getLogger("wos.intent_registry")
 
 class IntentRegistry:
@@ -20,15 +22,23 @@ class IntentRegistry:
     
     def __init__(self, db_path: str = "wos.db"):
         self.db_path = db_path
+        self.db = None
         self.conn = None
         self.init_db()
     
     def init_db(self):
         """Initialize SQLite database with intent registry schema"""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
-        cursor = self.conn.cursor()
+        # Shared connection manager (WAL, pragmas, serialized writer)
+        self.db = get_connection_manager(self.db_path)
+        self.conn = self.db.writer
+        
+        with self.db.transaction() as conn:
+            self._create_schema(conn.cursor())
         
+        logger.info(f"Intent registry initialized at {self.db_path}")
+    
+    def _create_schema(self, cursor):
+        """Create tables and run column migrations (internal)"""
         # Intent definitions table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS intents (
@@ -60,6 +70,15 @@ class IntentRegistry:
         except sqlite3.OperationalError:
             pass  # Column already exists
         
+        # The Brain enforces timeout_seconds: raise registered deadlines that
+        # are shorter than what the handler itself waits for
+        for intent in INITIAL_INTENTS:
+            if intent["execution_mode"] == "wos_managed":
+                cursor.execute("""
+                    UPDATE intents SET timeout_seconds = ?
+                    WHERE intent_id = ? AND timeout_seconds < ?
+                """, (intent["timeout_seconds"], intent["intent_id"], intent["timeout_seconds"]))
+        
         # n8n workflow mappings table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS n8n_workflows (
@@ -90,6 +109,26 @@ class IntentRegistry:
             )
         """)
         
+        # Background job state (see wos.job_runner)
+        for column in ("request JSON", "progress JSON", "started_at TEXT", "finished_at TEXT",
+                       "heartbeat_at TEXT", "worker TEXT", "cancel_requested INTEGER DEFAULT 0"):
+            try:
+                cursor.execute(f"ALTER TABLE intent_executions ADD COLUMN {column}")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+        
+        # Supervised execution: attempts made and per-attempt outcome / duration
+        for column in ("attempts INTEGER", "attempt_log JSON"):
+            try:
+                cursor.execute(f"ALTER TABLE intent_executions ADD COLUMN {column}")
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_executions_status
+            ON intent_executions(status, heartbeat_at)
+        """)
+        
         # Policy rules table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS policy_rules (
@@ -103,9 +142,6 @@ class IntentRegistry:
                 FOREIGN KEY (intent_id) REFERENCES intents(intent_id)
             )
         """)
-        
-        self.conn.commit()
-        logger.info(f"Intent registry initialized at {self.db_path}")
     
     def register_intent(self, intent_id: str, name: str, version: str,
                        description: str, handler_module: str,
@@ -132,15 +168,14 @@ class IntentRegistry:
             notes: Optional notes about the intent
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO intents (intent_id, name, version, description,
-                                    handler_module, approval_required, timeout_seconds,
-                                    execution_mode, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (intent_id, name, version, description, handler_module,
-                  approval_required, timeout_seconds, execution_mode, notes))
-            self.conn.commit()
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    INSERT INTO intents (intent_id, name, version, description,
+                                        handler_module, approval_required, timeout_seconds,
+                                        execution_mode, notes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (intent_id, name, version, description, handler_module,
+                      approval_required, timeout_seconds, execution_mode, notes))
             logger.info(f"Registered intent: {name} (mode: {execution_mode})")
             return True
         except sqlite3.IntegrityError as e:
@@ -152,16 +187,15 @@ class IntentRegistry:
                     input_schema: Dict = None, output_schema: Dict = None) -> bool:
         """Map an n8n workflow to an intent"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO n8n_workflows 
-                (workflow_id, intent_id, n8n_workflow_name, n8n_webhook_url, 
-                 input_schema, output_schema)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (workflow_id, intent_id, n8n_workflow_name, n8n_webhook_url,
-                  json.dumps(input_schema) if input_schema else None,
-                  json.dumps(output_schema) if output_schema else None))
-            self.conn.commit()
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    INSERT INTO n8n_workflows 
+                    (workflow_id, intent_id, n8n_workflow_name, n8n_webhook_url, 
+                     input_schema, output_schema)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (workflow_id, intent_id, n8n_workflow_name, n8n_webhook_url,
+                      json.dumps(input_schema) if input_schema else None,
+                      json.dumps(output_schema) if output_schema else None))
             logger.info(f"Mapped workflow {n8n_workflow_name} to intent {intent_id}")
             return True
         except sqlite3.IntegrityError as e:
@@ -170,30 +204,28 @@ class IntentRegistry:
     
     def get_intent(self, intent_name: str) -> Optional[Dict]:
         """Look up intent by name"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM intents WHERE name = ?", (intent_name,))
-        row = cursor.fetchone()
+        with self.db.reader() as conn:
+            row = conn.execute("SELECT * FROM intents WHERE name = ?", (intent_name,)).fetchone()
         return dict(row) if row else None
     
     def get_intent_by_id(self, intent_id: str) -> Optional[Dict]:
         """Look up intent by ID"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM intents WHERE intent_id = ?", (intent_id,))
-        row = cursor.fetchone()
+        with self.db.reader() as conn:
+            row = conn.execute("SELECT * FROM intents WHERE intent_id = ?", (intent_id,)).fetchone()
         return dict(row) if row else None
     
     def get_workflows_for_intent(self, intent_id: str) -> List[Dict]:
         """Get all n8n workflows mapped to an intent"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM n8n_workflows WHERE intent_id = ? AND active = 1",
-                      (intent_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        with self.db.reader() as conn:
+            rows = conn.execute("SELECT * FROM n8n_workflows WHERE intent_id = ? AND active = 1",
+                                (intent_id,)).fetchall()
+        return [dict(row) for row in rows]
 
     def list_intents(self) -> List[Dict]:
         """List all registered intents"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM intents ORDER BY created_at DESC")
-        return [dict(row) for row in cursor.fetchall()]
+        with self.db.reader() as conn:
+            rows = conn.execute("SELECT * FROM intents ORDER BY created_at DESC").fetchall()
+        return [dict(row) for row in rows]
 
     def list_intents_by_mode(self, execution_mode: str) -> List[Dict]:
         """
@@ -209,40 +241,188 @@ class IntentRegistry:
         Returns:
             List of intent dictionaries matching the execution mode
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM intents WHERE execution_mode = ? ORDER BY created_at DESC",
-            (execution_mode,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        with self.db.reader() as conn:
+            rows = conn.execute(
+                "SELECT * FROM intents WHERE execution_mode = ? ORDER BY created_at DESC",
+                (execution_mode,)
+            ).fetchall()
+        return [dict(row) for row in rows]
 
     def log_execution(self, execution_id: str, request_id: str, intent_id: str,
                      status: str, result: Dict = None, error: str = None,
-                     execution_time_ms: int = None) -> bool:
-        """Log an intent execution for audit trail"""
+                     execution_time_ms: int = None, attempt_log: List[Dict] = None) -> bool:
+        """
+        Log an intent execution for audit trail
+        
+        Completes the row of a background execution (create_execution)
+        if there is one. execution_time_ms covers all attempts; attempt_log
+        lists each attempt (status, error_code, duration_ms).
+        """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO intent_executions 
-                (execution_id, request_id, intent_id, status, result, error, execution_time_ms)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (execution_id, request_id, intent_id, status,
-                  json.dumps(result) if result else None, error, execution_time_ms))
-            self.conn.commit()
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    INSERT INTO intent_executions 
+                    (execution_id, request_id, intent_id, status, result, error, execution_time_ms,
+                     attempts, attempt_log, finished_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(execution_id) DO UPDATE SET
+                        status = excluded.status,
+                        result = excluded.result,
+                        error = excluded.error,
+                        execution_time_ms = excluded.execution_time_ms,
+                        attempts = excluded.attempts,
+                        attempt_log = excluded.attempt_log,
+                        finished_at = excluded.finished_at
+                """, (execution_id, request_id, intent_id, status,
+                      json.dumps(result) if result else None, error, execution_time_ms,
+                      len(attempt_log) if attempt_log else None,
+                      json.dumps(attempt_log) if attempt_log else None))
             return True
         except Exception as e:
             logger.error(f"Failed to log execution: {e}")
             return False
     
+    # Background executions (driven by wos.job_runner.JobRunner)
+    
+    def create_execution(self, execution_id: str, request_id: str, intent_id: str,
+                         request: Dict, worker: str) -> bool:
+        """Record an accepted background execution (status "running", not started)"""
+        try:
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    INSERT INTO intent_executions
+                    (execution_id, request_id, intent_id, status, request, worker, heartbeat_at)
+                    VALUES (?, ?, ?, 'running', ?, ?, CURRENT_TIMESTAMP)
+                """, (execution_id, request_id, intent_id, json.dumps(request), worker))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create execution {execution_id}: {e}")
+            return False
+    
+    def mark_execution_started(self, execution_id: str):
+        """Set started_at (the handler is about to run)"""
+        with self.db.transaction() as conn:
+            conn.execute("""
+                UPDATE intent_executions
+                SET started_at = CURRENT_TIMESTAMP, heartbeat_at = CURRENT_TIMESTAMP
+                WHERE execution_id = ?
+            """, (execution_id,))
+    
+    def update_execution_progress(self, execution_id: str, progress: Dict) -> bool:
+        """Store partial results of a running execution"""
+        try:
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    UPDATE intent_executions
+                    SET progress = ?, heartbeat_at = CURRENT_TIMESTAMP
+                    WHERE execution_id = ? AND status = 'running'
+                """, (json.dumps(progress, default=str), execution_id))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to store progress of {execution_id}: {e}")
+            return False
+    
+    def finish_execution(self, execution_id: str, status: str, error: str = None) -> bool:
+        """End a running execution without a handler result (cancelled, interrupted...)"""
+        with self.db.transaction() as conn:
+            cursor = conn.execute("""
+                UPDATE intent_executions
+                SET status = ?, error = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE execution_id = ? AND status = 'running'
+            """, (status, error, execution_id))
+        return cursor.rowcount > 0
+    
+    def request_execution_cancel(self, execution_id: str) -> bool:
+        """Flag a running execution for cancellation (picked up by its worker)"""
+        with self.db.transaction() as conn:
+            cursor = conn.execute("""
+                UPDATE intent_executions SET cancel_requested = 1
+                WHERE execution_id = ? AND status = 'running'
+            """, (execution_id,))
+        return cursor.rowcount > 0
+    
+    def heartbeat_executions(self, execution_ids: List[str]) -> List[str]:
+        """
+        Refresh heartbeat_at of running executions
+        
+        Returns: the ids among them flagged for cancellation
+        """
+        if not execution_ids:
+            return []
+        placeholders = ",".join("?" * len(execution_ids))
+        with self.db.transaction() as conn:
+            conn.execute(f"""
+                UPDATE intent_executions SET heartbeat_at = CURRENT_TIMESTAMP
+                WHERE status = 'running' AND execution_id IN ({placeholders})
+            """, execution_ids)
+            rows = conn.execute(f"""
+                SELECT execution_id FROM intent_executions
+                WHERE cancel_requested = 1 AND status = 'running'
+                AND execution_id IN ({placeholders})
+            """, execution_ids).fetchall()
+        return [row[0] for row in rows]
+    
+    def claim_stale_executions(self, worker: str, stale_seconds: int) -> List[Dict]:
+        """
+        Take over running executions whose worker stopped heartbeating
+        
+        Executions that had started are marked "interrupted" (the handler
+        may have had side effects); ones that never started are reassigned
+        to `worker` and returned for resubmission.
+        """
+        cutoff = f"-{int(stale_seconds)} seconds"
+        with self.db.transaction() as conn:
+            interrupted = conn.execute("""
+                UPDATE intent_executions
+                SET status = 'interrupted', finished_at = CURRENT_TIMESTAMP,
+                    error = 'Worker stopped while the intent was running'
+                WHERE status = 'running' AND started_at IS NOT NULL
+                AND heartbeat_at < datetime('now', ?)
+            """, (cutoff,)).rowcount
+            rows = conn.execute("""
+                SELECT * FROM intent_executions
+                WHERE status = 'running' AND started_at IS NULL
+                AND heartbeat_at < datetime('now', ?)
+            """, (cutoff,)).fetchall()
+            if rows:
+                conn.execute(f"""
+                    UPDATE intent_executions SET worker = ?, heartbeat_at = CURRENT_TIMESTAMP
+                    WHERE execution_id IN ({",".join("?" * len(rows))})
+                """, [worker] + [row["execution_id"] for row in rows])
+        
+        if interrupted:
+            logger.warning(f"Marked {interrupted} stale executions as interrupted")
+        return [self._execution_from_row(row) for row in rows]
+    
+    def get_execution(self, execution_id: str) -> Optional[Dict]:
+        """Execution record with request / progress / result parsed"""
+        with self.db.reader() as conn:
+            row = conn.execute("SELECT * FROM intent_executions WHERE execution_id = ?",
+                               (execution_id,)).fetchone()
+        return self._execution_from_row(row) if row else None
+    
+    @staticmethod
+    def _execution_from_row(row) -> Dict:
+        execution = dict(row)
+        for field in ("request", "progress", "result", "attempt_log"):
+            if execution.get(field):
+                try:
+                    execution[field] = json.loads(execution[field])
+                except (TypeError, ValueError):
+                    pass
+        return execution
+    
     def requires_approval(self, intent_id: str) -> bool:
         """Check if intent requires approval"""
         intent = self.get_intent_by_id(intent_id)
         return intent.get("approval_required", False) if intent else False
     
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Release the shared database connection"""
+        if self.db:
+            self.db.release()
+            self.db = None
+            self.conn = None
     
     def __del__(self):
         self.close()
@@ -268,7 +448,7 @@ INITIAL_INTENTS = [
         "description": "Generate and send daily newsletter digest",
         "handler_module": "wos.intent_handlers.daily_newsletter_digest",
         "approval_required": False,
-        "timeout_seconds": 30,
+        "timeout_seconds": 150,  # n8n webhook call waits up to 120s
         "execution_mode": "wos_managed",
         "notes": "WOS-managed daily newsletter digest. Triggered by Brain on schedule."
     },
@@ -312,7 +492,7 @@ INITIAL_INTENTS = [
         "description": "Generate personalized creator outreach with HITL approval",
         "handler_module": "wos.intent_handlers.creator_outreach",
         "approval_required": True,
-        "timeout_seconds": 600,
+        "timeout_seconds": 3600,  # up to 5 creators x 10 min approval wait
         "execution_mode": "wos_managed",
         "notes": "WOS-managed outreach to creators/journalists. Queries CRM by status, generates personalized messages referencing original content, routes through Approval Gate, updates CRM status on approval."
     },
@@ -323,7 +503,7 @@ INITIAL_INTENTS = [
         "description": "Analyze captured content and generate 2-5 content ideas using Canon",
         "handler_module": "wos.intent_handlers.content_idea_miner",
         "approval_required": False,
-        "timeout_seconds": 120,
+        "timeout_seconds": 600,  # up to 5 entries x one Claude call (90s timeout)
         "execution_mode": "wos_managed",
         "notes": "COS Phase 2 - Queries Content & Creator Capture for 'Sent to COS' status, loads Brand Foundation + Content Playbook, generates 2-5 ideas using Claude, creates entries in Content Ideas Queue, updates status to 'Ideas Generated'."
     }
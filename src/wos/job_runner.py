@@ -0,0 +1,221 @@
+"""
+WOS Job Runner v0
+Background execution of long-running intents, backed by intent_executions
+The Brain accepts the intent and returns an execution_id right away;
+clients poll status / partial results and can cancel
+"""
+
+import os
+import socket
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, Callable
+
+logger = logging.getLogger("wos.job_runner")
+
+# Workers refresh heartbeat_at of their running jobs; a job whose heartbeat
+# is older than STALE_SECONDS belongs to a stopped worker
+HEARTBEAT_SECONDS = 15
+STALE_SECONDS = 120
+
+# intent_executions.status -> Brain_Run_Response_v0 status
+EXECUTION_STATUS = {
+    "running": "Running",
+    "success": "Completed",
+    "cancelled": "Cancelled"
+}
+
+_progress: ContextVar[Optional[Callable[[Dict[str, Any]], None]]] = ContextVar(
+    "wos_job_progress", default=None
+)
+
+
+def report_progress(partial: Dict[str, Any]):
+    """
+    Publish partial results of the current background job
+
+    Handlers call this as they go (it replaces the previous partial
+    result); outside a background job it does nothing.
+    """
+    reporter = _progress.get()
+    if reporter:
+        reporter(partial)
+
+
+class JobRunner:
+    """
+    Runs Brain executions as asyncio tasks and tracks them in intent_executions
+
+    State lives in the registry, so status polling works from any server
+    process sharing the database and survives restarts. Cancelling a job
+    owned by another process flags it; its worker picks the flag up on the
+    next heartbeat. Jobs of a stopped worker are taken over: never started
+    ones are resubmitted, started ones are marked "interrupted".
+    """
+
+    def __init__(self, brain, max_concurrent: int = 32):
+        """
+        Args:
+            brain: Brain instance (executes and logs the runs)
+            max_concurrent: Jobs running at once (more wait for a slot)
+        """
+        self.brain = brain
+        self.registry = brain.intent_registry
+        self.max_concurrent = max_concurrent
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._monitor: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def submit(self, run: Dict[str, Any], request: Dict[str, Any]) -> bool:
+        """
+        Record and start a prepared Brain run (needs a running event loop)
+
+        Args:
+            run: Brain._prepare() run (handler + execute arguments)
+            request: Normalized request (stored for resubmission)
+
+        Returns: False if the execution could not be recorded
+        """
+        args = run["execute_args"]
+        if not self.registry.create_execution(args["execution_id"], args["request_id"],
+                                              run["intent_id"], request, self.worker_id):
+            return False
+
+        self._start(run)
+        return True
+
+    def _start(self, run: Dict[str, Any]):
+        execution_id = run["execute_args"]["execution_id"]
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._tasks[execution_id] = asyncio.create_task(self._run(run),
+                                                        name=f"wos-job-{execution_id}")
+        if self._monitor is None or self._monitor.done():
+            self._monitor = asyncio.create_task(self._monitor_loop(), name="wos-job-monitor")
+        logger.info(f"Background job accepted: {execution_id} ({run['intent_id']})")
+
+    async def _run(self, run: Dict[str, Any]):
+        execution_id = run["execute_args"]["execution_id"]
+        token = _progress.set(lambda partial: self.registry.update_execution_progress(
+            execution_id, partial))
+        try:
+            async with self._slots:
+                self.registry.mark_execution_started(execution_id)
+                handler_result = await self.brain._supervise_async(run)
+            self.brain._complete(run, handler_result)
+            logger.info(f"Background job finished: {execution_id} "
+                        f"({handler_result.get('status')})")
+
+        except asyncio.CancelledError:
+            if self._stopping:
+                # Left "running": the next worker marks it interrupted
+                logger.warning(f"Background job stopped with the server: {execution_id}")
+            else:
+                self.registry.finish_execution(execution_id, "cancelled", "Cancelled by request")
+                logger.info(f"Background job cancelled: {execution_id}")
+            raise
+
+        except Exception as e:
+            logger.error(f"Background job {execution_id} failed: {e}", exc_info=True)
+            self.registry.finish_execution(execution_id, "failed", str(e))
+
+        finally:
+            _progress.reset(token)
+            self._tasks.pop(execution_id, None)
+            self.brain._release_handler(run["intent_id"], run["handler"])
+
+    def get_status(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Status of an execution (background or not)
+
+        Returns: the intent_executions record plus "status" as a
+        Brain_Run_Response_v0 status ("handler_status" keeps the stored
+        value), or None if unknown
+        """
+        execution = self.registry.get_execution(execution_id)
+        if not execution:
+            return None
+
+        execution["handler_status"] = execution["status"]
+        execution["status"] = EXECUTION_STATUS.get(execution["status"], "Failed")
+        execution["cancel_requested"] = bool(execution.get("cancel_requested"))
+        execution["local"] = execution_id in self._tasks
+        execution.pop("request", None)
+        return execution
+
+    def cancel(self, execution_id: str) -> Dict[str, Any]:
+        """
+        Cancel a running execution
+
+        Local jobs are cancelled immediately (sync handlers are signalled
+        through wos.cancellation). Jobs of another worker are flagged and
+        stop within a heartbeat.
+        """
+        task = self._tasks.get(execution_id)
+        if task:
+            task.cancel()
+            return {"execution_id": execution_id, "cancelled": True, "pending": False}
+
+        if self.registry.request_execution_cancel(execution_id):
+            return {"execution_id": execution_id, "cancelled": True, "pending": True}
+
+        execution = self.registry.get_execution(execution_id)
+        reason = f"already {execution['status']}" if execution else "unknown execution"
+        return {"execution_id": execution_id, "cancelled": False, "reason": reason}
+
+    async def _monitor_loop(self):
+        """Heartbeats, cross-process cancel flags and stale-job takeover"""
+        while not self._stopping:
+            try:
+                for execution_id in self.registry.heartbeat_executions(list(self._tasks)):
+                    task = self._tasks.get(execution_id)
+                    if task:
+                        logger.info(f"Cancel requested for background job: {execution_id}")
+                        task.cancel()
+                self.recover()
+            except Exception as e:
+                logger.error(f"Job monitor error: {e}")
+
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+
+    def recover(self) -> int:
+        """
+        Take over jobs of stopped workers (needs a running event loop)
+
+        Returns: number of jobs resubmitted
+        """
+        resubmitted = 0
+        for execution in self.registry.claim_stale_executions(self.worker_id, STALE_SECONDS):
+            execution_id = execution["execution_id"]
+            response, run = self.brain._prepare(execution.get("request") or {},
+                                                execution_id=execution_id)
+            if response:
+                errors = response.get("errors") or [{}]
+                self.registry.finish_execution(execution_id, "failed",
+                                               errors[0].get("message", response.get("status")))
+                continue
+
+            self._start(run)
+            resubmitted += 1
+
+        if resubmitted:
+            logger.info(f"Resubmitted {resubmitted} background jobs of stopped workers")
+        return resubmitted
+
+    async def start(self):
+        """Start the monitor (recovering stale jobs) before the first submit"""
+        if self._monitor is None or self._monitor.done():
+            self._monitor = asyncio.create_task(self._monitor_loop(), name="wos-job-monitor")
+
+    async def shutdown(self):
+        """Stop the monitor and local jobs (they are resumed or marked interrupted later)"""
+        self._stopping = True
+        tasks = list(self._tasks.values())
+        if self._monitor:
+            tasks.append(self._monitor)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
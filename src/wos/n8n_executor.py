@@ -6,10 +6,13 @@ Bridges WOS Brain to n8n workflow execution
 
 import logging
 import requests
+import httpx
 import os
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from wos.async_http import AsyncHTTP
+
 logger = logging.getLogger("wos.n8n_executor")
 
 class N8nExecutor:
@@ -18,6 +21,7 @@ class N8nExecutor:
     
     Calls n8n workflows via REST API.
     Handles request/response transformation, error handling, timeouts.
+    execute_workflow_async() is the non-blocking variant for the async Brain.
     """
     
     def __init__(self, n8n_base_url: str = None, api_key: str = None):
@@ -26,6 +30,9 @@ class N8nExecutor:
         
         if not self.api_key:
             logger.warning("N8N_API_KEY not set - n8n executor will fail")
+        
+        # Pooled client for execute_workflow_async (created on first use)
+        self.http = AsyncHTTP()
     
     def execute_workflow(self, workflow_name: str, payload: Dict[str, Any],
                         timeout_seconds: int = 30) -> Dict[str, Any]:
@@ -50,72 +57,129 @@ class N8nExecutor:
         start_time = datetime.utcnow()
         
         try:
-            # Build webhook URL
-            webhook_url = f"{self.n8n_base_url}/webhook/{workflow_name}"
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             logger.info(f"Executing n8n workflow: {workflow_name}")
             
             # Call n8n workflow
             response = requests.post(
-                webhook_url,
+                self._webhook_url(workflow_name),
                 json=payload,
-                headers=headers,
+                headers=self._headers(),
                 timeout=timeout_seconds
             )
             
-            execution_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            
-            # Handle response
-            if response.status_code >= 400:
-                logger.error(f"n8n workflow failed: {response.status_code} {response.text}")
-                return {
-                    "status": "failed",
-                    "result": None,
-                    "error": f"HTTP {response.status_code}: {response.text[:200]}",
-                    "execution_time_ms": execution_time_ms,
-                    "workflow_name": workflow_name
-                }
-            
-            # Parse successful response
-            try:
-                result = response.json()
-            except:
-                result = response.text
+            return self._handle_response(workflow_name, start_time, response.status_code,
+                                         response.text, response.json)
+        
+        except requests.Timeout:
+            return self._timeout(workflow_name, start_time, timeout_seconds)
+        
+        except Exception as e:
+            return self._failed(workflow_name, start_time, e)
+    
+    async def execute_workflow_async(self, workflow_name: str, payload: Dict[str, Any],
+                                     timeout_seconds: int = 30) -> Dict[str, Any]:
+        """
+        Async execute_workflow() (same result envelope)
+        
+        Uses a pooled httpx.AsyncClient, so one event loop can keep many
+        workflow calls in flight. Cancellation propagates to the caller.
+        """
+        
+        start_time = datetime.utcnow()
+        
+        try:
+            logger.info(f"Executing n8n workflow (async): {workflow_name}")
             
-            logger.info(f"n8n workflow succeeded: {workflow_name}")
+            response = await self.http.request(
+                "POST",
+                self._webhook_url(workflow_name),
+                json=payload,
+                headers=self._headers(),
+                timeout=timeout_seconds
+            )
             
-            return {
-                "status": "success",
-                "result": result,
-                "error": None,
-                "execution_time_ms": execution_time_ms,
-                "workflow_name": workflow_name,
-                "status_code": response.status_code
-            }
+            return self._handle_response(workflow_name, start_time, response.status_code,
+                                         response.text, response.json)
         
-        except requests.Timeout:
-            execution_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            logger.error(f"n8n workflow timeout: {workflow_name}")
-            return {
-                "status": "failed",
-                "result": None,
-                "error": f"Workflow execution timeout ({timeout_seconds}s)",
-                "execution_time_ms": execution_time_ms,
-                "workflow_name": workflow_name
-            }
+        except httpx.TimeoutException:
+            return self._timeout(workflow_name, start_time, timeout_seconds)
         
         except Exception as e:
-            execution_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            logger.error(f"n8n executor error: {e}", exc_info=True)
+            return self._failed(workflow_name, start_time, e)
+    
+    async def aclose(self):
+        """Close pooled async connections"""
+        await self.http.aclose()
+    
+    def _webhook_url(self, workflow_name: str) -> str:
+        return f"{self.n8n_base_url}/webhook/{workflow_name}"
+    
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    @staticmethod
+    def _elapsed_ms(start_time: datetime) -> int:
+        return int((datetime.utcnow() - start_time).total_seconds() * 1000)
+    
+    def _handle_response(self, workflow_name: str, start_time: datetime, status_code: int,
+                         text: str, parse_json) -> Dict[str, Any]:
+        """Result envelope for an HTTP response (sync and async paths)"""
+        execution_time_ms = self._elapsed_ms(start_time)
+        
+        # Handle response
+        if status_code >= 400:
+            logger.error(f"n8n workflow failed: {status_code} {text}")
             return {
                 "status": "failed",
                 "result": None,
-                "error": str(e),
+                "error": f"HTTP {status_code}: {text[:200]}",
                 "execution_time_ms": execution_time_ms,
-                "workflow_name": workflow_name
+                "workflow_name": workflow_name,
+                # Server-side / rate-limit failures are worth another attempt
+                "retryable": status_code >= 500 or status_code == 429
             }
+        
+        # Parse successful response
+        try:
+            result = parse_json()
+        except:
+            result = text
+        
+        logger.info(f"n8n workflow succeeded: {workflow_name}")
+        
+        return {
+            "status": "success",
+            "result": result,
+            "error": None,
+            "execution_time_ms": execution_time_ms,
+            "workflow_name": workflow_name,
+            "status_code": status_code
+        }
+    
+    def _timeout(self, workflow_name: str, start_time: datetime,
+                 timeout_seconds: int) -> Dict[str, Any]:
+        logger.error(f"n8n workflow timeout: {workflow_name}")
+        return {
+            "status": "failed",
+            "result": None,
+            "error": f"Workflow execution timeout ({timeout_seconds}s)",
+            "execution_time_ms": self._elapsed_ms(start_time),
+            "workflow_name": workflow_name,
+            "timed_out": True,
+            "retryable": True
+        }
+    
+    def _failed(self, workflow_name: str, start_time: datetime, e: Exception) -> Dict[str, Any]:
+        logger.error(f"n8n executor error: {e}", exc_info=True)
+        return {
+            "status": "failed",
+            "result": None,
+            "error": str(e),
+            "execution_time_ms": self._elapsed_ms(start_time),
+            "workflow_name": workflow_name,
+            # n8n unreachable (connection refused / reset)
+            "retryable": isinstance(e, (requests.ConnectionError, httpx.TransportError))
+        }
@@ -0,0 +1,397 @@
+"""
+WOS Vector Quantization v0
+Compressed resident vectors for Canon semantic search
+int8 scalar (~4x) or product quantization (~16x+) with asymmetric scoring
+and exact re-rank of the top candidates from SQLite
+"""
+
+import os
+import logging
+import numpy as np
+from typing import List, Dict, Tuple, Optional, Callable
+
+from wos.vector_cache import VectorCache
+
+logger = logging.getLogger("wos.quantization")
+
+# Rows decoded/scored per block, bounds transient float memory during scans
+SCAN_BLOCK = 4096
+
+
+class ScalarQuantizer:
+    """
+    int8 scalar quantization with a per-vector scale
+
+    Each unit vector is stored as round(x / s) with s = max|x| / 127, so
+    no training is needed and every row uses its full int8 range.
+    Asymmetric scoring: the query stays float32, score = (codes @ q) * s.
+    """
+
+    name = "int8"
+    code_dtype = np.int8
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.code_size = dimension
+
+    @property
+    def is_trained(self) -> bool:
+        return True
+
+    def train(self, vectors: np.ndarray):
+        pass
+
+    def encode(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+        return codes, scales.astype(np.float32)
+
+    def scores(self, query: np.ndarray, codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+        return (codes.astype(np.float32) @ query) * scales
+
+    def bytes_per_vector(self) -> int:
+        return self.code_size + 4
+
+    def save(self, path: str):
+        pass
+
+
+class ProductQuantizer:
+    """
+    Product quantization (PQ)
+
+    Splits each vector into `m` sub-vectors and replaces each with the index
+    of its nearest centroid in a 256-entry per-subspace codebook: one byte
+    per subspace. Asymmetric distance computation: per query, a (m, 256)
+    table of sub-vector dot products is built once, then a row's score is
+    the sum of m table lookups.
+
+    Codebooks are trained (k-means per subspace) and persisted; a cache
+    that outgrows the training set `retrain_factor` times retrains on load.
+    """
+
+    name = "pq"
+    code_dtype = np.uint8
+
+    def __init__(self, dimension: int, m: int = None, ksub: int = 256,
+                 train_sample: int = 4096, iterations: int = 8, seed: int = 0):
+        self.m = m or dimension // 4
+        if dimension % self.m:
+            raise ValueError(f"PQ subspaces ({self.m}) must divide dimension ({dimension})")
+        self.dimension = dimension
+        self.dsub = dimension // self.m
+        self.ksub = ksub
+        self.code_size = self.m
+        self.train_sample = train_sample
+        self.iterations = iterations
+        self.seed = seed
+        self.codebooks: Optional[np.ndarray] = None  # (m, ksub, dsub)
+        self.trained_size = 0
+
+    @property
+    def is_trained(self) -> bool:
+        return self.codebooks is not None
+
+    def train(self, vectors: np.ndarray):
+        """k-means per subspace on (a sample of) the vectors"""
+        rng = np.random.default_rng(self.seed)
+        n = vectors.shape[0]
+        ksub = min(self.ksub, n)
+        sample = vectors[rng.choice(n, min(n, self.train_sample), replace=False)]
+        sub = sample.reshape(-1, self.m, self.dsub).transpose(1, 0, 2)  # (m, s, dsub)
+
+        codebooks = sub[:, rng.choice(sub.shape[1], ksub, replace=False)].copy()
+        for _ in range(self.iterations):
+            # Centroid update for every subspace at once: bincount over
+            # (subspace, centroid) slots, one pass per sub-dimension
+            slots = (self._assign(sub, codebooks) + np.arange(self.m)[:, None] * ksub).ravel()
+            counts = np.bincount(slots, minlength=self.m * ksub).reshape(self.m, ksub)
+            sums = np.stack([
+                np.bincount(slots, weights=sub[:, :, d].ravel(), minlength=self.m * ksub)
+                for d in range(self.dsub)
+            ], axis=1).reshape(self.m, ksub, self.dsub)
+            filled = counts > 0
+            codebooks[filled] = (sums[filled] / counts[filled][:, None]).astype(np.float32)
+
+        if ksub < self.ksub:
+            padded = np.zeros((self.m, self.ksub, self.dsub), dtype=np.float32)
+            padded[:, :ksub] = codebooks
+            codebooks = padded
+        self.codebooks = codebooks.astype(np.float32)
+        self.trained_size = n
+        logger.info(f"PQ trained: {n} vectors, m={self.m}, ksub={self.ksub}")
+
+    def encode(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        sub = vectors.reshape(-1, self.m, self.dsub).transpose(1, 0, 2)
+        codes = self._assign(sub, self.codebooks).T.astype(np.uint8)
+        return np.ascontiguousarray(codes), np.ones(vectors.shape[0], dtype=np.float32)
+
+    def scores(self, query: np.ndarray, codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+        table = np.einsum("jd,jkd->jk", query.reshape(self.m, self.dsub), self.codebooks)
+        # Flat lookups into the (m * ksub) table are much cheaper than 2-D fancy indexing
+        offsets = np.arange(self.m, dtype=np.intp) * self.ksub
+        return table.ravel().take(codes.astype(np.intp) + offsets).sum(axis=1)
+
+    def bytes_per_vector(self) -> int:
+        return self.code_size
+
+    def save(self, path: str):
+        if not path or not self.is_trained:
+            return
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, codebooks=self.codebooks, trained_size=np.array(self.trained_size))
+        os.replace(tmp_path, path)
+        logger.info(f"PQ codebooks saved: {path}")
+
+    def load(self, path: str) -> bool:
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            with np.load(path) as data:
+                codebooks = data["codebooks"]
+                trained_size = int(data["trained_size"])
+        except Exception as e:
+            logger.warning(f"Failed to load PQ codebooks {path}: {e}")
+            return False
+        if codebooks.shape != (self.m, self.ksub, self.dsub):
+            logger.warning(f"PQ codebook shape mismatch, ignoring {path}")
+            return False
+        self.codebooks = codebooks.astype(np.float32)
+        self.trained_size = trained_size
+        return True
+
+    def _assign(self, sub: np.ndarray, codebooks: np.ndarray, group: int = 16) -> np.ndarray:
+        """Nearest centroid per subspace: (m, s, dsub) -> (m, s)"""
+        out = np.empty(sub.shape[:2], dtype=np.int64)
+        norms = (codebooks ** 2).sum(axis=2)  # (m, k)
+        for start in range(0, self.m, group):
+            block = slice(start, start + group)
+            # argmin ||x - c||^2 = argmax (2 x.c - ||c||^2)
+            scores = 2 * np.matmul(sub[block], codebooks[block].transpose(0, 2, 1))
+            scores -= norms[block][:, None, :]
+            out[block] = np.argmax(scores, axis=2)
+        return out
+
+
+QUANTIZERS = {
+    "int8": ScalarQuantizer,
+    "pq": ProductQuantizer,
+}
+
+
+class QuantizedVectorCache:
+    """
+    Drop-in replacement for VectorCache holding compressed rows
+
+    Same interface as VectorCache (put/load/top_k/row_of/ids). Until the
+    quantizer is trained (PQ below `min_train_size` vectors) rows are kept as
+    float32 and scored exactly. top_k scores the compressed rows
+    asymmetrically, then - if a `vector_loader(ids) -> {id: vector}` is
+    set - re-ranks the best `limit * rerank_factor` candidates with exact
+    vectors read from SQLite, so precision loss only affects which
+    candidates make the shortlist.
+    """
+
+    def __init__(self, dimension: int, quantizer, vector_loader: Callable = None,
+                 rerank_factor: int = 4, min_train_size: int = 1024,
+                 retrain_factor: float = 4.0, codebook_path: str = None,
+                 initial_capacity: int = 256):
+        self.dimension = dimension
+        self.quantizer = quantizer
+        self.vector_loader = vector_loader
+        self.rerank_factor = rerank_factor
+        self.min_train_size = min_train_size
+        self.retrain_factor = retrain_factor
+        self.codebook_path = codebook_path
+
+        if codebook_path and hasattr(quantizer, "load"):
+            quantizer.load(codebook_path)
+
+        self._codes = np.zeros((initial_capacity, quantizer.code_size), dtype=quantizer.code_dtype)
+        self._scales = np.zeros(initial_capacity, dtype=np.float32)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._staging: Optional[VectorCache] = None if quantizer.is_trained else VectorCache(dimension)
+
+    def __len__(self) -> int:
+        if self._staging is not None:
+            return len(self._staging)
+        return len(self._ids)
+
+    def __contains__(self, artifact_id: str) -> bool:
+        return self.row_of(artifact_id) is not None
+
+    @property
+    def is_compressed(self) -> bool:
+        return self._staging is None
+
+    @property
+    def ids(self) -> List[str]:
+        return self._staging.ids if self._staging is not None else self._ids
+
+    @property
+    def nbytes(self) -> int:
+        """Resident bytes used by vector rows"""
+        if self._staging is not None:
+            return self._staging.nbytes
+        return len(self._ids) * self.quantizer.bytes_per_vector()
+
+    def row_of(self, artifact_id: str) -> Optional[int]:
+        if self._staging is not None:
+            return self._staging.row_of(artifact_id)
+        return self._rows.get(artifact_id)
+
+    def put(self, artifact_id: str, vector) -> bool:
+        if self._staging is not None:
+            if not self._staging.put(artifact_id, vector):
+                return False
+            if len(self._staging) >= self.min_train_size:
+                self._compress()
+            return True
+
+        normalized = VectorCache.normalize(vector)
+        if normalized is None or normalized.shape[0] != self.dimension:
+            logger.warning(f"Skipping vector for {artifact_id}: bad shape or zero norm")
+            return False
+
+        codes, scales = self.quantizer.encode(normalized[None, :])
+        row = self._rows.get(artifact_id)
+        if row is None:
+            row = len(self._ids)
+            self._grow(row + 1)
+            self._ids.append(artifact_id)
+            self._rows[artifact_id] = row
+        self._codes[row] = codes[0]
+        self._scales[row] = scales[0]
+        return True
+
+    def load(self, items) -> int:
+        """Bulk-load (artifact_id, vector) pairs; trains the quantizer if needed"""
+        loaded = 0
+        if self._staging is None and not self._ids:
+            self._staging = VectorCache(self.dimension)
+        if self._staging is not None:
+            # Collect as float first so (re)training sees the whole set
+            loaded = self._staging.load(items)
+            if self.quantizer.is_trained or len(self._staging) >= self.min_train_size:
+                self._compress()
+            return loaded
+        for artifact_id, vector in items:
+            if self.put(artifact_id, vector):
+                loaded += 1
+        return loaded
+
+    def top_k(self, query_vector, limit: int, min_similarity: float = None,
+              rows: np.ndarray = None, prefilter: bool = False) -> List[Tuple[str, float]]:
+        # Codes are always gathered by row, so filtered scans are pre-filtered
+        if self._staging is not None:
+            return self._staging.top_k(query_vector, limit, min_similarity,
+                                       rows=rows, prefilter=prefilter)
+
+        query = VectorCache.normalize(query_vector)
+        if query is None or not self._ids or limit <= 0:
+            return []
+
+        candidates = np.arange(len(self._ids)) if rows is None else np.unique(np.asarray(rows, dtype=np.int64))
+        if candidates.size == 0:
+            return []
+
+        scores = np.empty(candidates.size, dtype=np.float32)
+        for start in range(0, candidates.size, SCAN_BLOCK):
+            block = candidates[start:start + SCAN_BLOCK]
+            scores[start:start + SCAN_BLOCK] = self.quantizer.scores(
+                query, self._codes[block], self._scales[block]
+            )
+
+        rerank = self.vector_loader is not None
+        shortlist = limit * self.rerank_factor if rerank else limit
+        if not rerank and min_similarity is not None:
+            keep = scores >= min_similarity
+            candidates, scores = candidates[keep], scores[keep]
+        if candidates.size > shortlist:
+            part = np.argpartition(-scores, shortlist - 1)[:shortlist]
+            candidates, scores = candidates[part], scores[part]
+
+        hits = [(self._ids[row], float(score)) for row, score in zip(candidates, scores)]
+        if rerank:
+            hits = self._rerank(query, hits, min_similarity)
+
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return hits[:limit]
+
+    def _rerank(self, query: np.ndarray, hits: List[Tuple[str, float]],
+                min_similarity: float = None) -> List[Tuple[str, float]]:
+        """Replace approximate scores with exact cosine from stored vectors"""
+        try:
+            exact = self.vector_loader([artifact_id for artifact_id, _ in hits])
+        except Exception as e:
+            logger.warning(f"Exact re-rank failed, using approximate scores: {e}")
+            exact = {}
+
+        reranked = []
+        for artifact_id, score in hits:
+            vector = exact.get(artifact_id)
+            if vector is not None:
+                normalized = VectorCache.normalize(vector)
+                if normalized is not None:
+                    score = float(normalized @ query)
+            if min_similarity is None or score >= min_similarity:
+                reranked.append((artifact_id, score))
+        return reranked
+
+    def _compress(self):
+        """Train the quantizer on staged float rows and switch to codes"""
+        staging = self._staging
+        trained_size = getattr(self.quantizer, "trained_size", 0)
+        outgrown = trained_size and len(staging) > trained_size * self.retrain_factor
+        if not self.quantizer.is_trained or outgrown:
+            self.quantizer.train(staging.matrix)
+            self.quantizer.save(self.codebook_path)
+
+        n = len(staging)
+        self._grow(n)
+        for start in range(0, n, SCAN_BLOCK):
+            codes, scales = self.quantizer.encode(staging.matrix[start:start + SCAN_BLOCK])
+            self._codes[start:start + codes.shape[0]] = codes
+            self._scales[start:start + codes.shape[0]] = scales
+        self._ids = list(staging.ids)
+        self._rows = {artifact_id: row for row, artifact_id in enumerate(self._ids)}
+        self._staging = None
+        logger.info(f"Vector cache compressed: {n} rows, {self.quantizer.name}, "
+                    f"{self.quantizer.bytes_per_vector()} bytes/vector")
+
+    def _grow(self, needed: int):
+        if needed > self._codes.shape[0]:
+            capacity = max(needed, self._codes.shape[0] * 2)
+            codes = np.zeros((capacity, self.quantizer.code_size), dtype=self.quantizer.code_dtype)
+            codes[:len(self._ids)] = self._codes[:len(self._ids)]
+            scales = np.zeros(capacity, dtype=np.float32)
+            scales[:len(self._ids)] = self._scales[:len(self._ids)]
+            self._codes, self._scales = codes, scales
+
+
+def create_quantized_cache(kind: str, dimension: int, vector_loader: Callable = None,
+                           db_path: str = None, rerank_factor: int = 4,
+                           min_train_size: int = 1024, **options) -> QuantizedVectorCache:
+    """
+    Build a compressed vector cache
+
+    Args:
+        kind: Registered quantizer name ("int8", "pq")
+        dimension: Vector dimension
+        vector_loader: ids -> {id: float vector} for exact re-ranking (None = no re-rank)
+        db_path: Canon database path; trained codebooks are stored as
+                 "<db_path>.<kind>.npz" next to it
+        rerank_factor: Shortlist size multiplier for the exact re-rank
+        min_train_size: Vectors needed before a trained quantizer compresses
+        **options: Quantizer knobs (PQ: m, ksub, train_sample, iterations)
+    """
+    if kind not in QUANTIZERS:
+        raise ValueError(f"Unknown quantization: {kind}")
+
+    quantizer = QUANTIZERS[kind](dimension, **options)
+    path = f"{db_path}.{kind}.npz" if db_path and db_path != ":memory:" else None
+    return QuantizedVectorCache(dimension, quantizer, vector_loader=vector_loader,
+                                rerank_factor=rerank_factor, min_train_size=min_train_size,
+                                codebook_path=path)
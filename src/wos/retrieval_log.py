@@ -0,0 +1,142 @@
+"""
+WOS Retrieval Log Writer v0
+Background, batched writer for Canon retrieval_log audit rows
+Keeps audit inserts/commits off the search path
+"""
+
+import uuid
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Any
+
+logger = logging.getLogger("wos.retrieval_log")
+
+# Same format as the retrieved_at DEFAULT CURRENT_TIMESTAMP (UTC), so rows
+# from both writers sort and compare correctly as text
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class RetrievalLogWriter:
+    """
+    Queue + writer thread for retrieval audit events
+
+    log() only enqueues (no SQLite work on the caller's thread). The writer
+    thread drains up to `batch_size` events per transaction, waiting at most
+    `flush_interval` seconds for a batch to fill. flush() waits until every
+    event logged so far is committed; close() (also run at interpreter exit)
+    flushes and stops the thread.
+
+    The queue is bounded: if the writer falls `max_queue` events behind,
+    log() blocks rather than dropping audit rows.
+    """
+
+    def __init__(self, db, batch_size: int = 256, flush_interval: float = 0.5,
+                 max_queue: int = 10000):
+        """
+        Args:
+            db: wos.db.ConnectionManager of the Canon database
+            batch_size: Max events per transaction
+            flush_interval: Max seconds an event waits for its batch
+            max_queue: Pending events before log() applies backpressure
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self.stats = {"logged": 0, "written": 0, "failed": 0, "batches": 0}
+        self.closed = False
+
+        self._thread = threading.Thread(target=self._run, name="retrieval-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log(self, artifact_id: str, retrieval_type: str, request_id: str = None,
+            execution_id: str = None, relevance_score: float = None,
+            intent_id: str = None) -> str:
+        """
+        Enqueue one retrieval event
+
+        Returns: The event's log_id (random UUID, unique under any load)
+        """
+        if self.closed:
+            raise RuntimeError("Retrieval log writer is closed")
+
+        log_id = f"log_{uuid.uuid4().hex}"
+        self._queue.put((log_id, artifact_id, request_id, execution_id, intent_id,
+                         retrieval_type, relevance_score,
+                         datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)))
+        self.stats["logged"] += 1
+        return log_id
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until every event queued before this call is committed
+
+        Returns: False on timeout (or if the writer has stopped)
+        """
+        if not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10.0):
+        """Flush pending events and stop the writer thread"""
+        if self.closed:
+            return
+        self.closed = True
+        atexit.unregister(self.close)
+
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error(f"Retrieval log writer did not stop; ~{self._queue.qsize()} events unwritten")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, pending=self._queue.qsize())
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch, waiters = [], []
+
+            # Gather a batch: whatever is queued, up to flush_interval
+            while True:
+                if item is None:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    timeout = self.flush_interval if batch and not waiters else 0
+                    item = self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+            for waiter in waiters:
+                waiter.set()
+
+    def _write(self, batch: list):
+        try:
+            with self.db.transaction() as conn:
+                conn.executemany("""
+                    INSERT INTO retrieval_log
+                    (log_id, artifact_id, request_id, execution_id, intent_id,
+                     retrieval_type, relevance_score, retrieved_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, batch)
+            self.stats["written"] += len(batch)
+            self.stats["batches"] += 1
+        except Exception as e:
+            self.stats["failed"] += len(batch)
+            logger.error(f"Failed to write {len(batch)} retrieval log rows: {e}")
@@ -10,6 +10,9 @@ import logging
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 
@@ -19,7 +22,9 @@ from wos.brain import Brain
 from wos.approval_gate import ApprovalGate
 from wos.n8n_executor import N8nExecutor
 from wos.canon_tools import create_canon_tools
-from wos.intent_handlers import get_handler_factory
+from wos.intent_handlers import (get_handler_factory, release_handler, warmup_handlers,
+                                 handler_status, shutdown_handlers)
+from wos.cancellation import cancellation_scope, shutdown_handler_executor
 
 # Configure logging
 logging.basicConfig(
@@ -47,7 +52,10 @@ class WOSComponents:
         self.canon_tools = create_canon_tools(
             canon_db_path=os.getenv("WOS_CANON_DB_PATH", "canon.db"),
             use_semantic_search=True,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            search_mode=os.getenv("WOS_CANON_SEARCH_MODE", "hybrid"),
+            quantization=os.getenv("WOS_CANON_QUANTIZATION") or None,
+            compression=os.getenv("WOS_CANON_COMPRESSION") or None
         )
         logger.info("✅ Canon Index ready")
         
@@ -80,7 +88,8 @@ class WOSComponents:
             canon_tools=self.canon_tools,
             n8n_executor=self.n8n_executor
         )
-        logger.info("✅ Handler Factory ready")
+        ready = warmup_handlers(n8n_executor=self.n8n_executor)
+        logger.info(f"✅ Handler Factory ready ({sum(ready.values())}/{len(ready)} handlers warmed up)")
         
         # Phase 3.2: Brain Control Plane
         logger.info("Initializing Brain Control Plane...")
@@ -89,7 +98,9 @@ class WOSComponents:
             approval_gate=self.approval_gate,
             canon_tools=self.canon_tools,
             n8n_executor=self.n8n_executor,
-            handler_factory=handler_factory
+            handler_factory=handler_factory,
+            handler_release=release_handler,
+            max_background_jobs=int(os.getenv("WOS_MAX_BACKGROUND_JOBS", "32"))
         )
         logger.info("✅ Brain Control Plane ready")
         
@@ -116,19 +127,94 @@ class WOSComponents:
                 "total_artifacts": canon_stats.get("total_artifacts", 0),
                 "embeddings_enabled": "embeddings" in canon_stats
             },
-            "registered_intents": len(intents)
+            "registered_intents": len(intents),
+            "handlers": handler_status()
         }
 
 # Initialize components globally
 wos_components = None
+_wos_lock = threading.Lock()
 
 def get_wos() -> WOSComponents:
-    """Get or initialize WOS components"""
+    """Get or initialize WOS components (once, even from concurrent tool calls)"""
     global wos_components
-    if wos_components is None:
-        wos_components = WOSComponents()
+    with _wos_lock:
+        if wos_components is None:
+            wos_components = WOSComponents()
     return wos_components
 
+# ============================================================================
+# Tool Dispatch (blocking work off the event loop)
+# ============================================================================
+
+# Tool handlers call synchronous components (Canon, registry) that can block
+# on OpenAI HTTP or SQLite. They run on a bounded thread pool so the stdio
+# loop keeps answering other requests. execute_intent runs the async Brain
+# on the loop itself; sync-only intent handlers run on their own pool
+# (wos.cancellation.HANDLER_THREADS), so slow intents never hold the
+# threads that canon_search / canon_list / wos_status need.
+TOOL_WORKERS = int(os.getenv("WOS_TOOL_WORKERS", "16"))
+
+# Max concurrent calls per tool (further calls queue); others get the default
+TOOL_CONCURRENCY = {
+    "execute_intent": 32,   # async: approval waits hold no thread
+    "canon_search": 8,
+    "canon_store": 4,
+    "canon_list": 8,
+    "register_intent": 1
+}
+DEFAULT_TOOL_CONCURRENCY = 8
+
+_tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="wos-tool")
+_tool_slots: dict[str, asyncio.Semaphore] = {}
+
+def _slots(tool: str) -> asyncio.Semaphore:
+    slots = _tool_slots.get(tool)
+    if slots is None:
+        slots = _tool_slots[tool] = asyncio.Semaphore(
+            TOOL_CONCURRENCY.get(tool, DEFAULT_TOOL_CONCURRENCY)
+        )
+    return slots
+
+async def run_async(tool: str, func, *args):
+    """Await an async tool handler within the tool's concurrency slots"""
+    async with _slots(tool):
+        return await func(*args)
+
+async def run_blocking(tool: str, func, *args):
+    """
+    Run a blocking tool handler on the worker pool
+    
+    Waits for one of the tool's concurrency slots first. If the call is
+    cancelled (client cancelled the request or disconnected), a queued
+    handler never starts and a running one is signalled through
+    wos.cancellation; its slot frees up only once the thread has stopped.
+    """
+    slots = _slots(tool)
+    await slots.acquire()
+    loop = asyncio.get_running_loop()
+    cancel = threading.Event()
+    
+    def run():
+        with cancellation_scope(cancel):
+            return func(*args)
+    
+    def release(_):
+        try:
+            loop.call_soon_threadsafe(slots.release)
+        except RuntimeError:
+            pass  # Event loop already closed (shutdown)
+    
+    future = _tool_executor.submit(run)
+    future.add_done_callback(release)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        cancel.set()
+        future.cancel()
+        logger.warning(f"Tool call cancelled: {tool}")
+        raise
+
 # ============================================================================
 # MCP Server Definition
 # ============================================================================
@@ -170,11 +256,43 @@ async def list_tools() -> list[Tool]:
                     "request_id": {
                         "type": "string",
                         "description": "Optional request ID for tracking"
+                    },
+                    "background": {
+                        "type": "boolean",
+                        "description": "Run as a background job and return an execution_id right away (default: only for long-running intents)"
                     }
                 },
                 "required": ["intent"]
             }
         ),
+        Tool(
+            name="get_execution",
+            description="Get status, partial results and final result of an intent execution (e.g. a background job started by execute_intent)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "execution_id": {
+                        "type": "string",
+                        "description": "execution_id returned by execute_intent"
+                    }
+                },
+                "required": ["execution_id"]
+            }
+        ),
+        Tool(
+            name="cancel_execution",
+            description="Cancel a running background intent execution",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "execution_id": {
+                        "type": "string",
+                        "description": "execution_id returned by execute_intent"
+                    }
+                },
+                "required": ["execution_id"]
+            }
+        ),
         Tool(
             name="list_intents",
             description="List all registered intents with their descriptions and requirements",
@@ -205,6 +323,19 @@ async def list_tools() -> list[Tool]:
                     "category": {
                         "type": "string",
                         "description": "Filter by category (optional): product, growth, operations, finance"
+                    },
+                    "approximate": {
+                        "type": "boolean",
+                        "description": "Use the approximate (ANN) vector index instead of an exact scan (optional)"
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["semantic", "text", "hybrid"],
+                        "description": "Retrieval mode (optional): hybrid fuses full-text and semantic results"
+                    },
+                    "passages": {
+                        "type": "boolean",
+                        "description": "Return the best-matching passages of each artifact instead of summaries (optional)"
                     }
                 },
                 "required": ["query"]
@@ -249,6 +380,32 @@ async def list_tools() -> list[Tool]:
                 "required": ["artifact_id", "title", "content"]
             }
         ),
+        Tool(
+            name="canon_list",
+            description="List Canon artifacts newest first, one page at a time (pass next_cursor to continue)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "artifact_type": {
+                        "type": "string",
+                        "description": "Filter by type (optional): decision, context, brief, log, etc."
+                    },
+                    "category": {
+                        "type": "string",
+                        "description": "Filter by category (optional): product, growth, operations, finance"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Artifacts per page (default 20, max 100)"
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page (optional)"
+                    }
+                },
+                "required": []
+            }
+        ),
         Tool(
             name="register_intent",
             description="Register a new intent in the intent registry (Founder authority required)",
@@ -294,17 +451,23 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     
     try:
         if name == "wos_status":
-            return await handle_wos_status()
+            return await run_blocking(name, handle_wos_status)
         elif name == "execute_intent":
-            return await handle_execute_intent(arguments)
+            return await run_async(name, handle_execute_intent, arguments)
+        elif name == "get_execution":
+            return await run_blocking(name, handle_get_execution, arguments)
+        elif name == "cancel_execution":
+            return await run_async(name, handle_cancel_execution, arguments)
         elif name == "list_intents":
-            return await handle_list_intents()
+            return await run_blocking(name, handle_list_intents)
         elif name == "canon_search":
-            return await handle_canon_search(arguments)
+            return await run_blocking(name, handle_canon_search, arguments)
         elif name == "canon_store":
-            return await handle_canon_store(arguments)
+            return await run_blocking(name, handle_canon_store, arguments)
+        elif name == "canon_list":
+            return await run_blocking(name, handle_canon_list, arguments)
         elif name == "register_intent":
-            return await handle_register_intent(arguments)
+            return await run_blocking(name, handle_register_intent, arguments)
         else:
             raise ValueError(f"Unknown tool: {name}")
     except Exception as e:
@@ -315,10 +478,10 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         )]
 
 # ============================================================================
-# Tool Handlers
+# Tool Handlers (blocking ones run on the worker pool by run_blocking)
 # ============================================================================
 
-async def handle_wos_status() -> list[TextContent]:
+def handle_wos_status() -> list[TextContent]:
     """Return current WOS operational status"""
     wos = get_wos()
     status = wos.get_status()
@@ -330,10 +493,12 @@ async def handle_wos_status() -> list[TextContent]:
 
 async def handle_execute_intent(args: dict) -> list[TextContent]:
     """
-    Execute intent through Brain
+    Execute intent through the async Brain (on the event loop)
     Following Phase 3.2 Brain_Run_Response_v0 envelope
     """
-    wos = get_wos()
+    # First call initializes components (blocking): keep it off the loop
+    wos = await asyncio.get_running_loop().run_in_executor(_tool_executor, get_wos)
+    await wos.brain.jobs.start()
     
     intent = args.get("intent")
     inputs = args.get("inputs", {})
@@ -345,13 +510,17 @@ async def handle_execute_intent(args: dict) -> list[TextContent]:
     brain_request = {
         "request_id": request_id,
         "intent": intent,
-        "input": inputs
+        "input": inputs,
+        "background": args.get("background")
     }
     
     # Process through Brain
-    response = wos.brain.process_request(brain_request)
+    response = await wos.brain.process_request_async(brain_request)
     
-    # Format response
+    return format_intent_response(intent, request_id, response)
+
+def format_intent_response(intent: str, request_id: str, response: dict) -> list[TextContent]:
+    """Render a Brain_Run_Response_v0 for the MCP client"""
     status = response.get("status")
 
     if status == "Completed":
@@ -360,6 +529,12 @@ async def handle_execute_intent(args: dict) -> list[TextContent]:
             type="text",
             text=f"✅ Intent '{intent}' completed successfully\n\n{json.dumps(result, indent=2)}"
         )]
+    elif status == "Running":
+        execution_id = response.get("execution_id")
+        return [TextContent(
+            type="text",
+            text=f"⏳ Intent '{intent}' running in the background\n\nExecution ID: {execution_id}\nRequest ID: {request_id}\n\nPoll with get_execution, stop with cancel_execution."
+        )]
     elif status == "PendingApproval":
         approval_info = response.get('approval', {})
         reason = approval_info.get('reason', 'Approval required')
@@ -386,7 +561,40 @@ async def handle_execute_intent(args: dict) -> list[TextContent]:
             text=f"Status: {status}\n\n{json.dumps(response, indent=2)}"
         )]
 
-async def handle_list_intents() -> list[TextContent]:
+def handle_get_execution(args: dict) -> list[TextContent]:
+    """Status / partial results of an intent execution"""
+    wos = get_wos()
+    execution_id = args.get("execution_id")
+    
+    execution = wos.brain.jobs.get_status(execution_id)
+    if not execution:
+        return [TextContent(
+            type="text",
+            text=f"No execution found: {execution_id}"
+        )]
+    
+    return [TextContent(
+        type="text",
+        text=f"Execution {execution_id}: {execution['status']}\n\n{json.dumps(execution, indent=2, default=str)}"
+    )]
+
+async def handle_cancel_execution(args: dict) -> list[TextContent]:
+    """Cancel a background intent execution (jobs live on the event loop)"""
+    wos = await asyncio.get_running_loop().run_in_executor(_tool_executor, get_wos)
+    await wos.brain.jobs.start()
+    execution_id = args.get("execution_id")
+    
+    outcome = wos.brain.jobs.cancel(execution_id)
+    if not outcome["cancelled"]:
+        text = f"Execution {execution_id} not cancelled ({outcome['reason']})"
+    elif outcome["pending"]:
+        text = f"Cancellation requested for {execution_id} (running in another WOS process)"
+    else:
+        text = f"🛑 Execution {execution_id} cancelled"
+    
+    return [TextContent(type="text", text=text)]
+
+def handle_list_intents() -> list[TextContent]:
     """List all registered intents"""
     wos = get_wos()
     intents = wos.intent_registry.list_intents()
@@ -410,7 +618,7 @@ async def handle_list_intents() -> list[TextContent]:
         text=f"Registered Intents ({len(intents)}):\n\n{intent_list}"
     )]
 
-async def handle_canon_search(args: dict) -> list[TextContent]:
+def handle_canon_search(args: dict) -> list[TextContent]:
     """Search Canon Index"""
     wos = get_wos()
     
@@ -418,15 +626,42 @@ async def handle_canon_search(args: dict) -> list[TextContent]:
     limit = args.get("limit", 5)
     artifact_type = args.get("artifact_type")
     category = args.get("category")
+    approximate = args.get("approximate")
+    mode = args.get("mode") or wos.canon_tools.search_mode
+    passages = args.get("passages", False)
     
     logger.info(f"Canon search: {query}")
     
-    results = wos.canon_tools.search(
-        query=query,
-        limit=limit,
-        artifact_type=artifact_type,
-        category=category
-    )
+    timings_text = ""
+    if passages:
+        results = wos.canon_tools.search_passages(
+            query=query,
+            limit=limit,
+            artifact_type=artifact_type,
+            category=category,
+            approximate=approximate
+        )
+    elif mode == "hybrid":
+        search_result = wos.canon_tools.hybrid_search(
+            query=query,
+            limit=limit,
+            artifact_type=artifact_type,
+            category=category,
+            approximate=approximate
+        )
+        results = search_result["results"]
+        timings_text = "\n\nTimings (ms): " + ", ".join(
+            f"{name}={ms}" for name, ms in search_result["timings_ms"].items()
+        ) + f" | semantic: {search_result['semantic_status']}"
+    else:
+        results = wos.canon_tools.search(
+            query=query,
+            limit=limit,
+            artifact_type=artifact_type,
+            category=category,
+            approximate=approximate,
+            mode=mode
+        )
     
     if not results:
         return [TextContent(
@@ -434,20 +669,33 @@ async def handle_canon_search(args: dict) -> list[TextContent]:
             text=f"No artifacts found for query: '{query}'"
         )]
     
-    results_text = "\n\n".join([
-        f"**{r['title']}** (ID: {r['artifact_id']})\n"
-        f"Type: {r['type']} | Category: {r.get('category', 'N/A')}\n"
-        f"Relevance: {r.get('relevance_score', 0):.1f}/10\n"
-        f"Summary: {r.get('summary', 'N/A')}"
-        for r in results
-    ])
+    if passages:
+        results_text = "\n\n".join([
+            f"**{r['title']}** (ID: {r['artifact_id']})\n"
+            f"Type: {r['type']} | Category: {r.get('category', 'N/A')}\n"
+            f"Relevance: {r.get('relevance_score', 0):.1f}/10\n" +
+            "\n".join(
+                f"> [{p['start_char']}-{p['end_char']}] {p['text']}"
+                if p.get("start_char") is not None else f"> {p['text']}"
+                for p in r["passages"]
+            )
+            for r in results
+        ])
+    else:
+        results_text = "\n\n".join([
+            f"**{r['title']}** (ID: {r['artifact_id']})\n"
+            f"Type: {r['type']} | Category: {r.get('category', 'N/A')}\n"
+            f"Relevance: {r.get('relevance_score', 0):.1f}/10\n"
+            f"Summary: {r.get('summary', 'N/A')}"
+            for r in results
+        ])
     
     return [TextContent(
         type="text",
-        text=f"Canon Search Results ({len(results)}):\n\n{results_text}"
+        text=f"Canon Search Results ({len(results)}):\n\n{results_text}{timings_text}"
     )]
 
-async def handle_canon_store(args: dict) -> list[TextContent]:
+def handle_canon_store(args: dict) -> list[TextContent]:
     """Store artifact in Canon"""
     wos = get_wos()
     
@@ -482,7 +730,43 @@ async def handle_canon_store(args: dict) -> list[TextContent]:
             text=f"❌ Failed to store artifact '{artifact_id}'"
         )]
 
-async def handle_register_intent(args: dict) -> list[TextContent]:
+def handle_canon_list(args: dict) -> list[TextContent]:
+    """List Canon artifacts, one cursor page at a time"""
+    wos = get_wos()
+    
+    limit = max(1, min(int(args.get("limit", 20)), 100))
+    
+    page = wos.canon_tools.list_page(
+        artifact_type=args.get("artifact_type"),
+        category=args.get("category"),
+        limit=limit,
+        cursor=args.get("cursor")
+    )
+    artifacts = page["artifacts"]
+    
+    if not artifacts:
+        return [TextContent(
+            type="text",
+            text="No artifacts found."
+        )]
+    
+    artifact_list = "\n".join([
+        f"- **{a['title']}** (ID: {a['artifact_id']}) | "
+        f"Type: {a['type']} | Category: {a.get('category') or 'N/A'} | {a['created_at']}"
+        for a in artifacts
+    ])
+    
+    if page["next_cursor"]:
+        footer = f"\n\nMore artifacts available. next_cursor: {page['next_cursor']}"
+    else:
+        footer = "\n\nEnd of list."
+    
+    return [TextContent(
+        type="text",
+        text=f"Canon Artifacts ({len(artifacts)}):\n\n{artifact_list}{footer}"
+    )]
+
+def handle_register_intent(args: dict) -> list[TextContent]:
     """Register new intent (Founder authority)"""
     wos = get_wos()
 
@@ -541,11 +825,21 @@ if __name__ == "__main__":
         logger.info("WOS MCP SERVER STARTING")
         logger.info("="*60 + "\n")
         
-        async with stdio_server() as (read_stream, write_stream):
-            await app.run(
-                read_stream,
-                write_stream,
-                app.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await app.run(
+                    read_stream,
+                    write_stream,
+                    app.create_initialization_options()
+                )
+        finally:
+            if wos_components is not None:
+                await wos_components.brain.jobs.shutdown()
+                await wos_components.n8n_executor.aclose()
+                await wos_components.approval_gate.aclose()
+                shutdown_handlers()
+                wos_components.canon_tools.close()
+            _tool_executor.shutdown(wait=False, cancel_futures=True)
+            shutdown_handler_executor()
     
     asyncio.run(main())
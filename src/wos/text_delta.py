@@ -0,0 +1,42 @@
+"""
+WOS Text Delta v0
+Line-based deltas between artifact versions (Canon version chains)
+"""
+
+import json
+from difflib import SequenceMatcher
+from typing import List, Union
+
+# A delta is a JSON list of ops rebuilding the new text from the old one:
+#   [start, count]  copy `count` lines of the old text from line `start`
+#   "text"          insert literal text
+Delta = List[Union[List[int], str]]
+
+
+def make_delta(old: str, new: str) -> str:
+    """Serialized delta turning `old` into `new`"""
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+
+    ops: Delta = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old_lines, new_lines).get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2 - i1])
+        elif tag in ("replace", "insert"):
+            ops.append("".join(new_lines[j1:j2]))
+        # "delete": nothing to copy or insert
+
+    return json.dumps(ops, ensure_ascii=False, separators=(",", ":"))
+
+
+def apply_delta(old: str, delta: str) -> str:
+    """Rebuild the new text from `old` and a make_delta() result"""
+    old_lines = old.splitlines(keepends=True)
+    parts = []
+    for op in json.loads(delta):
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            start, count = op
+            parts.extend(old_lines[start:start + count])
+    return "".join(parts)
@@ -0,0 +1,152 @@
+"""
+WOS Vector Cache v0
+Resident, pre-normalized embedding matrix for Canon semantic search
+Replaces per-query SQLite scans + Python-level cosine loops
+"""
+
+import logging
+import numpy as np
+from typing import List, Dict, Optional, Tuple
+
+logger = logging.getLogger("wos.vector_cache")
+
+class VectorCache:
+    """
+    In-memory vector matrix
+
+    Holds every artifact embedding as a unit-length float32 row so cosine
+    similarity is a single matrix-vector product. Rows are addressed by
+    artifact_id; storage grows geometrically so appends are amortized O(d).
+    """
+
+    def __init__(self, dimension: int, initial_capacity: int = 256):
+        self.dimension = dimension
+        self._matrix = np.zeros((initial_capacity, dimension), dtype=np.float32)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, artifact_id: str) -> bool:
+        return artifact_id in self._rows
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Live (n, d) view of normalized vectors"""
+        return self._matrix[:len(self._ids)]
+
+    @property
+    def ids(self) -> List[str]:
+        """Artifact IDs in row order"""
+        return self._ids
+
+    @property
+    def nbytes(self) -> int:
+        """Resident bytes used by vector rows"""
+        return self.matrix.nbytes
+
+    def row_of(self, artifact_id: str) -> Optional[int]:
+        """Row index for an artifact (or None)"""
+        return self._rows.get(artifact_id)
+
+    def put(self, artifact_id: str, vector) -> bool:
+        """
+        Insert or replace an artifact vector
+
+        Returns: False if the vector has the wrong dimension or zero norm
+        """
+        normalized = self.normalize(vector)
+        if normalized is None or normalized.shape[0] != self.dimension:
+            logger.warning(f"Skipping vector for {artifact_id}: bad shape or zero norm")
+            return False
+
+        row = self._rows.get(artifact_id)
+        if row is None:
+            row = len(self._ids)
+            if row == self._matrix.shape[0]:
+                grown = np.zeros((max(1, row) * 2, self.dimension), dtype=np.float32)
+                grown[:row] = self._matrix[:row]
+                self._matrix = grown
+            self._ids.append(artifact_id)
+            self._rows[artifact_id] = row
+
+        self._matrix[row] = normalized
+        return True
+
+    def load(self, items) -> int:
+        """Bulk-load (artifact_id, vector) pairs, returns rows loaded"""
+        loaded = 0
+        for artifact_id, vector in items:
+            if self.put(artifact_id, vector):
+                loaded += 1
+        return loaded
+
+    def top_k(self, query_vector, limit: int, min_similarity: float = None,
+              rows: np.ndarray = None, prefilter: bool = False) -> List[Tuple[str, float]]:
+        """
+        Cosine top-k over the cache
+
+        Args:
+            query_vector: Raw query embedding (normalized here)
+            limit: Max results
+            min_similarity: Drop rows scoring below this (applied as a mask)
+            rows: Optional boolean mask / index array restricting candidates
+            prefilter: Score only `rows` (gather) instead of scanning every
+                row and masking - cheaper for small partitions
+
+        Returns: [(artifact_id, similarity)] sorted by similarity desc
+        """
+        query = self.normalize(query_vector)
+        if query is None or not self._ids or limit <= 0:
+            return []
+
+        if rows is not None and prefilter:
+            return self._top_k_rows(query, limit, min_similarity, rows)
+
+        scores = self.matrix @ query
+
+        mask = np.ones(scores.shape[0], dtype=bool)
+        if rows is not None:
+            mask = np.zeros(scores.shape[0], dtype=bool)
+            mask[rows] = True
+        if min_similarity is not None:
+            mask &= scores >= min_similarity
+
+        candidates = np.flatnonzero(mask)
+        if candidates.size > limit:
+            part = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[part]
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return [(self._ids[i], float(scores[i])) for i in ordered]
+
+    def _top_k_rows(self, query: np.ndarray, limit: int, min_similarity: float,
+                    rows: np.ndarray) -> List[Tuple[str, float]]:
+        """top_k over a row subset only (pre-filtered search)"""
+        candidates = np.asarray(rows)
+        if candidates.dtype == bool:
+            candidates = np.flatnonzero(candidates)
+        if candidates.size == 0:
+            return []
+
+        scores = self.matrix[candidates] @ query
+        if min_similarity is not None:
+            keep = scores >= min_similarity
+            candidates, scores = candidates[keep], scores[keep]
+
+        if candidates.size > limit:
+            part = np.argpartition(-scores, limit - 1)[:limit]
+            candidates, scores = candidates[part], scores[part]
+        order = np.argsort(-scores, kind="stable")
+
+        return [(self._ids[candidates[i]], float(scores[i])) for i in order]
+
+    @staticmethod
+    def normalize(vector) -> Optional[np.ndarray]:
+        """Return a unit-length float32 copy (None for zero vectors)"""
+        array = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(array)
+        if not norm:
+            return None
+        return array / norm
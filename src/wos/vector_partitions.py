@@ -0,0 +1,92 @@
+"""
+WOS Vector Partitions v0
+Row lists per artifact type / category for filter-aware vector search
+Lets selective filters score only the matching rows of the VectorCache
+"""
+
+import logging
+import numpy as np
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger("wos.vector_partitions")
+
+# Filters matching at most this share of rows are pre-filtered (score only
+# the partition); broader filters scan everything and mask afterwards
+PREFILTER_MAX_SELECTIVITY = 0.25
+
+
+class PartitionIndex:
+    """
+    Metadata partitions over cache rows
+
+    For every field ("type", "category") keeps value -> set of cache rows,
+    so a filtered query resolves its candidate rows without touching
+    SQLite. Rows are cache row indexes, like VectorIndex bucket lists.
+    """
+
+    def __init__(self, fields: Tuple[str, ...] = ("type", "category")):
+        self.fields = fields
+        self._members: Dict[str, Dict[Any, set]] = {field: {} for field in fields}
+        self._values: Dict[int, Dict[str, Any]] = {}
+        self._arrays: Dict[Tuple[str, Any], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def assign(self, row: int, **values):
+        """Set (or move) a row's partition values"""
+        previous = self._values.get(row, {})
+        for field in self.fields:
+            old, new = previous.get(field), values.get(field)
+            if row in self._values and old == new:
+                continue
+            if row in self._values:
+                self._members[field].get(old, set()).discard(row)
+                self._arrays.pop((field, old), None)
+            self._members[field].setdefault(new, set()).add(row)
+            self._arrays.pop((field, new), None)
+        self._values[row] = {field: values.get(field) for field in self.fields}
+
+    def rows(self, **filters) -> Optional[np.ndarray]:
+        """
+        Sorted rows matching every given filter (None values are ignored)
+
+        Returns: None when no filter applies (= all rows)
+        """
+        active = [(field, value) for field, value in filters.items() if value is not None]
+        if not active:
+            return None
+
+        # Intersect smallest partition first
+        arrays = sorted((self._array(field, value) for field, value in active), key=len)
+        result = arrays[0]
+        for array in arrays[1:]:
+            result = np.intersect1d(result, array, assume_unique=True)
+        return result
+
+    def _array(self, field: str, value) -> np.ndarray:
+        array = self._arrays.get((field, value))
+        if array is None:
+            array = np.array(sorted(self._members[field].get(value, ())), dtype=np.int64)
+            self._arrays[(field, value)] = array
+        return array
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            field: {str(value): len(rows) for value, rows in members.items() if rows}
+            for field, members in self._members.items()
+        }
+
+
+def plan_filtered_search(matching_rows: int, total_rows: int,
+                         max_selectivity: float = PREFILTER_MAX_SELECTIVITY) -> str:
+    """
+    Choose how to apply a metadata filter to a vector search
+
+    "prefilter":  score only the partition rows (exact, cost ~ partition size)
+    "postfilter": run the normal (exact or ANN) search and mask non-matching
+                  rows; cheaper once the filter keeps most rows
+    """
+    if total_rows and matching_rows / total_rows <= max_selectivity:
+        return "prefilter"
+    return "postfilter"
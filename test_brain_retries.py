@@ -0,0 +1,207 @@
+"""
+Brain retry policy: timeout_seconds / max_retries from the intent record,
+TIMEOUT retried only for handlers with retry_on_timeout, "retryable"
+results overriding RETRYABLE_ERROR_CODES
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos import cancellation
+from wos.brain import Brain
+from wos.intent_registry import IntentRegistry
+
+INTENT = "retry_probe"
+
+
+class ScriptedHandler:
+    """Returns the scripted results in turn (the last one repeats)"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _count(self) -> int:
+        with self._lock:
+            self.calls += 1
+            return self.calls
+
+    def _next(self):
+        calls = self._count()
+        return dict(self.results[min(calls, len(self.results)) - 1])
+
+    def execute(self, request_id, execution_id, intent_input, intent_record):
+        return self._next()
+
+
+class CooperativeSlowHandler(ScriptedHandler):
+    """Waits past the deadline but stops as soon as it is cancelled"""
+
+    def execute(self, request_id, execution_id, intent_input, intent_record):
+        self._count()
+        cancellation.sleep(5)
+        return {"status": "success", "result": {}}
+
+
+class BlockingSlowHandler(ScriptedHandler):
+    """Ignores cancellation: still running when the retry would start"""
+
+    def execute(self, request_id, execution_id, intent_input, intent_record):
+        self._count()
+        time.sleep(1)
+        return {"status": "success", "result": {}}
+
+
+class AsyncSlowHandler(ScriptedHandler):
+    async def execute_async(self, request_id, execution_id, intent_input, intent_record):
+        self._count()
+        await asyncio.sleep(5)
+        return {"status": "success", "result": {}}
+
+
+def _failure(error_code, **extra):
+    return dict({"status": "failed", "result": None, "error": error_code,
+                 "error_code": error_code}, **extra)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = IntentRegistry(str(tmp_path / "registry.db"))
+    registry.register_intent(f"{INTENT}_v0", INTENT, "0", "Retry policy probe",
+                             "tests.retry_probe")
+    yield registry
+    registry.close()
+
+
+def _brain(registry, handler, timeout_seconds=5, max_retries=2):
+    with registry.db.transaction() as conn:
+        conn.execute("UPDATE intents SET timeout_seconds = ?, max_retries = ? WHERE name = ?",
+                     (timeout_seconds, max_retries, INTENT))
+    released = []
+    brain = Brain(registry, approval_gate=None, canon_tools=None, n8n_executor=None,
+                  handler_factory=lambda intent_id, **deps: handler,
+                  handler_release=lambda intent_id, h: released.append(h),
+                  retry_base_delay=0.01, max_retry_delay=0.05)
+    brain.released = released
+    return brain
+
+
+def _request():
+    return {"request_id": "req-retry", "intent": INTENT, "background": False}
+
+
+def test_retryable_code_uses_every_retry(registry):
+    handler = ScriptedHandler(_failure("UPSTREAM_UNAVAILABLE"))
+    brain = _brain(registry, handler, max_retries=2)
+
+    response = brain.process_request(_request())
+
+    assert not response["ok"]
+    assert handler.calls == 3
+    assert brain.released == [handler]
+
+
+def test_retry_stops_at_first_success(registry):
+    handler = ScriptedHandler(_failure("UPSTREAM_UNAVAILABLE"),
+                              {"status": "success", "result": {"sent": 1}})
+    brain = _brain(registry, handler, max_retries=3)
+
+    response = brain.process_request(_request())
+
+    assert response["ok"]
+    assert handler.calls == 2
+
+
+def test_no_retries_configured(registry):
+    handler = ScriptedHandler(_failure("UPSTREAM_UNAVAILABLE"))
+    brain = _brain(registry, handler, max_retries=0)
+
+    brain.process_request(_request())
+
+    assert handler.calls == 1
+
+
+@pytest.mark.parametrize("result, calls", [
+    (_failure("UPSTREAM_UNAVAILABLE", retryable=False), 1),
+    (_failure("N8N_ERROR", retryable=True), 3),
+    (_failure("N8N_ERROR"), 1),
+    (_failure("HANDLER_EXCEPTION"), 1),
+])
+def test_retryable_flag_overrides_error_code(registry, result, calls):
+    handler = ScriptedHandler(result)
+    brain = _brain(registry, handler, max_retries=2)
+
+    brain.process_request(_request())
+
+    assert handler.calls == calls
+
+
+def test_timeout_not_retried_by_default(registry):
+    handler = CooperativeSlowHandler()
+    brain = _brain(registry, handler, timeout_seconds=0.1, max_retries=2)
+
+    response = brain.process_request(_request())
+
+    assert response["errors"][0]["code"] == "TIMEOUT"
+    assert handler.calls == 1
+
+
+def test_timeout_retried_with_retry_on_timeout(registry):
+    handler = CooperativeSlowHandler()
+    handler.retry_on_timeout = True
+    brain = _brain(registry, handler, timeout_seconds=0.1, max_retries=2)
+
+    response = brain.process_request(_request())
+
+    assert response["errors"][0]["code"] == "TIMEOUT"
+    assert handler.calls == 3
+
+
+def test_timeout_never_overlaps_a_running_attempt(registry):
+    handler = BlockingSlowHandler()
+    handler.retry_on_timeout = True
+    brain = _brain(registry, handler, timeout_seconds=0.1, max_retries=2)
+
+    brain.process_request(_request())
+
+    assert handler.calls == 1
+
+
+def test_handler_timeout_error_is_not_a_deadline(registry):
+    handler = ScriptedHandler()
+    handler.retry_on_timeout = True
+
+    def execute(**kwargs):
+        handler.calls += 1
+        raise TimeoutError("SMTP read timed out")
+
+    handler.execute = execute
+    brain = _brain(registry, handler, max_retries=2)
+
+    response = brain.process_request(_request())
+
+    assert response["errors"][0]["code"] == "HANDLER_EXCEPTION"
+    assert handler.calls == 1
+
+
+def test_async_timeout_policy(registry):
+    default = AsyncSlowHandler()
+    opted_in = AsyncSlowHandler()
+    opted_in.retry_on_timeout = True
+
+    for handler, calls in ((default, 1), (opted_in, 3)):
+        brain = _brain(registry, handler, timeout_seconds=0.1, max_retries=2)
+        response = asyncio.run(brain.process_request_async(_request()))
+
+        assert response["errors"][0]["code"] == "TIMEOUT"
+        assert handler.calls == calls
+        assert brain.released == [handler]
@@ -0,0 +1,118 @@
+"""
+Canon IVF index: a Canon reopened with enough stored vectors must search
+the trained index (probing buckets), not fall back to an exact scan
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_embeddings import CanonEmbeddings
+from wos.canon_index import CanonIndex
+
+ANN_OPTIONS = {"min_train_size": 50, "nprobe": 2}
+TOPICS = ["pricing", "onboarding", "churn", "referrals", "hiring", "brand voice",
+          "newsletter", "partnerships", "fundraising", "retention"]
+
+
+def _text(n: int) -> str:
+    return f"{TOPICS[n % len(TOPICS)]} note {n}: {TOPICS[(n * 7) % len(TOPICS)]} follow-up {n % 3}"
+
+
+def _open(db_path):
+    return CanonEmbeddings(str(db_path), provider="local", ann_index="ivf",
+                           ann_options=ANN_OPTIONS, persist_query_cache=False)
+
+
+def _populate(db_path, start: int, count: int):
+    """Store artifacts and their embeddings without loading the vector cache"""
+    canon = CanonIndex(str(db_path), async_retrieval_log=False)
+    embeddings = _open(db_path)
+    try:
+        ids = [f"doc_{n:03d}" for n in range(start, start + count)]
+        texts = [_text(n) for n in range(start, start + count)]
+        canon.store_many({"artifact_id": artifact_id, "title": artifact_id, "content": text}
+                         for artifact_id, text in zip(ids, texts))
+        for artifact_id, vector in zip(ids, embeddings.provider.embed(texts)):
+            assert embeddings.store_embedding(artifact_id, vector)
+    finally:
+        embeddings.close()
+        canon.close()
+
+
+def _assert_probes_lists(embeddings, n: int):
+    query = embeddings.provider.embed([_text(n)])[0]
+    results = embeddings.search_by_vector(query, limit=5, min_similarity=0.0,
+                                          approximate=True)
+    ann = embeddings.get_ann_index()
+
+    assert ann.is_trained
+    assert ann.trained_size == len(embeddings.get_vector_cache())
+    # Only the probed buckets were materialized for scoring
+    assert 0 < len(ann._list_arrays) <= ANN_OPTIONS["nprobe"] < len(ann._lists)
+    assert results[0]["artifact_id"] == f"doc_{n:03d}"
+
+
+def test_reopened_canon_trains_ivf_index(tmp_path):
+    db_path = tmp_path / "canon.db"
+    _populate(db_path, 0, 60)
+    assert not os.path.exists(f"{db_path}.ivf.npz")
+
+    embeddings = _open(db_path)
+    try:
+        _assert_probes_lists(embeddings, 7)
+    finally:
+        embeddings.close()
+    assert os.path.exists(f"{db_path}.ivf.npz")
+
+
+def test_stale_saved_index_is_retrained(tmp_path):
+    db_path = tmp_path / "canon.db"
+    _populate(db_path, 0, 50)
+    embeddings = _open(db_path)
+    try:
+        assert embeddings.get_ann_index().trained_size == 50
+    finally:
+        embeddings.close()
+
+    # Written while no cache was loaded: the saved index is 5x outgrown
+    _populate(db_path, 50, 200)
+
+    embeddings = _open(db_path)
+    try:
+        _assert_probes_lists(embeddings, 123)
+        assert embeddings.get_ann_index().trained_size == 250
+    finally:
+        embeddings.close()
+
+
+def test_small_canon_stays_exact(tmp_path):
+    db_path = tmp_path / "canon.db"
+    _populate(db_path, 0, 20)
+
+    embeddings = _open(db_path)
+    try:
+        query = embeddings.provider.embed([_text(3)])[0]
+        results = embeddings.search_by_vector(query, limit=3, min_similarity=0.0,
+                                              approximate=True)
+
+        assert not embeddings.get_ann_index().is_trained
+        assert results[0]["artifact_id"] == "doc_003"
+    finally:
+        embeddings.close()
+
+
+@pytest.mark.parametrize("n", [0, 33, 59])
+def test_trained_index_finds_stored_vector(tmp_path, n):
+    db_path = tmp_path / "canon.db"
+    _populate(db_path, 0, 60)
+
+    embeddings = _open(db_path)
+    try:
+        _assert_probes_lists(embeddings, n)
+    finally:
+        embeddings.close()
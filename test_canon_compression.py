@@ -0,0 +1,105 @@
+"""
+Canon content compression: compressed and plain rows must read back and
+stay searchable side by side (FTS indexes the plain text)
+"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_index import CanonIndex
+
+
+def _body(term: str) -> str:
+    """Long, repetitive content (compresses well) containing one rare term"""
+    filler = "Weekly growth review covers signups, churn and activation. " * 20
+    return f"{filler}\nKey finding: {term} drives retention.\n{filler}"
+
+
+def _open(db_path, compression=None):
+    return CanonIndex(str(db_path), async_retrieval_log=False, compression=compression)
+
+
+def _encodings(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return dict(conn.execute("SELECT artifact_id, content_encoding FROM artifacts"))
+    finally:
+        conn.close()
+
+
+def _found(canon, query):
+    return {result["artifact_id"] for result in canon.search_artifacts(query)}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "canon.db"
+    canon = _open(path)
+    canon.store_artifact("doc_plain", "Plain review", _body("onboarding"))
+    canon.close()
+
+    canon = _open(path, compression="zlib")
+    canon.store_artifact("doc_packed", "Packed review", _body("referrals"))
+    canon.close()
+    return path
+
+
+def test_plain_and_compressed_rows_are_searchable(db_path):
+    assert _encodings(db_path) == {"doc_plain": None, "doc_packed": "zlib"}
+
+    canon = _open(db_path)
+    try:
+        assert _found(canon, "onboarding") == {"doc_plain"}
+        assert _found(canon, "referrals") == {"doc_packed"}
+        assert _found(canon, "churn") == {"doc_plain", "doc_packed"}
+        assert canon.get_artifact("doc_packed", log_retrieval=False)["content"] == _body("referrals")
+    finally:
+        canon.close()
+
+
+def test_rewriting_compressed_content_reindexes_it(db_path):
+    canon = _open(db_path, compression="zlib")
+    try:
+        canon.store_artifact("doc_packed", "Packed review", _body("partnerships"))
+
+        assert _found(canon, "referrals") == set()
+        assert _found(canon, "partnerships") == {"doc_packed"}
+    finally:
+        canon.close()
+
+
+def test_compress_artifacts_keeps_search_results(db_path):
+    canon = _open(db_path)
+    try:
+        before = {query: _found(canon, query) for query in ("onboarding", "referrals", "churn")}
+        stats = canon.compress_artifacts("zlib", train_dictionary=False)
+
+        assert stats["compressed"] == 1
+        assert all(_encodings(db_path).values())
+        assert {query: _found(canon, query) for query in before} == before
+    finally:
+        canon.close()
+
+
+def test_other_sqlite_clients_can_write_artifacts(db_path):
+    # No wos_decompress() on this connection: writes must not depend on it
+    conn = sqlite3.connect(str(db_path))
+    with conn:
+        conn.execute("INSERT INTO artifacts (artifact_id, title, type, content) "
+                     "VALUES ('doc_external', 'External', 'note', 'Written by hand: pricing')")
+        conn.execute("UPDATE artifacts SET title = 'Packed review (edited)' "
+                     "WHERE artifact_id = 'doc_packed'")
+    conn.close()
+
+    canon = _open(db_path)
+    try:
+        assert _found(canon, "pricing") == {"doc_external"}
+        assert _found(canon, "referrals") == {"doc_packed"}
+    finally:
+        canon.close()
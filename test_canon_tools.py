@@ -0,0 +1,87 @@
+"""
+CanonTools hybrid search and lifecycle: RRF relevance when a retriever
+returns nothing, and close() releasing the CanonIndex the factory created
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_tools import create_canon_tools, reciprocal_rank_fusion
+
+DOCS = {
+    "doc_pricing": ("Pricing decision", "We keep annual pricing simple: one plan, one price."),
+    "doc_churn": ("Churn review", "Churn dropped after onboarding emails; pricing unchanged."),
+    "doc_voice": ("Brand voice", "Direct, warm, no jargon.")
+}
+
+
+@pytest.fixture
+def tools(tmp_path):
+    tools = create_canon_tools(str(tmp_path / "canon.db"), embedding_provider="local",
+                               search_mode="hybrid")
+    for artifact_id, (title, content) in DOCS.items():
+        assert tools.store(artifact_id, title, content)
+    yield tools
+    tools.close()
+
+
+def _hits(artifact_ids):
+    return [{"artifact_id": artifact_id} for artifact_id in artifact_ids]
+
+
+def test_rrf_relevance_ignores_empty_retrievers():
+    results = reciprocal_rank_fusion({"lexical": _hits(["a", "b"]), "semantic": []})
+
+    assert [r["relevance_score"] for r in results] == [10.0, round(10.0 * 61 / 62, 2)]
+
+
+def test_rrf_relevance_with_both_retrievers():
+    results = reciprocal_rank_fusion({"lexical": _hits(["a", "b"]),
+                                      "semantic": _hits(["b", "a"])})
+    fused = {r["artifact_id"]: r for r in results}
+
+    assert fused["a"]["relevance_score"] == fused["b"]["relevance_score"] < 10.0
+    assert reciprocal_rank_fusion({"lexical": _hits(["a"]),
+                                   "semantic": _hits(["a"])})[0]["relevance_score"] == 10.0
+    assert reciprocal_rank_fusion({"lexical": [], "semantic": []}) == []
+
+
+def test_semantic_timeout_keeps_lexical_relevance(tools):
+    def slow_embedding(query):
+        time.sleep(0.5)
+        return None
+
+    tools.embeddings.generate_embedding = slow_embedding
+    response = tools.hybrid_search("pricing", limit=5, semantic_timeout=0.05)
+
+    assert response["semantic_status"] == "timeout"
+    assert response["retrievers"]["semantic"] == 0
+    assert response["results"][0]["relevance_score"] == 10.0
+    assert {r["artifact_id"] for r in response["results"]} == {"doc_pricing", "doc_churn"}
+
+
+def test_close_releases_factory_canon_index(tmp_path):
+    db_path = tmp_path / "canon.db"
+    tools = create_canon_tools(str(db_path), use_semantic_search=False)
+    tools.store("doc_voice", *DOCS["doc_voice"])
+    tools.get("doc_voice", request_id="req-close")
+
+    canon = tools.canon
+    tools.close()
+
+    assert canon.db is None
+    assert canon.retrieval_log is None
+    conn = sqlite3.connect(str(db_path))
+    try:
+        logged = conn.execute("SELECT COUNT(*) FROM retrieval_log WHERE request_id = ?",
+                              ("req-close",)).fetchone()[0]
+    finally:
+        conn.close()
+    assert logged == 1
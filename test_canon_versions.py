@@ -0,0 +1,84 @@
+"""
+Canon artifact versions: replaying snapshot + delta chains must give back
+exactly the content that was stored at each version
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_index import CanonIndex, SNAPSHOT_INTERVAL
+
+
+def _revision(n: int) -> str:
+    """Content of the n-th rewrite: edits at the start, middle and end"""
+    lines = [f"Line {i}: the brand voice is direct and warm." for i in range(40)]
+    lines[0] = f"Revision {n} opening."
+    lines[n % 40] = f"Edited in revision {n}."
+    if n % 3 == 0:
+        del lines[20:23]
+    lines.append(f"Footer {n}" * (n % 5))
+    return "\n".join(lines)
+
+
+@pytest.fixture(params=[None, "zlib"], ids=["plain", "zlib"])
+def canon(request, tmp_path):
+    index = CanonIndex(str(tmp_path / "canon.db"), async_retrieval_log=False,
+                       compression=request.param)
+    yield index
+    index.close()
+
+
+def test_every_version_replays_to_stored_content(canon):
+    revisions = 2 * SNAPSHOT_INTERVAL + 5
+    stored = {}
+    for n in range(1, revisions + 1):
+        content = _revision(n)
+        assert canon.store_artifact("doc_voice", f"Voice v{n}", content)
+        stored[canon.get_artifact("doc_voice", log_retrieval=False)["version"]] = content
+
+    assert len(stored) == revisions
+    versions = canon.list_versions("doc_voice")
+    assert any(entry["snapshot"] for entry in versions[:-1])
+
+    for version, content in stored.items():
+        artifact = canon.get_artifact_version("doc_voice", version=version)
+        assert artifact is not None, version
+        assert artifact["version"] == version
+        assert artifact["content"] == content
+
+    latest = canon.get_artifact_version("doc_voice")
+    assert latest["content"] == _revision(revisions)
+
+
+def test_identical_rewrite_adds_no_version(canon):
+    canon.store_artifact("doc_same", "Same", "Unchanged body")
+    before = canon.get_artifact("doc_same", log_retrieval=False)["version"]
+    canon.store_artifact("doc_same", "Same", "Unchanged body")
+
+    assert canon.get_artifact("doc_same", log_retrieval=False)["version"] == before
+    assert len(canon.list_versions("doc_same")) <= 1
+
+
+def test_as_of_compares_times_across_formats(canon):
+    for n in range(1, 4):
+        canon.store_artifact("doc_timed", "Timed", f"Body {n}")
+    versions = sorted(entry["version"] for entry in canon.list_versions("doc_timed"))
+    written = ["2026-01-01T09:00:00", "2026-01-01 10:00:00", "2026-01-01T11:00:00Z"]
+
+    with canon.db.transaction() as conn:
+        for version, created_at in zip(versions[-3:], written):
+            conn.execute("UPDATE artifact_versions SET created_at = ? "
+                         "WHERE artifact_id = ? AND version = ?",
+                         (created_at, "doc_timed", version))
+
+    first, second, third = versions[-3:]
+    assert canon.get_artifact_version("doc_timed", as_of="2026-01-01 09:30:00")["version"] == first
+    assert canon.get_artifact_version("doc_timed", as_of="2026-01-01T10:00:00")["version"] == second
+    assert canon.get_artifact_version("doc_timed", as_of="2026-01-01T13:00:00+02:00")["version"] == third
+    assert canon.get_artifact_version("doc_timed", as_of="2025-12-31T23:59:59") is None
+    assert canon.get_artifact_version("doc_timed", as_of="not a time") is None
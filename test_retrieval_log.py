@@ -0,0 +1,41 @@
+"""
+Retrieval audit log: the batched writer and the inline insert must store
+retrieved_at in the same (CURRENT_TIMESTAMP) format
+"""
+
+import os
+import re
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from wos.canon_index import CanonIndex
+
+CURRENT_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")
+
+
+def _retrieved_at(canon, request_id):
+    with canon.db.reader() as conn:
+        return conn.execute("SELECT retrieved_at, datetime('now') FROM retrieval_log "
+                            "WHERE request_id = ?", (request_id,)).fetchone()
+
+
+def test_both_writers_use_current_timestamp_format(tmp_path):
+    db_path = str(tmp_path / "canon.db")
+    batched = CanonIndex(db_path, async_retrieval_log=True)
+    inline = CanonIndex(db_path, async_retrieval_log=False)
+    try:
+        batched.store_artifact("doc_voice", "Brand voice", "Direct, warm, no jargon.")
+        batched.get_artifact("doc_voice", request_id="req-batched")
+        inline.get_artifact("doc_voice", request_id="req-inline")
+        batched.retrieval_log.flush(timeout=5)
+
+        for request_id in ("req-batched", "req-inline"):
+            retrieved_at, now = _retrieved_at(inline, request_id)
+            assert CURRENT_TIMESTAMP.match(retrieved_at), retrieved_at
+            # UTC, like the column default
+            assert retrieved_at <= now
+    finally:
+        inline.close()
+        batched.close()